@@ -7,14 +7,13 @@ from src.utils.config import Config
 from src.core.wallet_utils import WalletUtils
 from src.ui.menus import RegistrationMenu, WalletCreationMenu, StatsMenu, BalanceMenu, TransferMenu, AutoBuyerMenu
 from src.ui.subnet_scanner_menu import SubnetScannerMenu
-from rich.console import Console
+from src.utils.console import console
 from rich.prompt import IntPrompt, Prompt
 from rich.panel import Panel
 import signal
 import sys
 import asyncio
 
-console = Console()
 
 def signal_handler(sig, frame):
     console.print("\n[yellow]Exiting gracefully...[/yellow]")
@@ -27,7 +26,7 @@ class BitensorManager:
         self.stats_manager = StatsManager(self.config)
         self.registration_manager = RegistrationManager(self.config)
         self.wallet_utils = WalletUtils()
-        self.transfer_manager = TransferManager(self.config)
+        self.transfer_manager = TransferManager(self.config, self.stats_manager)
         self.subnet_scanner = SubnetScanner(self.config)
 
     def register_menu(self):
@@ -1,16 +1,19 @@
 import bittensor as bt
 import asyncio
+import os
 import threading
 import time
 import re
 import subprocess
 from typing import Dict, List, Optional, Any
-from rich.console import Console
+from ..utils.console import console
 from rich.prompt import Confirm
 from ..utils.logger import setup_logger
+from ..core.wallet_utils import WalletUtils
 
 logger = setup_logger('auto_buyer', 'logs/auto_buyer.log')
-console = Console()
+
+_BALANCE_CHANGE_RE = re.compile(r'Balance:\s{2,}(\d+\.\d+)\s{3,}(\d+\.\d+)')
 
 class TokenBuyerThread(threading.Thread):
     def __init__(self, auto_buyer, coldkey, hotkey, subnet_id, amount, password, tolerance, rpc_endpoint=None):
@@ -49,15 +52,26 @@ class TokenBuyerThread(threading.Thread):
             self.result = False
 
 class AutoBuyerManager:
-    def __init__(self, config):
+    def __init__(self, config, subtensor=None):
         self.config = config
-        self.subtensor = bt.subtensor()
+        self.subtensor = subtensor if subtensor is not None else bt.subtensor()
+        self.rpc_endpoint = None
         self.monitoring = False
+        self._verified_passwords: Dict[str, str] = {}
         
+    def get_verified_password(self, coldkey: str) -> Optional[str]:
+        return self._verified_passwords.get(coldkey)
+
+    def forget_passwords(self):
+        self._verified_passwords.clear()
+
     def verify_wallet_password(self, coldkey: str, password: str) -> bool:
+        if self._verified_passwords.get(coldkey) == password:
+            return True
         try:
             wallet = bt.wallet(name=coldkey)
             wallet.coldkey_file.decrypt(password)
+            self._verified_passwords[coldkey] = password
             return True
         except Exception as e:
             logger.error(f"Failed to verify password for wallet {coldkey}: {e}")
@@ -76,12 +90,14 @@ class AutoBuyerManager:
                         self.subtensor = bt.subtensor(network=modified_endpoint)
 
                     current_block = self.subtensor.get_current_block()
+                    self.rpc_endpoint = rpc_endpoint
                     console.print(f"[green]Connected to custom RPC: {rpc_endpoint} (Block: {current_block})[/green]")
                     return True
                 except Exception as e:
                     console.print(f"[red]Failed to connect to {rpc_endpoint}: {e}[/red]")
                     try:
                         self.subtensor = bt.subtensor()
+                        self.rpc_endpoint = None
                         console.print("[yellow]Falling back to default endpoint[/yellow]")
                         return True
                     except Exception as e2:
@@ -89,6 +105,7 @@ class AutoBuyerManager:
                         return False
             else:
                 self.subtensor = bt.subtensor()
+                self.rpc_endpoint = None
                 console.print("[green]Connected to default endpoint[/green]")
                 return True
         except Exception as e:
@@ -134,7 +151,8 @@ class AutoBuyerManager:
             initial_balance = 0
             try:
                 original_subtensor = None
-                if rpc_endpoint:
+                original_endpoint = self.rpc_endpoint
+                if rpc_endpoint and rpc_endpoint != self.rpc_endpoint:
                     original_subtensor = self.subtensor
                     if not self._set_subtensor_network(rpc_endpoint):
                         console.print(f"[yellow]Failed to set custom RPC endpoint. Using default for balance check.[/yellow]")
@@ -149,19 +167,19 @@ class AutoBuyerManager:
                 if initial_balance < required_amount:
                     console.print(f"[red]Insufficient balance! Required {required_amount:.6f} TAO (with fee), available {initial_balance:.6f} TAO[/red]")
                     if original_subtensor:
-                        self.subtensor = original_subtensor
+                        self.subtensor, self.rpc_endpoint = original_subtensor, original_endpoint
                     return False
                 
                 console.print(f"[green]Balance verified: {initial_balance:.6f} TAO[/green]")
                 
                 if original_subtensor:
-                    self.subtensor = original_subtensor
+                    self.subtensor, self.rpc_endpoint = original_subtensor, original_endpoint
             except Exception as e:
                 console.print(f"[yellow]Failed to check balance: {str(e)}[/yellow]")
                 initial_balance = 0
                 
                 if original_subtensor:
-                    self.subtensor = original_subtensor
+                    self.subtensor, self.rpc_endpoint = original_subtensor, original_endpoint
             
             cmd = [
                 "btcli", "stake", "add",
@@ -194,7 +212,6 @@ class AutoBuyerManager:
             
             console.print("[yellow]Buying tokens...[/yellow]")
             
-            import os
             env = os.environ.copy()
             env['COLUMNS'] = '1000'
             
@@ -220,8 +237,7 @@ class AutoBuyerManager:
             
             balance_changed = False
             try:
-                balance_pattern = r"Balance:[\s\n]+?\s+(\d+\.\d+)\s+?\s+?\s+(\d+\.\d+)"
-                balance_match = re.search(balance_pattern, stdout)
+                balance_match = _BALANCE_CHANGE_RE.search(stdout)
                 if balance_match:
                     balance_before = float(balance_match.group(1))
                     balance_after = float(balance_match.group(2))
@@ -459,6 +475,23 @@ class AutoBuyerManager:
             return False
             
     async def monitor_new_subnet_and_buy(self, wallet_configs, target_id, amount, tolerance=0.45, check_interval=60, max_attempts=3, auto_increase_tolerance=True, buy_immediately=False, rpc_endpoint=None):
+        original_subtensor, original_endpoint = self.subtensor, self.rpc_endpoint
+        
+        if rpc_endpoint and rpc_endpoint != self.rpc_endpoint:
+            console.print(f"[cyan]Connecting to custom RPC endpoint: {rpc_endpoint}[/cyan]")
+            if not self._set_subtensor_network(rpc_endpoint):
+                console.print(f"[yellow]Falling back to default endpoint[/yellow]")
+                self.subtensor, self.rpc_endpoint = original_subtensor, original_endpoint
+        
+        try:
+            return await self._monitor_new_subnet_and_buy(
+                wallet_configs, target_id, amount, tolerance, check_interval, max_attempts,
+                auto_increase_tolerance, buy_immediately, rpc_endpoint
+            )
+        finally:
+            self.subtensor, self.rpc_endpoint = original_subtensor, original_endpoint
+            
+    async def _monitor_new_subnet_and_buy(self, wallet_configs, target_id, amount, tolerance, check_interval, max_attempts, auto_increase_tolerance, buy_immediately, rpc_endpoint):
         self.monitoring = True
         start_time = time.time()
         checks_count = 0
@@ -466,14 +499,6 @@ class AutoBuyerManager:
         
         attempts_info = {}
         
-        original_subtensor = self.subtensor
-        
-        if rpc_endpoint:
-            console.print(f"[cyan]Connecting to custom RPC endpoint: {rpc_endpoint}[/cyan]")
-            if not self._set_subtensor_network(rpc_endpoint):
-                console.print(f"[yellow]Falling back to default endpoint[/yellow]")
-                self.subtensor = original_subtensor
-        
         console.print(f"[bold cyan]Starting monitoring for new subnet {target_id} detection[/bold cyan]")
         console.print(f"[cyan]Checking every {check_interval} seconds...[/cyan]")
         console.print(f"[cyan]Maximum purchase attempts: {max_attempts}[/cyan]")
@@ -485,14 +510,14 @@ class AutoBuyerManager:
             console.print(f"[cyan]Will purchase tokens only when registration is closed[/cyan]")
         console.print("[yellow]Press Ctrl+C to stop monitoring[/yellow]\n")
         
-        invalid_configs = []
-        for config in wallet_configs:
-            if not self.verify_wallet_password(config['coldkey'], config['password']):
-                console.print(f"[red]Invalid password for wallet {config['coldkey']}![/red]")
-                invalid_configs.append(config)
-                
+        invalid_configs = [
+            config for config in wallet_configs
+            if not self.verify_wallet_password(config['coldkey'], config['password'])
+        ]
         for invalid in invalid_configs:
-            wallet_configs.remove(invalid)
+            console.print(f"[red]Invalid password for wallet {invalid['coldkey']}![/red]")
+        if invalid_configs:
+            wallet_configs[:] = [config for config in wallet_configs if config not in invalid_configs]
             
         if not wallet_configs:
             console.print("[red]No valid wallet configurations! Monitoring stopped.[/red]")
@@ -501,7 +526,7 @@ class AutoBuyerManager:
         
         for config in list(wallet_configs):
             try:
-                wallet = bt.wallet(name=config['coldkey'], hotkey=config['hotkey'])
+                wallet = WalletUtils.get_wallet_object(config['coldkey'], config['hotkey'])
                 console.print(f"[green]Hotkey {config['hotkey']} found for wallet {config['coldkey']}: {wallet.hotkey.ss58_address}[/green]")
                 
                 attempts_info[f"{config['coldkey']}:{config['hotkey']}"] = {
@@ -583,7 +608,7 @@ class AutoBuyerManager:
                         
                         try:
                             if metagraph:
-                                wallet = bt.wallet(name=config['coldkey'], hotkey=config['hotkey'])
+                                wallet = WalletUtils.get_wallet_object(config['coldkey'], config['hotkey'])
                                 try:
                                     uid = metagraph.hotkeys.index(wallet.hotkey.ss58_address)
                                     current_stake = float(metagraph.stake[uid])
@@ -16,13 +16,12 @@ import signal
 from rich.live import Live
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.console import Console
+from ..utils.console import console
 from typing import List, Dict, Optional, Tuple, Set
 from ..utils.logger import setup_logger
 import json
 
 logger = setup_logger('registration_manager', 'logs/registration.log')
-console = Console()
 
 class RegistrationError(Exception):
     pass
@@ -698,7 +697,6 @@ class RegistrationManager:
 
                             if "Registered on netuid" in buffer:
                                 try:
-                                    import re
                                     uid_match = re.search(r"with UID (\d+)", buffer)
                                     if uid_match:
                                         registration.uid = int(uid_match.group(1))
@@ -1519,7 +1517,6 @@ class RegistrationManager:
                         failed = 0
                         
                         if results:
-                            from rich.table import Table
                             result_table = Table(title="Registration Results")
                             result_table.add_column("Wallet")
                             result_table.add_column("Hotkey")
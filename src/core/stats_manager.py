@@ -6,16 +6,30 @@ import subprocess
 import re
 import time
 import asyncio
-from typing import Dict, List, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Union
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.console import Console
 from ..utils.logger import setup_logger
 import json
 from datetime import datetime
 import requests
 
 logger = setup_logger('stats_manager', 'logs/stats_manager.log')
-console = Console()
+
+_UNICODE_ESCAPE_RE = re.compile(r'\\u[0-9a-fA-F]{4}')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1F\x7F-\x9F]')
+_SYMBOL_FIELD_RE = re.compile(r'"symbol":\s*"[^"]*"')
+_SUBNET_NAME_FIELD_RE = re.compile(r'"subnet_name":\s*"[^"]*"')
+_NAME_FIELD_RE = re.compile(r'"name":\s*"([^"]*)"')
+_NON_NAME_CHARS_RE = re.compile(r"[^\w\s-]")
+_TABLE_SEPARATOR_RE = re.compile(r'[│|]')
+_INT_RE = re.compile(r'(\d+)')
+_DECIMAL_RE = re.compile(r'([\d.]+)')
+_RATE_FIELD_RE = re.compile(r'"rate":\s*([\d.]+)')
+_NAME_VALUE_RE = re.compile(r'"name":\s*"([^"]+)"')
+_SYMBOL_VALUE_RE = re.compile(r'"symbol":\s*"([^"]+)"')
+_NETUID_FIELD_RE = re.compile(r'"netuid":\s*(\d+)')
 
 class DataCache:
     def __init__(self, ttl_seconds=300):
@@ -42,6 +56,7 @@ class StatsManager:
     def __init__(self, config):
         self.config = config
         self.subtensor = bt.subtensor()
+        self.subtensor_lock = threading.Lock()
         self.cache_dir = os.path.expanduser('~/.bittensor/cache')
         os.makedirs(self.cache_dir, exist_ok=True)
         
@@ -50,6 +65,32 @@ class StatsManager:
         
         self.data_cache = DataCache(ttl_seconds=cache_ttl)
         self.tao_price_cache = DataCache(ttl_seconds=price_ttl)
+        self._prefetched_balances = {}
+        self.tao_price = None
+        self._wallet_overviews: Dict[str, Union[Dict, str, None]] = {}
+
+    def prefetch_balances(self, addresses: Dict[str, str]):
+        self._prefetched_balances.clear()
+        if not addresses:
+            return
+
+        try:
+            with self.subtensor_lock:
+                balances = self.subtensor.get_balances(*addresses.values())
+        except Exception as e:
+            logger.warning(f"Batched balance query failed, falling back to per-wallet queries: {e}")
+            return
+
+        for wallet_name, address in addresses.items():
+            if address in balances:
+                self._prefetched_balances[wallet_name] = balances[address]
+
+    def prefetch_tao_price(self):
+        self.tao_price = self._get_tao_price()
+
+    def _cached_tao_price(self) -> Optional[float]:
+        cached_price = self.tao_price_cache.get('tao_price')
+        return cached_price if cached_price is not None else self.tao_price
 
     def _get_tao_price(self) -> Optional[float]:
         cached_price = self.tao_price_cache.get('tao_price')
@@ -122,57 +163,29 @@ class StatsManager:
             return cached_data
             
         try:
-            cmd = f'btcli wallet overview --wallet.name {wallet_name} --json-output'
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if process.returncode != 0:
-                logger.error(f"Error executing command: {process.stderr}")
+            data = self._get_wallet_overview_json(wallet_name)
+            if not data:
+                logger.error(f"Could not extract subnet information for {wallet_name}")
                 return []
-                
-            try:
-                output = process.stdout.strip()
-                if not output:
-                    logger.warning(f"Empty output from btcli wallet overview for {wallet_name}")
+            
+            if isinstance(data, str):
+                active_subnets = list({int(match) for match in _NETUID_FIELD_RE.findall(data)})
+                if not active_subnets:
+                    logger.error(f"Could not extract subnet information for {wallet_name}")
                     return []
-                
-                output = re.sub(r'\\u[0-9a-fA-F]{4}', '', output)
-                output = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', output)
-                
-                output = re.sub(r'"symbol":\s*"[^"]*"', '"symbol": "X"', output)
-                
-                data = json.loads(output)
+                logger.info(f"Extracted {len(active_subnets)} active subnets via regex for {wallet_name}: {active_subnets}")
+            else:
                 active_subnets = []
-                
-                if 'subnets' in data:
-                    for subnet in data['subnets']:
-                        netuid = subnet.get('netuid')
-                        if netuid is not None:
-                            active_subnets.append(int(netuid))
-                
-                if active_subnets:
-                    self.data_cache.set(cache_key, active_subnets)
-                    logger.info(f"Found {len(active_subnets)} active subnets for {wallet_name}: {active_subnets}")
-                
-                return active_subnets
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON output from 'btcli wallet overview' for {wallet_name}: {e}")
-                
-                output = process.stdout
-                netuid_pattern = r'"netuid":\s*(\d+)'
-                matches = re.findall(netuid_pattern, output)
-                
-                if matches:
-                    active_subnets = [int(match) for match in matches]
-                    active_subnets = list(set(active_subnets))
-                    
-                    if active_subnets:
-                        self.data_cache.set(cache_key, active_subnets)
-                        logger.info(f"Extracted {len(active_subnets)} active subnets via regex for {wallet_name}: {active_subnets}")
-                        return active_subnets
-                
-                logger.error(f"Could not extract subnet information for {wallet_name}")
-                return []
+                for subnet in data.get('subnets', []):
+                    netuid = subnet.get('netuid')
+                    if netuid is not None:
+                        active_subnets.append(int(netuid))
+            
+            if active_subnets:
+                self.data_cache.set(cache_key, active_subnets)
+                logger.info(f"Found {len(active_subnets)} active subnets for {wallet_name}: {active_subnets}")
+            
+            return active_subnets
                     
         except Exception as e:
             logger.error(f"Error getting active subnets: {e}")
@@ -187,8 +200,8 @@ class StatsManager:
         try:
             logger.info(f"Getting stake info for {wallet_name}")
             
-            cmd = f'btcli stake list --wallet.name {wallet_name} --json-output'
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+            cmd = ['btcli', 'stake', 'list', '--wallet.name', wallet_name, '--json-output']
+            process = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
             if process.returncode != 0:
                 logger.warning(f"btcli stake list failed for {wallet_name}: {process.stderr}")
@@ -200,11 +213,12 @@ class StatsManager:
                 return self._fallback_stake_parsing(wallet_name)
                 
             try:
-                output = re.sub(r'\\u[0-9a-fA-F]{4}', '', output)
-                output = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', output)
+                if '\\u' in output:
+                    output = _UNICODE_ESCAPE_RE.sub('', output)
+                output = _CONTROL_CHARS_RE.sub('', output)
                 
-                output = re.sub(r'"subnet_name":\s*"[^"]*"', '"subnet_name": "Subnet"', output)
-                output = re.sub(r'"symbol":\s*"[^"]*"', '"symbol": ""', output)
+                output = _SUBNET_NAME_FIELD_RE.sub('"subnet_name": "Subnet"', output)
+                output = _SYMBOL_FIELD_RE.sub('"symbol": ""', output)
                 
                 data = json.loads(output)
                 stake_info = {}
@@ -249,21 +263,17 @@ class StatsManager:
         try:
             logger.info(f"Using fallback parsing for {wallet_name}")
             
-            temp_file = f"/tmp/stake_list_{wallet_name}_{int(time.time())}.txt"
-            cmd = f'btcli stake list --wallet.name {wallet_name} > {temp_file} 2>/dev/null'
-            
-            result = subprocess.run(cmd, shell=True, timeout=30)
+            process = subprocess.run(
+                ['btcli', 'stake', 'list', '--wallet.name', wallet_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding='utf-8',
+                errors='ignore',
+                timeout=30
+            )
             
-            if not os.path.exists(temp_file):
-                logger.warning(f"Temp file not created for {wallet_name}")
-                return {}
-                
             stake_info = {}
-            
-            with open(temp_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            os.remove(temp_file)
+            content = process.stdout
             
             if not content.strip():
                 logger.warning(f"Empty content from fallback for {wallet_name}")
@@ -304,13 +314,13 @@ class StatsManager:
                     if 'Total' in line or line.startswith('─') or line.startswith('━'):
                         continue
                         
-                    parts = re.split(r'[│|]', line)
+                    parts = _TABLE_SEPARATOR_RE.split(line)
                     if len(parts) < 4:
                         continue
                         
                     try:
                         netuid_text = parts[0].strip()
-                        netuid_match = re.search(r'(\d+)', netuid_text)
+                        netuid_match = _INT_RE.search(netuid_text)
                         if not netuid_match:
                             continue
                             
@@ -320,7 +330,7 @@ class StatsManager:
                         stake_text = parts[3].strip() if len(parts) > 3 else "0"
                         registered_text = parts[6].strip() if len(parts) > 6 else "NO"
                         
-                        stake_match = re.search(r'([\d.]+)', stake_text)
+                        stake_match = _DECIMAL_RE.search(stake_text)
                         stake_value = float(stake_match.group(1)) if stake_match else 0.0
                         
                         is_registered = any(word in registered_text.upper() for word in ['YES', 'TRUE', '✓'])
@@ -376,8 +386,8 @@ class StatsManager:
             if cached_rate is not None:
                 return cached_rate
                 
-            cmd = f'btcli subnets show --netuid {netuid} --json-output'
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            cmd = ['btcli', 'subnets', 'show', '--netuid', str(netuid), '--json-output']
+            process = subprocess.run(cmd, capture_output=True, text=True)
             
             if process.returncode != 0:
                 logger.error(f"Error executing command: {process.stderr}")
@@ -420,7 +430,7 @@ class StatsManager:
                         'name': hotkey_name,
                         'ss58_address': ss58_address
                     })
-                    logger.debug(f"Found hotkey {hotkey_name} with address {ss58_address}")
+                    logger.debug("Found hotkey %s with address %s", hotkey_name, ss58_address)
                 except Exception as e:
                     logger.error(f"Failed to process hotkey {hotkey_name}: {e}")
                     continue
@@ -433,11 +443,31 @@ class StatsManager:
             logger.error(f"Failed to get hotkeys for wallet {coldkey_name}: {e}")
             return []
 
-    def _get_wallet_overview_json(self, coldkey_name: str, netuid: Optional[int] = None) -> Optional[Dict]:
+    @contextmanager
+    def wallet_overview_scope(self, coldkey_name: str):
+        opened = coldkey_name not in self._wallet_overviews
+        if opened:
+            self._wallet_overviews[coldkey_name] = None
         try:
-            netuid_param = f"--netuid {netuid}" if netuid is not None else ""
-            cmd = f'btcli wallet overview --wallet.name {coldkey_name} {netuid_param} --json-output'
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            yield
+        finally:
+            if opened:
+                self._wallet_overviews.pop(coldkey_name, None)
+
+    def _get_wallet_overview_json(self, coldkey_name: str) -> Union[Dict, str, None]:
+        cached_overview = self._wallet_overviews.get(coldkey_name)
+        if cached_overview is not None:
+            return cached_overview
+
+        data = self._load_wallet_overview_json(coldkey_name)
+        if data and coldkey_name in self._wallet_overviews:
+            self._wallet_overviews[coldkey_name] = data
+        return data
+
+    def _load_wallet_overview_json(self, coldkey_name: str) -> Union[Dict, str, None]:
+        try:
+            cmd = ['btcli', 'wallet', 'overview', '--wallet.name', coldkey_name, '--json-output']
+            process = subprocess.run(cmd, capture_output=True, text=True)
             
             if process.returncode != 0:
                 logger.error(f"Error executing command: {process.stderr}")
@@ -449,17 +479,18 @@ class StatsManager:
                     logger.warning(f"Empty output from btcli wallet overview for {coldkey_name}")
                     return None
                 
-                output = re.sub(r'\\u[0-9a-fA-F]{4}', '', output)
-                output = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', output)
+                if '\\u' in output:
+                    output = _UNICODE_ESCAPE_RE.sub('', output)
+                output = _CONTROL_CHARS_RE.sub('', output)
                 
-                output = re.sub(r'"symbol":\s*"[^"]*"', '"symbol": "X"', output)
+                output = _SYMBOL_FIELD_RE.sub('"symbol": "X"', output)
                 
                 def clean_name(match):
                     name = match.group(1)
-                    clean_name_text = re.sub(r"[^\w\s-]", "", name)
+                    clean_name_text = _NON_NAME_CHARS_RE.sub("", name)
                     return f'"name": "{clean_name_text}"'
                 
-                output = re.sub(r'"name":\s*"([^"]*)"', clean_name, output)
+                output = _NAME_FIELD_RE.sub(clean_name, output)
                 
                 data = json.loads(output)
                 return data
@@ -470,14 +501,15 @@ class StatsManager:
                 output = process.stdout
                 output = ''.join(char for char in output if ord(char) < 128 or char in '\n\r\t')
                 
-                output = re.sub(r'\\u[0-9a-fA-F]{4}', 'X', output)
+                if '\\u' in output:
+                    output = _UNICODE_ESCAPE_RE.sub('X', output)
                 
                 try:
                     data = json.loads(output)
                     return data
                 except json.JSONDecodeError:
                     logger.error(f"Failed to parse JSON output from 'btcli wallet overview' after aggressive cleaning")
-                    return None
+                    return process.stdout
                     
         except Exception as e:
             logger.error(f"Error getting wallet overview: {e}")
@@ -491,8 +523,8 @@ class StatsManager:
             subnet_symbol = ""
             subnet_rate = 0.0
             
-            wallet_overview = self._get_wallet_overview_json(coldkey_name, netuid)
-            if not wallet_overview:
+            wallet_overview = self._get_wallet_overview_json(coldkey_name)
+            if not isinstance(wallet_overview, dict):
                 logger.warning(f"Failed to get wallet overview for {coldkey_name}")
                 return None
                 
@@ -524,14 +556,14 @@ class StatsManager:
             
             if subnet_rate == 0.0:
                 try:
-                    cmd = f'btcli subnets show --netuid {netuid} --json-output'
-                    process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                    cmd = ['btcli', 'subnets', 'show', '--netuid', str(netuid), '--json-output']
+                    process = subprocess.run(cmd, capture_output=True, text=True)
                     
                     if process.returncode == 0:
                         output = process.stdout
                         output = ''.join(char for char in output if ord(char) >= 32 or char in '\n\r\t')
                         
-                        rate_match = re.search(r'"rate":\s*([\d.]+)', output)
+                        rate_match = _RATE_FIELD_RE.search(output)
                         if rate_match:
                             try:
                                 subnet_rate = float(rate_match.group(1))
@@ -540,21 +572,21 @@ class StatsManager:
                                 pass
                         
                         if not subnet_name:
-                            name_match = re.search(r'"name":\s*"([^"]+)"', output)
+                            name_match = _NAME_VALUE_RE.search(output)
                             if name_match:
                                 subnet_name = name_match.group(1)
                                 logger.info(f"Got name '{subnet_name}' for subnet {netuid} from subnets show")
                         
                         if not subnet_symbol:
-                            symbol_match = re.search(r'"symbol":\s*"([^"]+)"', output)
+                            symbol_match = _SYMBOL_VALUE_RE.search(output)
                             if symbol_match:
                                 subnet_symbol = symbol_match.group(1)
                                 logger.info(f"Got symbol '{subnet_symbol}' for subnet {netuid} from subnets show")
                 except Exception as e:
                     logger.error(f"Error getting subnet info from subnets show: {e}")
             
-            self.tao_price = self._get_tao_price() if not hasattr(self, 'tao_price') or self.tao_price is None else self.tao_price
-            alpha_token_price_usd = subnet_rate * self.tao_price if self.tao_price else 0.0
+            tao_price = self._cached_tao_price()
+            alpha_token_price_usd = subnet_rate * tao_price if tao_price else 0.0
             
             neurons = []
             total_daily_rewards_alpha = 0
@@ -644,14 +676,20 @@ class StatsManager:
             return None
 
     async def get_wallet_stats(self, coldkey_name: str, subnet_list: Optional[List[int]] = None, hide_zeros: bool = False, include_unregistered: bool = False) -> Dict:
+        with self.wallet_overview_scope(coldkey_name):
+            return await self._get_wallet_stats(coldkey_name, subnet_list, hide_zeros, include_unregistered)
+
+    async def _get_wallet_stats(self, coldkey_name: str, subnet_list: Optional[List[int]], hide_zeros: bool, include_unregistered: bool) -> Dict:
         try:
-            self.tao_price = self._get_tao_price()
-            logger.info(f"Current TAO price: ${self.tao_price}")
+            logger.info(f"Current TAO price: ${self._cached_tao_price()}")
             
             logger.info(f"Starting to get stats for {coldkey_name}")
             
             wallet = bt.wallet(name=coldkey_name)
-            balance = self.subtensor.get_balance(wallet.coldkeypub.ss58_address)
+            balance = self._prefetched_balances.pop(coldkey_name, None)
+            if balance is None:
+                with self.subtensor_lock:
+                    balance = self.subtensor.get_balance(wallet.coldkeypub.ss58_address)
             logger.debug(f"Got balance for {coldkey_name}: {balance}")
             
             stats = {
@@ -749,7 +787,8 @@ class StatsManager:
             logger.info(f"Safe stats check for {coldkey_name}")
             
             wallet = bt.wallet(name=coldkey_name)
-            balance = self.subtensor.get_balance(wallet.coldkeypub.ss58_address)
+            with self.subtensor_lock:
+                balance = self.subtensor.get_balance(wallet.coldkeypub.ss58_address)
             
             basic_stats = {
                 'coldkey': coldkey_name,
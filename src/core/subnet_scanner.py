@@ -4,16 +4,17 @@ import bittensor as bt
 import numpy as np
 import asyncio
 from typing import Dict, List, Optional, Tuple
-from rich.console import Console
+from ..utils.console import console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.live import Live
 from ..utils.logger import setup_logger
+from .stats_manager import DataCache
 import time
+import threading
 
 logger = setup_logger('subnet_scanner', 'logs/subnet_scanner.log')
-console = Console()
 
 class SubnetScanner:
     def __init__(self, config):
@@ -22,8 +23,15 @@ class SubnetScanner:
         self.api_key = self.config.get('taostats.api_key')
         self.api_url = self.config.get('taostats.api_url', 'https://api.taostats.io/api')
         self.tao_price = None
+        self.tao_price_cache = DataCache(ttl_seconds=self.config.get('cache.price_ttl_seconds', 60))
+        self.subnet_info_cache = DataCache(ttl_seconds=self.config.get('cache.scan_ttl_seconds', 30))
 
     def get_tao_price(self) -> Optional[float]:
+        cached_price = self.tao_price_cache.get('tao_price')
+        if cached_price is not None:
+            self.tao_price = cached_price
+            return cached_price
+            
         try:
             try:
                 response = requests.get(
@@ -38,6 +46,7 @@ class SubnetScanner:
                         price = float(data['bittensor']['usd'])
                         logger.info(f"Got TAO price from CoinGecko: ${price}")
                         self.tao_price = price
+                        self.tao_price_cache.set('tao_price', price)
                         return price
             except Exception as e:
                 logger.warning(f"Failed to get TAO price from CoinGecko: {e}")
@@ -54,6 +63,7 @@ class SubnetScanner:
                     price = float(data['price'])
                     logger.info(f"Got TAO price from Binance: ${price}")
                     self.tao_price = price
+                    self.tao_price_cache.set('tao_price', price)
                     return price
             except Exception as e:
                 logger.warning(f"Failed to get TAO price from Binance: {e}")
@@ -73,6 +83,7 @@ class SubnetScanner:
                         price = float(data['data'][0]['usd'])
                         logger.info(f"Got TAO price from TaoStats: ${price}")
                         self.tao_price = price
+                        self.tao_price_cache.set('tao_price', price)
                         return price
             except Exception as e:
                 logger.warning(f"Failed to get TAO price from TaoStats: {e}")
@@ -90,84 +101,113 @@ class SubnetScanner:
             logger.error(f"Error getting subnets: {e}")
             return []
 
-    def get_all_subnet_info_api(self) -> Dict[int, Dict]:
-        try:
-            if not self.api_key:
-                console.print("[red]TAO Stats API key not configured[/red]")
-                return {}
-                
-            url = f"{self.api_url}/subnet/latest/v1"
-            headers = {
-                "accept": "application/json",
-                "Authorization": self.api_key
-            }
+    def _parse_subnet_api_entry(self, subnet_data: Dict) -> Dict:
+        stake_distribution = {
+            'mean': 0.0,
+            'std': 0.0,
+            'cv': 0.0
+        }
+        
+        commit_reveal_weights_enabled = subnet_data.get("commit_reveal_weights_enabled", False)
+        difficulty = float(subnet_data.get("difficulty", 0))
+        min_difficulty = float(subnet_data.get("min_difficulty", 0))
+        max_difficulty = float(subnet_data.get("max_difficulty", 1))
+        
+        normalized_difficulty = 0
+        if max_difficulty > min_difficulty:
+            normalized_difficulty = (difficulty - min_difficulty) / (max_difficulty - min_difficulty)
+        
+        return {
+            'netuid': subnet_data["netuid"],
+            'total_neurons': subnet_data["active_keys"] + (subnet_data.get("inactive_keys", 0) or 0),
+            'active_keys': subnet_data["active_keys"],
+            'max_neurons': subnet_data["max_neurons"],
+            'validators_count': subnet_data.get("validators", 64),
+            'active_validators': subnet_data["active_validators"],
+            'miners_count': subnet_data["active_miners"],
+            'active_miners': subnet_data["active_miners"],
+            'max_validators': subnet_data.get("validators", 64),
+            'validators': [],
+            'miners': [],
+            'registration_allowed': subnet_data["registration_allowed"],
+            'registration_cost': float(subnet_data["neuron_registration_cost"]) / 1e9,
+            'emission': int(subnet_data["emission"]),
+            'stake_distribution': stake_distribution,
+            'owner': subnet_data.get("owner", {}).get("ss58") if subnet_data.get("owner") else None,
+            'blocks_until_adjustment': subnet_data.get("blocks_until_next_adjustment", 0),
+            'activity_cutoff': subnet_data.get("activity_cutoff", 5000),
+            'adjustment_interval': subnet_data.get("adjustment_interval", 360),
+            'recycled_lifetime': float(subnet_data.get("recycled_lifetime", 0)) / 1e9,
+            'recycled_24_hours': float(subnet_data.get("recycled_24_hours", 0)) / 1e9,
+            'dual_neurons': subnet_data.get("active_dual", 0),
+            'commit_reveal_weights_enabled': commit_reveal_weights_enabled,
+            'difficulty': difficulty,
+            'min_difficulty': min_difficulty,
+            'max_difficulty': max_difficulty,
+            'normalized_difficulty': normalized_difficulty
+        }
+
+    def _fetch_subnet_api_data(self, params: Optional[Dict] = None) -> Optional[List[Dict]]:
+        if not self.api_key:
+            console.print("[red]TAO Stats API key not configured[/red]")
+            return None
             
-            console.print("[cyan]Fetching data for all subnets with a single API call...[/cyan]")
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code != 200:
-                console.print(f"[red]API request failed: {response.status_code}[/red]")
+        url = f"{self.api_url}/subnet/latest/v1"
+        headers = {
+            "accept": "application/json",
+            "Authorization": self.api_key
+        }
+        
+        response = requests.get(url, headers=headers, params=params, timeout=15)
+        if response.status_code != 200:
+            console.print(f"[red]API request failed: {response.status_code}[/red]")
+            return None
+            
+        return response.json()["data"]
+
+    def get_all_subnet_info_api(self, refresh: bool = False) -> Dict[int, Dict]:
+        cached_info = None if refresh else self.subnet_info_cache.get('all')
+        if cached_info is not None:
+            return cached_info
+            
+        try:
+            if self.api_key:
+                console.print("[cyan]Fetching data for all subnets with a single API call...[/cyan]")
+            data = self._fetch_subnet_api_data()
+            if data is None:
                 return {}
-                
-            data = response.json()
             
             subnets_info = {}
-            for subnet_data in data["data"]:
-                netuid = subnet_data["netuid"]
-                
-                stake_distribution = {
-                    'mean': 0.0,
-                    'std': 0.0,
-                    'cv': 0.0
-                }
-                
-                commit_reveal_weights_enabled = subnet_data.get("commit_reveal_weights_enabled", False)
-                difficulty = float(subnet_data.get("difficulty", 0))
-                min_difficulty = float(subnet_data.get("min_difficulty", 0))
-                max_difficulty = float(subnet_data.get("max_difficulty", 1))
-                
-                normalized_difficulty = 0
-                if max_difficulty > min_difficulty:
-                    normalized_difficulty = (difficulty - min_difficulty) / (max_difficulty - min_difficulty)
-                
-                subnet_info = {
-                    'netuid': netuid,
-                    'total_neurons': subnet_data["active_keys"] + (subnet_data.get("inactive_keys", 0) or 0),
-                    'active_keys': subnet_data["active_keys"],
-                    'max_neurons': subnet_data["max_neurons"],
-                    'validators_count': subnet_data.get("validators", 64),
-                    'active_validators': subnet_data["active_validators"],
-                    'miners_count': subnet_data["active_miners"],
-                    'active_miners': subnet_data["active_miners"],
-                    'max_validators': subnet_data.get("validators", 64),
-                    'validators': [],
-                    'miners': [],
-                    'registration_allowed': subnet_data["registration_allowed"],
-                    'registration_cost': float(subnet_data["neuron_registration_cost"]) / 1e9,
-                    'emission': int(subnet_data["emission"]),
-                    'stake_distribution': stake_distribution,
-                    'owner': subnet_data.get("owner", {}).get("ss58") if subnet_data.get("owner") else None,
-                    'blocks_until_adjustment': subnet_data.get("blocks_until_next_adjustment", 0),
-                    'activity_cutoff': subnet_data.get("activity_cutoff", 5000),
-                    'adjustment_interval': subnet_data.get("adjustment_interval", 360),
-                    'recycled_lifetime': float(subnet_data.get("recycled_lifetime", 0)) / 1e9,
-                    'recycled_24_hours': float(subnet_data.get("recycled_24_hours", 0)) / 1e9,
-                    'dual_neurons': subnet_data.get("active_dual", 0),
-                    'commit_reveal_weights_enabled': commit_reveal_weights_enabled,
-                    'difficulty': difficulty,
-                    'min_difficulty': min_difficulty,
-                    'max_difficulty': max_difficulty,
-                    'normalized_difficulty': normalized_difficulty
-                }
-                
-                subnets_info[netuid] = subnet_info
+            for subnet_data in data:
+                subnets_info[subnet_data["netuid"]] = self._parse_subnet_api_entry(subnet_data)
             
             console.print(f"[green]Successfully retrieved data for {len(subnets_info)} subnets[/green]")
+            self.subnet_info_cache.set('all', subnets_info)
             return subnets_info
             
         except Exception as e:
             logger.error(f"Error getting subnets from API: {e}")
             return {}
 
+    def get_subnet_info_api(self, netuid: int) -> Optional[Dict]:
+        try:
+            try:
+                data = self._fetch_subnet_api_data({"netuid": netuid})
+            except requests.RequestException as e:
+                logger.warning(f"Single-subnet API request for {netuid} failed: {e}")
+                data = None
+            if data is None:
+                return self.get_all_subnet_info_api().get(netuid) if self.api_key else None
+            
+            for subnet_data in data:
+                if subnet_data["netuid"] == netuid:
+                    return self._parse_subnet_api_entry(subnet_data)
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error getting subnet {netuid} from API: {e}")
+            return None
+
     def get_subnet_info_direct(self, netuid: int, verbose: bool = False) -> Optional[Dict]:
         try:
             if verbose:
@@ -347,11 +387,11 @@ class SubnetScanner:
             logger.error(f"Error getting direct info for subnet {netuid}: {e}")
             return None
 
-    async def analyze_subnets(self, use_api: bool = True, verbose: bool = False) -> Dict[str, List[Dict]]:
+    async def analyze_subnets(self, use_api: bool = True, verbose: bool = False, refresh: bool = False) -> Dict[str, List[Dict]]:
         subnet_infos = []
         
         if use_api:
-            all_subnet_info = self.get_all_subnet_info_api()
+            all_subnet_info = self.get_all_subnet_info_api(refresh=refresh)
             if all_subnet_info:
                 subnet_infos = list(all_subnet_info.values())
             else:
@@ -695,13 +735,10 @@ class SubnetScanner:
             console.print("\n")
             console.print(table)
 
-    def check_registration_activity(self, disabled_weights_subnets):
+    def select_registration_check_subnets(self, disabled_weights_subnets) -> List[Dict]:
         if not self.api_key:
             console.print("[red]API key is not configured. Cannot check registration activity.[/red]")
-            return {}
-        
-        current_time = time.strftime("%H:%M:%S", time.localtime())
-        console.print(f"[cyan][{current_time}] Starting registration activity check[/cyan]")
+            return []
         
         sorted_subnets = sorted(
             disabled_weights_subnets, 
@@ -725,7 +762,21 @@ class SubnetScanner:
                 console.print("[yellow]Checking only top 5 most active subnets[/yellow]")
                 interesting_subnets = interesting_subnets[:5]
         
-        subnets_to_check = interesting_subnets
+        if not interesting_subnets:
+            console.print("[yellow]No suitable subnets found for registration activity check.[/yellow]")
+        return interesting_subnets
+
+    def check_registration_activity(self, subnets_to_check, cancel_event: Optional[threading.Event] = None):
+        if not self.api_key:
+            console.print("[red]API key is not configured. Cannot check registration activity.[/red]")
+            return {}
+        if not subnets_to_check:
+            return {}
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
+        current_time = time.strftime("%H:%M:%S", time.localtime())
+        console.print(f"[cyan][{current_time}] Starting registration activity check[/cyan]")
         
         results = {}
         headers = {
@@ -733,15 +784,14 @@ class SubnetScanner:
             "Authorization": self.api_key
         }
         
-        if not subnets_to_check:
-            console.print("[yellow]No suitable subnets found for registration activity check.[/yellow]")
-            return {}
-        
         subnet_ids = [s['netuid'] for s in subnets_to_check]
         console.print(f"[cyan]Checking {len(subnets_to_check)} subnets: {subnet_ids}[/cyan]")
         console.print(f"[cyan]This will take approximately {len(subnets_to_check) * 12} seconds due to API rate limits[/cyan]")
         
         for i, subnet in enumerate(subnets_to_check):
+            if cancel_event.is_set():
+                console.print("[yellow]Registration activity check cancelled.[/yellow]")
+                break
             netuid = subnet['netuid']
             current_time = time.strftime("%H:%M:%S", time.localtime())
             console.print(f"[cyan][{current_time}] Checking subnet {netuid} ({i+1}/{len(subnets_to_check)})...[/cyan]")
@@ -826,7 +876,8 @@ class SubnetScanner:
                 
                 for remaining in range(wait_seconds, 0, -1):
                     console.print(f"[dim]Waiting: {remaining} seconds remaining...[/dim]")
-                    time.sleep(1)
+                    if cancel_event.wait(1):
+                        break
                 console.print("[dim]Wait complete, proceeding to next subnet...[/dim]")
         
         current_time = time.strftime("%H:%M:%S", time.localtime())
@@ -5,7 +5,7 @@ import bittensor as bt
 import re
 import json
 from typing import Dict, List, Optional, Tuple
-from rich.console import Console
+from ..utils.console import console, print_indexed
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm
@@ -13,25 +13,39 @@ from rich.status import Status
 from ..utils.logger import setup_logger
 import time
 import subprocess
+import threading
 
 logger = setup_logger('transfer_manager', 'logs/transfer_manager.log')
-console = Console()
+
+_SUBNET_HEADER_RE = re.compile(r'Subnet:\s*(\d+):')
+_OVERVIEW_LINE_RE = re.compile(r'^[^\n]*?(?:Subnet:|STAKE|EMISSION)[^\n]*', re.M)
+_NUMBER_RE = re.compile(r'\d+\.\d+|\d+')
+_STAKE_VALUE_RE = re.compile(r'([0-9.]+)')
 
 class TransferManager:
-    def __init__(self, config):
+    def __init__(self, config, stats_manager=None):
         self.config = config
-        self.subtensor = bt.subtensor()
+        self._unlocked_coldkeys = {}
+        self._hotkey_addresses = {}
         
         self.logs_dir = os.path.expanduser('~/.bittensor/logs')
         os.makedirs(self.logs_dir, exist_ok=True)
         
-        try:
-            from ..core.stats_manager import StatsManager
-            self.stats_manager = StatsManager(config)
-            logger.info("StatsManager successfully loaded")
-        except Exception as e:
-            logger.warning(f"Could not load StatsManager: {e}")
-            self.stats_manager = None
+        self.stats_manager = stats_manager
+        if self.stats_manager is None:
+            try:
+                from ..core.stats_manager import StatsManager
+                self.stats_manager = StatsManager(config)
+                logger.info("StatsManager successfully loaded")
+            except Exception as e:
+                logger.warning(f"Could not load StatsManager: {e}")
+
+        if self.stats_manager is not None:
+            self.subtensor = self.stats_manager.subtensor
+            self.subtensor_lock = self.stats_manager.subtensor_lock
+        else:
+            self.subtensor = bt.subtensor()
+            self.subtensor_lock = threading.Lock()
 
     def _get_wallet_password(self, wallet: str) -> str:
         default_password = self.config.get('wallet.default_password')
@@ -45,27 +59,47 @@ class TransferManager:
         else:
             return Prompt.ask(f"Enter password for {wallet}", password=True)
 
+    def unlock_coldkey(self, coldkey: str, password: str):
+        cached = self._unlocked_coldkeys.get(coldkey)
+        if cached is not None and cached[0] == password:
+            return cached[1]
+
+        wallet = bt.wallet(name=coldkey)
+        wallet.coldkey_file.decrypt(password)
+        self._unlocked_coldkeys[coldkey] = (password, wallet)
+        return wallet
+
+    def lock_coldkeys(self):
+        self._unlocked_coldkeys.clear()
+
+    def try_unlock_coldkey(self, coldkey: str, password: str) -> bool:
+        try:
+            self.unlock_coldkey(coldkey, password)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to unlock wallet {coldkey}: {e}")
+            return False
+
     def verify_wallet_password(self, coldkey: str, password: str) -> bool:
         try:
-            wallet = bt.wallet(name=coldkey)
-            wallet.coldkey_file.decrypt(password)
+            bt.wallet(name=coldkey).coldkey_file.decrypt(password)
             return True
         except Exception as e:
             logger.error(f"Failed to verify password for wallet {coldkey}: {e}")
             return False
 
-    def transfer_tao(self, from_coldkey: str, to_address: str, amount: float, password: str) -> bool:
+    def transfer_tao(self, from_coldkey: str, to_address: str, amount: float, password: str, wait_for_inclusion: bool = True, wait_for_finalization: bool = True) -> bool:
         try:
-            wallet = bt.wallet(name=from_coldkey)
-            wallet.coldkey_file.decrypt(password)
-
-            success = self.subtensor.transfer(
-                wallet=wallet,
-                dest=to_address,
-                amount=amount,
-                wait_for_inclusion=True,
-                wait_for_finalization=True
-            )
+            wallet = self.unlock_coldkey(from_coldkey, password)
+
+            with self.subtensor_lock:
+                success = self.subtensor.transfer(
+                    wallet=wallet,
+                    dest=to_address,
+                    amount=amount,
+                    wait_for_inclusion=wait_for_inclusion,
+                    wait_for_finalization=wait_for_finalization
+                )
 
             return success
 
@@ -80,8 +114,7 @@ class TransferManager:
             return
 
         console.print("\nAvailable Source Wallets:")
-        for i, wallet in enumerate(wallets, 1):
-            console.print(f"{i}. {wallet}")
+        print_indexed(wallets)
 
         selection = Prompt.ask("Select source wallet (number)").strip()
         try:
@@ -95,7 +128,7 @@ class TransferManager:
             return
 
         dest_address = Prompt.ask("Enter destination wallet address (SS58 format)")
-        if not dest_address.startswith('5'):
+        if not self.wallet_utils.is_valid_ss58_address(dest_address):
             console.print("[red]Invalid destination address format![/red]")
             return
 
@@ -113,7 +146,7 @@ class TransferManager:
 
             with Status("[bold green]Processing transfer...", spinner="dots"):
                 try:
-                    if not self.verify_wallet_password(source_wallet, password):
+                    if not self.try_unlock_coldkey(source_wallet, password):
                         console.print("[red]Invalid password![/red]")
                         return
 
@@ -124,21 +157,32 @@ class TransferManager:
                 except Exception as e:
                     console.print(f"[red]Error: {str(e)}[/red]")
 
+    def _get_hotkey_addresses(self, coldkey_name: str) -> Dict[str, str]:
+        hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{coldkey_name}/hotkeys")
+        try:
+            mtime = os.stat(hotkeys_path).st_mtime
+        except OSError:
+            return {}
+
+        cached = self._hotkey_addresses.get(coldkey_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        addresses = {}
+        for hotkey_name in os.listdir(hotkeys_path):
+            try:
+                addresses[hotkey_name] = bt.wallet(name=coldkey_name, hotkey=hotkey_name).hotkey.ss58_address
+            except Exception as e:
+                logger.error(f"Error processing hotkey {hotkey_name}: {e}")
+
+        self._hotkey_addresses[coldkey_name] = (mtime, addresses)
+        return addresses
+
     def _get_hotkey_name_from_address(self, coldkey_name: str, ss58_address: str) -> Optional[str]:
         try:
-            hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{coldkey_name}/hotkeys")
-            
-            if not os.path.exists(hotkeys_path):
-                return None
-                
-            for hotkey_name in os.listdir(hotkeys_path):
-                try:
-                    wallet = bt.wallet(name=coldkey_name, hotkey=hotkey_name)
-                    if wallet.hotkey.ss58_address == ss58_address:
-                        return hotkey_name
-                except Exception:
-                    continue
-                    
+            for hotkey_name, hotkey_address in self._get_hotkey_addresses(coldkey_name).items():
+                if hotkey_address == ss58_address:
+                    return hotkey_name
             return None
         except Exception as e:
             logger.error(f"Error getting hotkey name for address {ss58_address}: {e}")
@@ -147,9 +191,9 @@ class TransferManager:
     def get_unregistered_stake_info(self, coldkey_name: str, subnet_id: int) -> Dict:
         try:
             logger.info(f"Getting unregistered stake info for {coldkey_name} in subnet {subnet_id}")
-            cmd = f'btcli stake list --wallet.name {coldkey_name} --json-output'
+            cmd = ['btcli', 'stake', 'list', '--wallet.name', coldkey_name, '--json-output']
             
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            process = subprocess.run(cmd, capture_output=True, text=True)
             output = process.stdout
             
             if not output:
@@ -221,48 +265,40 @@ class TransferManager:
                     
                     stake_info = []
                     unregistered_stakes = self.stats_manager.get_unregistered_stakes(coldkey_name)
+                    hotkey_addresses = self._get_hotkey_addresses(coldkey_name)
                     
                     for netuid in active_subnets:
                         traditional_info_found = False
                         
                         try:
-                            metagraph = self.subtensor.metagraph(netuid)
+                            with self.subtensor_lock:
+                                metagraph = self.subtensor.metagraph(netuid)
                             subnet_info = {
                                 'netuid': netuid,
                                 'hotkeys': []
                             }
 
-                            hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{coldkey_name}/hotkeys")
-                            if os.path.exists(hotkeys_path):
-                                for hotkey_name in os.listdir(hotkeys_path):
-                                    try:
-                                        hotkey_wallet = bt.wallet(name=coldkey_name, hotkey=hotkey_name)
-                                        hotkey_address = hotkey_wallet.hotkey.ss58_address
-
-                                        try:
-                                            uid = metagraph.hotkeys.index(hotkey_address)
-                                            stake = float(metagraph.stake[uid])
-                                            
-                                            traditional_info_found = True
-                                            
-                                            if stake > 0:
-                                                subnet_info['hotkeys'].append({
-                                                    'name': hotkey_name,
-                                                    'address': hotkey_address,
-                                                    'stake': stake,
-                                                    'uid': uid,
-                                                    'is_registered': True
-                                                })
-                                        except ValueError:
-                                            pass
-
-                                    except Exception as e:
-                                        logger.error(f"Error processing hotkey {hotkey_name}: {e}")
-                                        continue
-
-                                if subnet_info['hotkeys']:
-                                    stake_info.append(subnet_info)
-                                    logger.info(f"Found {len(subnet_info['hotkeys'])} registered hotkeys for subnet {netuid}")
+                            for hotkey_name, hotkey_address in hotkey_addresses.items():
+                                try:
+                                    uid = metagraph.hotkeys.index(hotkey_address)
+                                    stake = float(metagraph.stake[uid])
+                                    
+                                    traditional_info_found = True
+                                    
+                                    if stake > 0:
+                                        subnet_info['hotkeys'].append({
+                                            'name': hotkey_name,
+                                            'address': hotkey_address,
+                                            'stake': stake,
+                                            'uid': uid,
+                                            'is_registered': True
+                                        })
+                                except ValueError:
+                                    pass
+
+                            if subnet_info['hotkeys']:
+                                stake_info.append(subnet_info)
+                                logger.info(f"Found {len(subnet_info['hotkeys'])} registered hotkeys for subnet {netuid}")
                         except Exception as e:
                             logger.error(f"Error getting registered stake info for subnet {netuid}: {e}")
                         
@@ -297,7 +333,7 @@ class TransferManager:
                 except Exception as e:
                     logger.error(f"Error using StatsManager: {e}")
             
-            wallet = bt.wallet(name=coldkey_name)
+            hotkey_addresses = self._get_hotkey_addresses(coldkey_name)
             stake_info = []
 
             if subnet_list is None:
@@ -309,43 +345,34 @@ class TransferManager:
                 traditional_info_found = False
                 
                 try:
-                    metagraph = self.subtensor.metagraph(netuid)
+                    with self.subtensor_lock:
+                        metagraph = self.subtensor.metagraph(netuid)
                     subnet_info = {
                         'netuid': netuid,
                         'hotkeys': []
                     }
 
-                    hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{coldkey_name}/hotkeys")
-                    if os.path.exists(hotkeys_path):
-                        for hotkey_name in os.listdir(hotkeys_path):
-                            try:
-                                hotkey_wallet = bt.wallet(name=coldkey_name, hotkey=hotkey_name)
-                                hotkey_address = hotkey_wallet.hotkey.ss58_address
-
-                                try:
-                                    uid = metagraph.hotkeys.index(hotkey_address)
-                                    stake = float(metagraph.stake[uid])
-                                    
-                                    traditional_info_found = True
-                                    
-                                    if stake > 0:
-                                        subnet_info['hotkeys'].append({
-                                            'name': hotkey_name,
-                                            'address': hotkey_address,
-                                            'stake': stake,
-                                            'uid': uid,
-                                            'is_registered': True
-                                        })
-                                except ValueError:
-                                    continue
-
-                            except Exception as e:
-                                logger.error(f"Error processing hotkey {hotkey_name}: {e}")
-                                continue
+                    for hotkey_name, hotkey_address in hotkey_addresses.items():
+                        try:
+                            uid = metagraph.hotkeys.index(hotkey_address)
+                            stake = float(metagraph.stake[uid])
+                            
+                            traditional_info_found = True
+                            
+                            if stake > 0:
+                                subnet_info['hotkeys'].append({
+                                    'name': hotkey_name,
+                                    'address': hotkey_address,
+                                    'stake': stake,
+                                    'uid': uid,
+                                    'is_registered': True
+                                })
+                        except ValueError:
+                            continue
 
-                        if subnet_info['hotkeys']:
-                            stake_info.append(subnet_info)
-                            logger.info(f"Found {len(subnet_info['hotkeys'])} registered hotkeys for subnet {netuid}")
+                    if subnet_info['hotkeys']:
+                        stake_info.append(subnet_info)
+                        logger.info(f"Found {len(subnet_info['hotkeys'])} registered hotkeys for subnet {netuid}")
 
                 except Exception as e:
                     logger.error(f"Error processing subnet {netuid} via metagraph: {e}")
@@ -413,8 +440,8 @@ class TransferManager:
 
     def _get_exact_stake_amount(self, coldkey: str, hotkey: str, netuid: int) -> float:
         try:
-            cmd = f'btcli stake list --wallet.name {coldkey} --wallet.hotkey {hotkey} --json-output'
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            cmd = ['btcli', 'stake', 'list', '--wallet.name', coldkey, '--wallet.hotkey', hotkey, '--json-output']
+            process = subprocess.run(cmd, capture_output=True, text=True)
             
             output = process.stdout
             logger.debug(f"Got output from btcli for {coldkey}:{hotkey} in subnet {netuid}")
@@ -447,8 +474,6 @@ class TransferManager:
             return 0.0
 
     def unstake_alpha(self, coldkey: str, hotkey: str, netuid: int, amount: float, password: str, tolerance: float = 0.80) -> dict:
-        import subprocess
-        
         try:
             logger.info(f"Unstaking from {coldkey}:{hotkey} in subnet {netuid}")
             
@@ -488,8 +513,8 @@ class TransferManager:
                     logger.info(f"Successfully unstaked ALL Alpha TAO from {coldkey}:{hotkey} in subnet {netuid}")
                     console.print(f"[green]Successfully unstaked ALL from {hotkey}![/green]")
                     
-                    verification_cmd = f'btcli stake list --wallet.name {coldkey} --wallet.hotkey {hotkey} --json-output'
-                    verif_process = subprocess.run(verification_cmd, shell=True, capture_output=True, text=True)
+                    verification_cmd = ['btcli', 'stake', 'list', '--wallet.name', coldkey, '--wallet.hotkey', hotkey, '--json-output']
+                    verif_process = subprocess.run(verification_cmd, capture_output=True, text=True)
                     
                     if verif_process.returncode == 0 and verif_process.stdout:
                         try:
@@ -555,8 +580,8 @@ class TransferManager:
                 logger.info(f"Successfully unstaked {unstake_amount:.9f} Alpha TAO from {coldkey}:{hotkey} in subnet {netuid}")
                 console.print(f"[green]Successfully unstaked from {hotkey}![/green]")
                 
-                verification_cmd = f'btcli stake list --wallet.name {coldkey} --wallet.hotkey {hotkey} --json-output'
-                verif_process = subprocess.run(verification_cmd, shell=True, capture_output=True, text=True)
+                verification_cmd = ['btcli', 'stake', 'list', '--wallet.name', coldkey, '--wallet.hotkey', hotkey, '--json-output']
+                verif_process = subprocess.run(verification_cmd, capture_output=True, text=True)
                 
                 if verif_process.returncode == 0 and verif_process.stdout:
                     try:
@@ -610,8 +635,8 @@ class TransferManager:
                         logger.info(f"Successfully unstaked ALL Alpha TAO from {coldkey}:{hotkey} in subnet {netuid} with emergency method")
                         console.print(f"[green]Successfully unstaked ALL from {hotkey} with emergency method![/green]")
                         
-                        verification_cmd = f'btcli stake list --wallet.name {coldkey} --wallet.hotkey {hotkey} --json-output'
-                        verif_process = subprocess.run(verification_cmd, shell=True, capture_output=True, text=True)
+                        verification_cmd = ['btcli', 'stake', 'list', '--wallet.name', coldkey, '--wallet.hotkey', hotkey, '--json-output']
+                        verif_process = subprocess.run(verification_cmd, capture_output=True, text=True)
                         
                         if verif_process.returncode == 0 and verif_process.stdout:
                             try:
@@ -648,27 +673,26 @@ class TransferManager:
 
     def _get_active_subnets(self, wallet_name: str) -> List[int]:
         try:
-            temp_file = "overview_output.txt"
-            cmd = f'COLUMNS=1000 btcli wallet overview --wallet.name {wallet_name} > {temp_file}'
-
-            process = subprocess.run(cmd, shell=True)
-
-            with open(temp_file, 'r') as f:
-                output = f.read()
-
-            subprocess.run(f'rm {temp_file}', shell=True)
+            process = subprocess.run(
+                ['btcli', 'wallet', 'overview', '--wallet.name', wallet_name],
+                stdout=subprocess.PIPE,
+                text=True,
+                env={**os.environ, 'COLUMNS': '1000'}
+            )
+            output = process.stdout
 
             registered_subnets = []
             current_subnet = None
 
-            for line in output.split('\n'):
-                subnet_match = re.search(r'Subnet:\s*(\d+):', line)
-                if subnet_match:
-                    current_subnet = int(subnet_match.group(1))
+            for line_match in _OVERVIEW_LINE_RE.finditer(output):
+                line = line_match.group()
+                if 'Subnet:' in line:
+                    subnet_match = _SUBNET_HEADER_RE.search(line)
+                    if subnet_match:
+                        current_subnet = int(subnet_match.group(1))
 
                 if current_subnet is not None and ('STAKE' in line or 'EMISSION' in line):
-                    numbers = re.findall(r'\d+\.\d+|\d+', line)
-                    if numbers and any(float(n) > 0 for n in numbers):
+                    if any(float(m.group()) > 0 for m in _NUMBER_RE.finditer(line)):
                         registered_subnets.append(current_subnet)
                         current_subnet = None
             
@@ -677,32 +701,28 @@ class TransferManager:
             unregistered_subnets = []
             try:
                 logger.info("Looking for unregistered stakes")
-                temp_file = "stake_list_output.txt"
-                cmd = f'COLUMNS=2000 btcli stake list --wallet.name {wallet_name} --no_prompt > {temp_file}'
-                
-                subprocess.run(cmd, shell=True)
-                
-                with open(temp_file, 'r') as f:
-                    stake_output = f.read()
+                process = subprocess.run(
+                    ['btcli', 'stake', 'list', '--wallet.name', wallet_name, '--no_prompt'],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    env={**os.environ, 'COLUMNS': '2000'}
+                )
+                stake_output = process.stdout
                 
                 hotkey_sections = stake_output.split('Hotkey:')
                 
                 for section in hotkey_sections[1:]:
-                    lines = section.strip().split('\n')
-                    
                     table_start = False
-                    subnet_data = []
                     
-                    for line in lines:
+                    for line in section.strip().split('\n'):
                         if '????' in line or '----' in line:
                             table_start = True
                             continue
                             
-                        if table_start and '|' in line and not line.strip().startswith('-') and not 'Total' in line:
-                            subnet_data.append(line)
-                    
-                    for subnet_line in subnet_data:
-                        parts = subnet_line.split('|')
+                        if not table_start or '|' not in line or line.strip().startswith('-') or 'Total' in line:
+                            continue
+                        
+                        parts = line.split('|')
                         if len(parts) < 7:
                             continue
                             
@@ -717,7 +737,7 @@ class TransferManager:
                                 
                             netuid = int(digits_only)
                             
-                            stake_match = re.search(r'([0-9.]+)', stake_part)
+                            stake_match = _STAKE_VALUE_RE.search(stake_part)
                             if not stake_match:
                                 continue
                                 
@@ -736,8 +756,6 @@ class TransferManager:
                             logger.error(f"Error processing subnet line: {e}")
                             continue
                 
-                subprocess.run(f'rm {temp_file}', shell=True)
-                
             except Exception as e:
                 logger.error(f"Error finding unregistered stakes: {e}")
             
@@ -6,8 +6,7 @@ import bittensor as bt
 from typing import Dict, List, Optional
 from datetime import datetime
 from ..utils.logger import setup_logger
-from rich.console import Console
-console = Console()
+from ..utils.console import console
 logger = setup_logger('wallet_manager', 'logs/wallet_manager.log')
 
 class WalletManager:
@@ -1,11 +1,18 @@
 import os
-import bittensor as bt
-from rich.console import Console
+import re
+from functools import lru_cache
+from ..utils.console import console, print_indexed
 from rich.prompt import Prompt
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 from ..utils.config import Config
 
-console = Console()
+
+_hotkeys_cache: Dict[str, Tuple[float, List[str]]] = {}
+_wallets_cache: Optional[Tuple[float, List[str]]] = None
+_NUMBER_LIST_RE = re.compile(r'\s*\d+(\s*,\s*\d+)*\s*')
+_NUMBER_RE = re.compile(r'\d+')
+_NAME_SPLIT_RE = re.compile(r'\s*,\s*')
+_SS58_RE = re.compile(r'5[1-9A-HJ-NP-Za-km-z]{47}')
 
 class WalletUtils:
     def __init__(self):
@@ -24,19 +31,13 @@ class WalletUtils:
             return Prompt.ask(f"Enter password for {wallet}", password=True)
 
     def _get_wallet_hotkeys_input(self, wallet: str, single_choice: bool = False) -> tuple[list, str]:
-        hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{wallet}/hotkeys")
-        if not os.path.exists(hotkeys_path):
-            console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
-            return [], ""
-
-        hotkeys = [d for d in os.listdir(hotkeys_path)]
+        hotkeys = self.get_wallet_hotkeys(wallet)
         if not hotkeys:
             console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
             return [], ""
 
         console.print(f"\nHotkeys for wallet {wallet}:")
-        for i, hotkey in enumerate(hotkeys, 1):
-            console.print(f"{i}. {hotkey}")
+        print_indexed(hotkeys)
 
         try:
             if len(hotkeys) == 1:
@@ -60,8 +61,7 @@ class WalletUtils:
                     console.print(f"[red]Invalid selection for {wallet}![/red]")
                     return [], ""
             else:
-                selected_indices = [int(i.strip()) - 1 for i in hotkey_selection.split(',')]
-                selected_hotkeys = [hotkeys[i] for i in selected_indices if 0 <= i < len(hotkeys)]
+                selected_hotkeys = [hotkeys[i] for i in self.parse_index_selection(hotkey_selection, len(hotkeys))]
 
             if not selected_hotkeys:
                 console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
@@ -76,37 +76,81 @@ class WalletUtils:
 
     @staticmethod
     def get_available_wallets() -> List[str]:
+        global _wallets_cache
         wallet_path = os.path.expanduser("~/.bittensor/wallets")
-        if not os.path.exists(wallet_path):
+        try:
+            mtime = os.path.getmtime(wallet_path)
+        except OSError:
+            _wallets_cache = None
             return []
 
-        return [d for d in os.listdir(wallet_path) if os.path.isdir(os.path.join(wallet_path, d))]
+        if _wallets_cache is None or _wallets_cache[0] != mtime:
+            with os.scandir(wallet_path) as entries:
+                wallets = [entry.name for entry in entries if entry.is_dir()]
+            _wallets_cache = (mtime, wallets)
+
+        return list(_wallets_cache[1])
 
     @staticmethod
     def get_wallet_hotkeys(wallet: str) -> list:
         hotkeys_path = os.path.expanduser(f"~/.bittensor/wallets/{wallet}/hotkeys")
-        return [d for d in os.listdir(hotkeys_path)] if os.path.exists(hotkeys_path) else []
+        try:
+            mtime = os.path.getmtime(hotkeys_path)
+        except OSError:
+            _hotkeys_cache.pop(wallet, None)
+            return []
+
+        cached = _hotkeys_cache.get(wallet)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, os.listdir(hotkeys_path))
+            _hotkeys_cache[wallet] = cached
+
+        return list(cached[1])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_wallet_object(name: str, hotkey: Optional[str] = None):
+        import bittensor as bt
+        if hotkey is None:
+            return bt.wallet(name=name)
+        return bt.wallet(name=name, hotkey=hotkey)
+
+    @staticmethod
+    def parse_number_list(selection: str) -> Optional[List[int]]:
+        if not _NUMBER_LIST_RE.fullmatch(selection):
+            return None
+        return [int(n) for n in _NUMBER_RE.findall(selection)]
+
+    @staticmethod
+    def parse_index_selection(selection: str, upper: int) -> List[int]:
+        numbers = WalletUtils.parse_number_list(selection) or []
+        return [n - 1 for n in numbers if 0 < n <= upper]
+
+    @staticmethod
+    def is_valid_ss58_address(address: str) -> bool:
+        return _SS58_RE.fullmatch(address) is not None
 
     @staticmethod
     def parse_wallet_selection_by_names(selection: str, wallets: List[str]) -> List[str]:
-        from rich.console import Console
-        console = Console()
-        
-        if selection.strip().lower() == 'all':
-            return wallets
-        
-        selected_names = [name.strip() for name in selection.split(',')]
+        return WalletUtils.parse_selection_by_names(selection, wallets, 'wallet')
+
+    @staticmethod
+    def parse_hotkey_selection_by_names(selection: str, hotkeys: List[str]) -> List[str]:
+        return WalletUtils.parse_selection_by_names(selection, hotkeys, 'hotkey')
+
+    @staticmethod
+    def parse_selection_by_names(selection: str, names: List[str], kind: str) -> List[str]:
+        selection = selection.strip()
+        if selection.lower() == 'all':
+            return names
         
-        valid_wallets = []
-        invalid_wallets = []
+        selected_names = _NAME_SPLIT_RE.split(selection)
+        known_names = set(names)
         
-        for name in selected_names:
-            if name in wallets:
-                valid_wallets.append(name)
-            else:
-                invalid_wallets.append(name)
+        valid_names = list(dict.fromkeys(name for name in selected_names if name in known_names))
+        invalid_names = [name for name in selected_names if name not in known_names]
         
-        if invalid_wallets:
-            console.print(f"[yellow]Warning: Invalid wallet names: {', '.join(invalid_wallets)}[/yellow]")
+        if invalid_names:
+            console.print(f"[yellow]Warning: Invalid {kind} names: {', '.join(invalid_names)}[/yellow]")
         
-        return valid_wallets
+        return valid_names
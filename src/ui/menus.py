@@ -1,26 +1,159 @@
 import asyncio
+import atexit
+import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 import os
+import subprocess
 from typing import Dict, Optional, List
-from rich.console import Console
-from rich.prompt import Prompt, IntPrompt, Confirm
+from rich.console import Group
+from ..utils.console import console, print_indexed
+from rich.prompt import Prompt, IntPrompt, FloatPrompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from ..core.wallet_utils import WalletUtils
-import bittensor as bt
 from rich.status import Status
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
 import time
 from datetime import datetime
 import json
-
-console = Console()
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+_registration_loop = None
+_reg_info_cache = {}
+
+def _get_registration_loop():
+    global _registration_loop
+    if _registration_loop is None:
+        _registration_loop = _new_event_loop()
+        atexit.register(_registration_loop.close)
+    return _registration_loop
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+NEW_SUBNET_MONITOR_DEFAULTS = {
+    'amount': 0.05,
+    'tolerance': 0.45,
+    'check_interval': 60,
+    'max_attempts': 3,
+    'auto_increase': True,
+    'buy_immediately': False,
+}
+
+_F9 = "%.9f".__mod__
+_F4 = "%.4f".__mod__
+_USD2 = "$%.2f".__mod__
+
+_NEURON_BASE_COLS = (
+    ('stake', _F9),
+    ('rank', _F4),
+    ('trust', _F4),
+    ('consensus', _F4),
+    ('incentive', _F4)
+)
+_NEURON_REWARD_COLS = (
+    ('emission', str),
+    ('daily_rewards_alpha', _F9),
+    ('daily_rewards_usd', _USD2)
+)
+_NEURON_FULL_COLS = _NEURON_BASE_COLS + (('dividends', _F4),) + _NEURON_REWARD_COLS
+
+_RIGHT = {'justify': "right"}
+_MIXED_SUBNET_COLUMNS = (
+    ("Hotkey", {}),
+    ("Status", {}),
+    ("UID", {}),
+    ("Alpha Stake", _RIGHT),
+    ("Rank", _RIGHT),
+    ("Trust", _RIGHT),
+    ("Consensus", _RIGHT),
+    ("Incentive", _RIGHT)
+)
+_REWARD_COLUMNS = (
+    ("Emission(ρ)", _RIGHT),
+    ("Daily Alpha τ", _RIGHT),
+    ("Daily USD", _RIGHT)
+)
+_REGISTERED_SUBNET_COLUMNS = (
+    ("Hotkey", {}),
+    ("UID", {}),
+    ("Alpha Stake", _RIGHT),
+    ("Rank", _RIGHT),
+    ("Trust", _RIGHT),
+    ("Consensus", _RIGHT),
+    ("Incentive", _RIGHT),
+    ("Dividends", _RIGHT)
+) + _REWARD_COLUMNS
+
+_SUMMARY_ROWS = (
+    ("Total TAO Balance", "%.9f τ".__mod__),
+    ("Total Daily Rewards", _USD2),
+    ("Total Alpha TAO Value", _USD2),
+    ("Active Wallets", "%d/%d".__mod__),
+    ("Active Subnets", str),
+    ("Active Neurons (Hotkeys)", str),
+    ("Unregistered Neurons with Stake", str),
+    ("Weekly Rewards Projection", _USD2)
+)
+
+_STATUS_REGISTERED = Text("Registered", style="green")
+_STATUS_UNREGISTERED = Text("Unregistered", style="yellow")
+_ERROR_CELL = Text("Error", style="red")
+
+def _format_neuron_row(neuron: Dict, cols: tuple) -> tuple:
+    return tuple(fmt(neuron.get(key, 0)) for key, fmt in cols)
+
+@lru_cache(maxsize=256)
+def _coldkey_address(wallet_name: str) -> str:
+    return WalletUtils.get_wallet_object(wallet_name).coldkeypub.ss58_address
+
+RAO_PER_TAO = 10**9
+
+def _format_rao(rao: int) -> str:
+    return f"{rao // RAO_PER_TAO}.{rao % RAO_PER_TAO:09d}"
+
+def _select_by_number(prompt: str, items: List[str]) -> Optional[str]:
+    try:
+        index = int(Prompt.ask(prompt).strip()) - 1
+    except ValueError:
+        console.print("[red]Invalid input![/red]")
+        return None
+    if not 0 <= index < len(items):
+        console.print("[red]Invalid selection![/red]")
+        return None
+    return items[index]
+
+def _print_items(items: List[str]):
+    grid = Table.grid(padding=(0, 1))
+    for item in items:
+        grid.add_row("  •", item)
+    console.print(grid)
 
 class RegistrationMenu:
     def __init__(self, registration_manager, config):
         self.registration_manager = registration_manager
         self.config = config
         self.wallet_utils = WalletUtils()
+        self._hotkeys_cache = {}
+        self._password_checks = {}
+        self._loop = _get_registration_loop()
+
+    def _get_hotkeys(self, wallet: str) -> List[str]:
+        if wallet not in self._hotkeys_cache:
+            self._hotkeys_cache[wallet] = self.wallet_utils.get_wallet_hotkeys(wallet)
+        return self._hotkeys_cache[wallet]
 
     def _get_wallet_password(self, wallet: str) -> str:
         default_password = self.config.get('wallet.default_password')
@@ -34,6 +167,67 @@ class RegistrationMenu:
         else:
             return Prompt.ask(f"Enter password for {wallet}", password=True)
 
+    def _get_registration_info(self, subnet_id: int, ttl: float = 10.0):
+        now = time.monotonic()
+        cached = _reg_info_cache.get(subnet_id)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+
+        reg_info = self.registration_manager.get_registration_info(subnet_id)
+        if reg_info:
+            _reg_info_cache[subnet_id] = (now, reg_info)
+        return reg_info
+
+    def _start_password_checks(self, wallet_passwords: Dict[str, str]):
+        self._password_checks = {
+            wallet: self._loop.run_in_executor(None, self.registration_manager.verify_wallet_password, wallet, password)
+            for wallet, password in wallet_passwords.items()
+        }
+
+    def _password_valid(self, wallet: str) -> bool:
+        try:
+            is_valid = self._loop.run_until_complete(self._password_checks.pop(wallet))
+        except Exception as e:
+            console.print(f"[red]Password check failed for {wallet}: {e}[/red]")
+            return False
+        if is_valid:
+            return True
+        console.print(f"[red]Invalid password for {wallet}[/red]")
+        return False
+
+    def _finish_password_checks(self) -> Dict[str, bool]:
+        checks, self._password_checks = self._password_checks, {}
+        if not checks:
+            return {}
+        results = self._loop.run_until_complete(asyncio.gather(*checks.values(), return_exceptions=True))
+        outcomes = {}
+        for wallet, result in zip(checks, results):
+            if isinstance(result, BaseException):
+                console.print(f"[red]Password check failed for {wallet}: {result}[/red]")
+                result = False
+            outcomes[wallet] = result
+        return outcomes
+
+    def _get_common_password(self) -> str:
+        default_password = self.config.get('wallet.default_password')
+        if default_password:
+            common_password = Prompt.ask(
+                f"Enter password for all wallets (press Enter to use default: {default_password})", 
+                password=True,
+                show_default=False
+            )
+            return common_password if common_password else default_password
+        return Prompt.ask("Enter password for all wallets", password=True)
+
+    def _collect_wallet_passwords(self, wallets: List[str]) -> Dict[str, str]:
+        if len(wallets) > 1 and Confirm.ask("Use the same password for all selected wallets?", default=False):
+            common_password = self._get_common_password()
+            wallet_passwords = {wallet: common_password for wallet in wallets}
+        else:
+            wallet_passwords = {wallet: self._get_wallet_password(wallet) for wallet in wallets}
+        self._start_password_checks(wallet_passwords)
+        return wallet_passwords
+
     def _get_rpc_endpoint(self) -> Optional[str]:
         default_endpoint = "wss://entrypoint-finney.opentensor.ai:443"
         rpc_endpoint = Prompt.ask(
@@ -46,7 +240,187 @@ class RegistrationMenu:
             
         return rpc_endpoint
 
+    def _select_hotkeys(self, wallet: str) -> List[str]:
+        hotkeys = self._get_hotkeys(wallet)
+        if not hotkeys:
+            console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
+            return []
+
+        console.print(f"\nHotkeys for wallet {wallet}:")
+        _print_items(hotkeys)
+
+        console.print("\nSelect hotkeys (comma-separated names or 'all')")
+        selected_hotkeys = self.wallet_utils.parse_hotkey_selection_by_names(Prompt.ask("Selection").strip(), hotkeys)
+        if not selected_hotkeys:
+            console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
+        return selected_hotkeys
+
+    def _prompt_tx_validity(self) -> Dict:
+        console.print("\n[bold]Transaction Validity Parameters[/bold]")
+        tx_params = {}
+        if Confirm.ask("Use period parameter?", default=True):
+            tx_params['period'] = IntPrompt.ask("Enter period value (blocks transaction remains valid)", default=16)
+        if Confirm.ask("Use era parameter?", default=False):
+            tx_params['era'] = IntPrompt.ask("Enter era value (legacy parameter)", default=1)
+        return tx_params
+
+    def _prompt_distribution_params(self) -> Dict:
+        console.print("\n[bold]Timing Distribution Range[/bold]")
+        console.print("Enter the range of timing values to distribute across coldkeys")
+        params = {
+            'min_timing': IntPrompt.ask("Minimum timing value (e.g. -20)", default=-20),
+            'max_timing': IntPrompt.ask("Maximum timing value (e.g. 0)", default=0),
+            'use_period': False,
+            'min_period': None,
+            'max_period': None,
+            'use_era': False,
+            'min_era': None,
+            'max_era': None
+        }
+        
+        console.print("\n[bold]Transaction Validity Configuration[/bold]")
+        console.print("Select options for transaction validity:")
+        console.print("1. Use period only (recommended, new parameter)")
+        console.print("2. Use era only (legacy parameter)")
+        console.print("3. Use both period and era")
+        console.print("4. Don't use any")
+        tx_param_choice = IntPrompt.ask("Select option", default=1)
+        
+        if tx_param_choice == 1 or tx_param_choice == 3:
+            params['use_period'] = True
+            console.print("\n[bold]Period Distribution Range[/bold]")
+            console.print("Enter the range of period values to distribute across coldkeys (number of blocks transaction is valid for)")
+            params['min_period'] = IntPrompt.ask("Minimum period value (e.g. 1)", default=1)
+            params['max_period'] = IntPrompt.ask("Maximum period value (e.g. 3)", default=3)
+        
+        if tx_param_choice == 2 or tx_param_choice == 3:
+            params['use_era'] = True
+            console.print("\n[bold]ERA Distribution Range[/bold]")
+            console.print("Enter the range of era values to distribute across coldkeys (number of blocks transaction is valid for)")
+            params['min_era'] = IntPrompt.ask("Minimum era value (e.g. 1)", default=1)
+            params['max_era'] = IntPrompt.ask("Maximum era value (e.g. 3)", default=3)
+        
+        params['coldkey_delay'] = 0
+        if Confirm.ask("Add delay between transactions from the same coldkey?", default=True):
+            params['coldkey_delay'] = IntPrompt.ask("Delay between transactions from the same coldkey (seconds)", default=6)
+        
+        return params
+
+    def _distribute_timing(self, all_wallet_info: Dict[str, List[str]], wallet_passwords: Dict[str, str], params: Dict):
+        use_period = params['use_period']
+        use_era = params['use_era']
+        coldkeys_count = len(all_wallet_info)
+        hotkeys_per_coldkey = [len(hotkeys) for hotkeys in all_wallet_info.values()]
+        
+        console.print(f"\n[cyan]Distributing timing values across {coldkeys_count} coldkeys with {sum(hotkeys_per_coldkey)} total hotkeys...[/cyan]")
+        
+        timing_values, period_values, era_values = self.registration_manager.spread_timing_across_hotkeys(
+            coldkeys_count,
+            hotkeys_per_coldkey,
+            params['min_timing'],
+            params['max_timing'],
+            params['coldkey_delay'],
+            params['min_period'] if use_period else None,
+            params['max_period'] if use_period else None,
+            params['min_era'] if use_era else None,
+            params['max_era'] if use_era else None
+        )
+        
+        title_parts = ["Timing"]
+        columns = ["Wallet", "Hotkey", "Timing"]
+        if use_period:
+            title_parts.append("Period")
+            columns.append("Period")
+        if use_era:
+            title_parts.append("ERA")
+            columns.append("ERA")
+        columns.append("Transaction Order")
+        
+        table = Table(title=" and ".join(title_parts) + " Distribution")
+        for column in columns:
+            table.add_column(column)
+        
+        records = []
+        
+        for idx, (wallet, hotkeys) in enumerate(all_wallet_info.items()):
+            coldkey_timings = timing_values[idx]
+            
+            for hotkey_idx, hotkey in enumerate(hotkeys):
+                timing = coldkey_timings[hotkey_idx]
+                
+                cfg = {
+                    'coldkey': wallet,
+                    'hotkey': hotkey,
+                    'password': wallet_passwords[wallet],
+                    'prep_time': timing
+                }
+                
+                transaction_data = [wallet, hotkey, timing]
+                
+                if use_period:
+                    period_val = period_values[idx][hotkey_idx]
+                    cfg['period'] = period_val
+                    transaction_data.append(period_val)
+                
+                if use_era:
+                    era_val = era_values[idx][hotkey_idx]
+                    cfg['era'] = era_val
+                    transaction_data.append(era_val)
+                
+                records.append((timing, cfg, tuple(transaction_data)))
+        
+        records.sort(key=itemgetter(0))
+        wallet_configs = [record[1] for record in records]
+        all_transaction_timings = [record[2] for record in records]
+        
+        rows = [
+            (wallet, hotkey, f"{timing}s", *map(str, extra), str(order))
+            for order, (wallet, hotkey, timing, *extra) in enumerate(all_transaction_timings, 1)
+        ]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        
+        console.print(table)
+        return wallet_configs, timing_values, period_values, era_values
+
+    def _prompt_retry_and_block_selection(self):
+        retry_on_failure = Confirm.ask(
+            "Automatically retry failed registrations with adjusted timing?",
+            default=True
+        )
+        
+        max_retry_attempts = 0
+        if retry_on_failure:
+            max_retry_attempts = IntPrompt.ask(
+                "Maximum retry attempts per registration",
+                default=3
+            )
+        
+        console.print("\n[bold]Block Selection Method[/bold]")
+        console.print("1. Automatic (use next adjustment block)")
+        console.print("2. Manual (specify a block number)")
+        block_selection_method = IntPrompt.ask("Select option", default=1)
+        
+        target_block = None
+        if block_selection_method == 2:
+            target_block = IntPrompt.ask("Enter the target block number", default=0)
+            
+            console.print(f"\n[yellow]You have chosen to register at block {target_block}.[/yellow]")
+            if not Confirm.ask("Are you sure you want to use this block?", default=True):
+                target_block = None
+                block_selection_method = 1
+        
+        return retry_on_failure, max_retry_attempts, block_selection_method, target_block
+
     def show(self):
+        try:
+            self._show()
+        finally:
+            self._finish_password_checks()
+
+    def _show(self):
+        self._hotkeys_cache.clear()
         console.print("\n[bold]Register Wallets[/bold]")
         console.print(Panel.fit(
            "1. Simple Registration (Immediate)\n"
@@ -73,8 +447,7 @@ class RegistrationMenu:
             return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
 
         console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3)")
         selection = Prompt.ask("Selection").strip()
@@ -91,57 +464,20 @@ class RegistrationMenu:
             target_subnet = IntPrompt.ask("Target Subnet ID")
 
             wallet_configs = []
-            for wallet in selected_wallets:
-                password = self._get_wallet_password(wallet)
-                if not self.registration_manager.verify_wallet_password(wallet, password):
-                    console.print(f"[red]Invalid password for {wallet}[/red]")
-                    continue
-
-                hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet)
-                if not hotkeys:
-                    console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
-                    continue
-
-                console.print(f"\nHotkeys for wallet {wallet}:")
-                for hotkey in hotkeys:
-                    console.print(f"  • {hotkey}")
-
-                console.print("\nSelect hotkeys (comma-separated names or 'all')")
-                hotkey_selection = Prompt.ask("Selection").strip()
-
-                if hotkey_selection.lower() == 'all':
-                    selected_hotkeys = hotkeys
-                else:
-                    selected_hotkeys = [h.strip() for h in hotkey_selection.split(',') if h.strip() in hotkeys]
-
-                if not selected_hotkeys:
-                    console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
+            wallet_passwords = self._collect_wallet_passwords(selected_wallets)
+            for wallet, password in wallet_passwords.items():
+                selected_hotkeys = self._select_hotkeys(wallet)
+                if not selected_hotkeys or not self._password_valid(wallet):
                     continue
 
-                console.print("\n[bold]Transaction Validity Parameters[/bold]")
-                use_period = Confirm.ask("Use period parameter?", default=True)
-                period_value = None
-                if use_period:
-                    period_value = IntPrompt.ask("Enter period value (blocks transaction remains valid)", default=16)
-                
-                use_era = Confirm.ask("Use era parameter?", default=False)
-                era_value = None
-                if use_era:
-                    era_value = IntPrompt.ask("Enter era value (legacy parameter)", default=1)
-
+                tx_params = self._prompt_tx_validity()
                 for hotkey in selected_hotkeys:
-                    config = {
+                    wallet_configs.append({
                         'coldkey': wallet,
                         'hotkey': hotkey,
-                        'password': password
-                    }
-                    
-                    if period_value is not None:
-                        config['period'] = period_value
-                    if era_value is not None:
-                        config['era'] = era_value
-                        
-                    wallet_configs.append(config)
+                        'password': password,
+                        **tx_params
+                    })
 
             if wallet_configs:
                 try:
@@ -151,7 +487,7 @@ class RegistrationMenu:
                     if rpc_endpoint:
                         console.print(f"[yellow]Using custom RPC endpoint: {rpc_endpoint}[/yellow]")
                         
-                    asyncio.run(self.registration_manager.start_degen_registration(
+                    self._loop.run_until_complete(self.registration_manager.start_degen_registration(
                         wallet_configs=wallet_configs,
                         target_subnet=target_subnet,
                         background_mode=False,
@@ -165,63 +501,25 @@ class RegistrationMenu:
         subnet_id = IntPrompt.ask("Enter subnet ID for registration", default=1)
 
         if mode == 1:
-            for wallet in selected_wallets:
+            wallet_passwords = self._collect_wallet_passwords(selected_wallets)
+            for wallet, password in wallet_passwords.items():
                 wallet_configs = []
-                password = self._get_wallet_password(wallet)
-
-                if not self.registration_manager.verify_wallet_password(wallet, password):
-                    console.print(f"[red]Invalid password for {wallet}[/red]")
-                    continue
-
-                hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet)
-                if not hotkeys:
-                    console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
-                    continue
-
-                console.print(f"\nHotkeys for wallet {wallet}:")
-                for hotkey in hotkeys:
-                    console.print(f"  • {hotkey}")
-
-                console.print("\nSelect hotkeys (comma-separated names or 'all')")
-                hotkey_selection = Prompt.ask("Selection").strip()
-
-                if hotkey_selection.lower() == 'all':
-                    selected_hotkeys = hotkeys
-                else:
-                    selected_hotkeys = [h.strip() for h in hotkey_selection.split(',') if h.strip() in hotkeys]
-
-                if not selected_hotkeys:
-                    console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
+                selected_hotkeys = self._select_hotkeys(wallet)
+                if not selected_hotkeys or not self._password_valid(wallet):
                     continue
 
-                console.print("\n[bold]Transaction Validity Parameters[/bold]")
-                use_period = Confirm.ask("Use period parameter?", default=True)
-                period_value = None
-                if use_period:
-                    period_value = IntPrompt.ask("Enter period value (blocks transaction remains valid)", default=16)
-                
-                use_era = Confirm.ask("Use era parameter?", default=False)
-                era_value = None
-                if use_era:
-                    era_value = IntPrompt.ask("Enter era value (legacy parameter)", default=1)
-
+                tx_params = self._prompt_tx_validity()
                 for hotkey in selected_hotkeys:
-                    config = {
+                    wallet_configs.append({
                         'coldkey': wallet,
                         'hotkey': hotkey,
                         'password': password,
-                        'prep_time': 15
-                    }
-                    
-                    if period_value is not None:
-                        config['period'] = period_value
-                    if era_value is not None:
-                        config['era'] = era_value
-                        
-                    wallet_configs.append(config)
+                        'prep_time': 15,
+                        **tx_params
+                    })
 
                 try:
-                    asyncio.run(self.registration_manager.start_registration(
+                    self._loop.run_until_complete(self.registration_manager.start_registration(
                         wallet_configs=wallet_configs,
                         subnet_id=subnet_id,
                         start_block=0,
@@ -233,38 +531,12 @@ class RegistrationMenu:
 
         elif mode == 2:
             all_wallet_info = {}
-            wallet_passwords = {}
+            wallet_passwords = self._collect_wallet_passwords(selected_wallets)
             
-            for wallet in selected_wallets:
-                password = self._get_wallet_password(wallet)
-                if not self.registration_manager.verify_wallet_password(wallet, password):
-                    console.print(f"[red]Invalid password for {wallet}[/red]")
-                    continue
-                    
-                wallet_passwords[wallet] = password
-                
-                hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet)
-                if not hotkeys:
-                    console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
-                    continue
-
-                console.print(f"\nHotkeys for wallet {wallet}:")
-                for hotkey in hotkeys:
-                    console.print(f"  • {hotkey}")
-
-                console.print("\nSelect hotkeys (comma-separated names or 'all')")
-                hotkey_selection = Prompt.ask("Selection").strip()
-
-                if hotkey_selection.lower() == 'all':
-                    selected_hotkeys = hotkeys
-                else:
-                    selected_hotkeys = [h.strip() for h in hotkey_selection.split(',') if h.strip() in hotkeys]
-                
-                if selected_hotkeys:
+            for wallet in wallet_passwords:
+                selected_hotkeys = self._select_hotkeys(wallet)
+                if selected_hotkeys and self._password_valid(wallet):
                     all_wallet_info[wallet] = selected_hotkeys
-                else:
-                    console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
-                    continue
             
             if not all_wallet_info:
                 console.print("[red]No valid wallet/hotkey combinations selected![/red]")
@@ -275,121 +547,19 @@ class RegistrationMenu:
                 default=3
             )
             
-            console.print("\n[bold]Timing Distribution Range[/bold]")
-            console.print("Enter the range of timing values to distribute across coldkeys")
-            min_timing = IntPrompt.ask("Minimum timing value (e.g. -20)", default=-20)
-            max_timing = IntPrompt.ask("Maximum timing value (e.g. 0)", default=0)
-            
-            console.print("\n[bold]Transaction Validity Configuration[/bold]")
-            console.print("Select options for transaction validity:")
-            console.print("1. Use period only (recommended, new parameter)")
-            console.print("2. Use era only (legacy parameter)")
-            console.print("3. Use both period and era")
-            console.print("4. Don't use any")
-            tx_param_choice = IntPrompt.ask("Select option", default=1)
-            
-            use_period = False
-            use_era = False
-            min_period = None
-            max_period = None
-            min_era = None
-            max_era = None
-            
-            if tx_param_choice == 1 or tx_param_choice == 3:
-                use_period = True
-                console.print("\n[bold]Period Distribution Range[/bold]")
-                console.print("Enter the range of period values to distribute across coldkeys (number of blocks transaction is valid for)")
-                min_period = IntPrompt.ask("Minimum period value (e.g. 1)", default=1)
-                max_period = IntPrompt.ask("Maximum period value (e.g. 3)", default=3)
-            
-            if tx_param_choice == 2 or tx_param_choice == 3:
-                use_era = True
-                console.print("\n[bold]ERA Distribution Range[/bold]")
-                console.print("Enter the range of era values to distribute across coldkeys (number of blocks transaction is valid for)")
-                min_era = IntPrompt.ask("Minimum era value (e.g. 1)", default=1)
-                max_era = IntPrompt.ask("Maximum era value (e.g. 3)", default=3)
-            
-            use_coldkey_delay = Confirm.ask("Add delay between transactions from the same coldkey?", default=True)
-            coldkey_delay = 6
-            if use_coldkey_delay:
-                coldkey_delay = IntPrompt.ask("Delay between transactions from the same coldkey (seconds)", default=6)
-            else:
-                coldkey_delay = 0
-            
-            coldkeys_count = len(all_wallet_info)
-            hotkeys_per_coldkey = [len(hotkeys) for coldkey, hotkeys in all_wallet_info.items()]
-            
-            console.print(f"\n[cyan]Distributing timing values across {coldkeys_count} coldkeys with {sum(hotkeys_per_coldkey)} total hotkeys...[/cyan]")
-            
-            timing_values, period_values, era_values = self.registration_manager.spread_timing_across_hotkeys(
-                coldkeys_count,
-                hotkeys_per_coldkey,
-                min_timing,
-                max_timing,
-                coldkey_delay,
-                min_period if use_period else None,
-                max_period if use_period else None,
-                min_era if use_era else None,
-                max_era if use_era else None
+            params = self._prompt_distribution_params()
+            wallet_configs, timing_values, period_values, era_values = self._distribute_timing(
+                all_wallet_info, wallet_passwords, params
             )
             
             wallet_config_dict = {}
             hotkey_attempts = {}
             
-            title_parts = ["Timing"]
-            if use_period:
-                title_parts.append("Period")
-            if use_era:
-                title_parts.append("ERA")
-            table_title = " and ".join(title_parts) + " Distribution"
-            
-            table = Table(title=table_title)
-            table.add_column("Wallet")
-            table.add_column("Hotkey")
-            table.add_column("Timing")
-            if use_period:
-                table.add_column("Period")
-            if use_era:
-                table.add_column("ERA")
-            table.add_column("Transaction Order")
-            
-            all_transaction_timings = []
-            wallet_configs = []
-            
             for idx, (wallet, hotkeys) in enumerate(all_wallet_info.items()):
                 coldkey_timings = timing_values[idx]
                 
-                wallet_transactions = []
-                for hotkey_idx, hotkey in enumerate(hotkeys):
-                    timing = coldkey_timings[hotkey_idx]
-                    
-                    cfg = {
-                        'coldkey': wallet,
-                        'hotkey': hotkey,
-                        'password': wallet_passwords[wallet],
-                        'prep_time': timing
-                    }
-                    
-                    transaction_data = [wallet, hotkey, timing]
-                    
-                    if use_period:
-                        period_val = period_values[idx][hotkey_idx]
-                        cfg['period'] = period_val
-                        transaction_data.append(period_val)
-                    
-                    if use_era:
-                        era_val = era_values[idx][hotkey_idx]
-                        cfg['era'] = era_val
-                        transaction_data.append(era_val)
-                    
-                    wallet_transactions.append(cfg)
-                    all_transaction_timings.append(tuple(transaction_data))
-                    
-                    key = f"{wallet}:{hotkey}"
-                    hotkey_attempts[key] = attempts_per_hotkey
-                
-                wallet_transactions.sort(key=lambda x: x['prep_time'])
-                wallet_configs.extend(wallet_transactions)
+                for hotkey in hotkeys:
+                    hotkey_attempts[f"{wallet}:{hotkey}"] = attempts_per_hotkey
                 
                 config_dict_entry = {
                     'hotkeys': hotkeys,
@@ -400,52 +570,18 @@ class RegistrationMenu:
                     'max_attempts': attempts_per_hotkey
                 }
                 
-                if use_period:
-                    config_dict_entry['period'] = period_values[idx][0] if idx in period_values else min_period
-                if use_era:
-                    config_dict_entry['era'] = era_values[idx][0] if idx in era_values else min_era
+                if params['use_period']:
+                    config_dict_entry['period'] = period_values[idx][0] if idx in period_values else params['min_period']
+                if params['use_era']:
+                    config_dict_entry['era'] = era_values[idx][0] if idx in era_values else params['min_era']
                     
                 wallet_config_dict[wallet] = config_dict_entry
             
-            all_transaction_timings.sort(key=lambda x: x[2])
-            
-            for order, transaction_data in enumerate(all_transaction_timings, 1):
-                row_data = list(transaction_data)
-                row_data.append(str(order))
-                table.add_row(*[str(item) if not isinstance(item, float) and not isinstance(item, int) else 
-                            (f"{item}s" if i == 2 else str(item)) for i, item in enumerate(row_data)])
-            
-            console.print(table)
-            
-            retry_on_failure = Confirm.ask(
-                "Automatically retry failed registrations with adjusted timing?",
-                default=True
-            )
-            
-            max_retry_attempts = 0
-            if retry_on_failure:
-                max_retry_attempts = IntPrompt.ask(
-                    "Maximum retry attempts per registration",
-                    default=3
-                )
-            
-            console.print("\n[bold]Block Selection Method[/bold]")
-            console.print("1. Automatic (use next adjustment block)")
-            console.print("2. Manual (specify a block number)")
-            block_selection_method = IntPrompt.ask("Select option", default=1)
-            
-            target_block = None
-            if block_selection_method == 2:
-                target_block = IntPrompt.ask("Enter the target block number", default=0)
-                
-                console.print(f"\n[yellow]You have chosen to register at block {target_block}.[/yellow]")
-                if not Confirm.ask("Are you sure you want to use this block?", default=True):
-                    target_block = None
-                    block_selection_method = 1
+            retry_on_failure, max_retry_attempts, block_selection_method, target_block = self._prompt_retry_and_block_selection()
             
             try:
                 if block_selection_method == 1:
-                    reg_info = self.registration_manager.get_registration_info(subnet_id)
+                    reg_info = self._get_registration_info(subnet_id)
                     if reg_info:
                         self.registration_manager._display_registration_info(reg_info)
                         target_block = reg_info['next_adjustment_block']
@@ -463,7 +599,7 @@ class RegistrationMenu:
                             return
                 
                 if Confirm.ask("Proceed with Auto Registration?"):
-                    asyncio.run(self.registration_manager.start_auto_registration(
+                    self._loop.run_until_complete(self.registration_manager.start_auto_registration(
                         wallet_config_dict,
                         hotkey_attempts,
                         subnet_id,
@@ -488,54 +624,35 @@ class RegistrationMenu:
                 console.print("[red]No valid wallet selected![/red]")
                 return
                     
-            hotkeys = self.wallet_utils.get_wallet_hotkeys(sample_wallet)
+            hotkeys = self._get_hotkeys(sample_wallet)
             if not hotkeys:
                 console.print(f"[red]No hotkeys found for sample wallet {sample_wallet}![/red]")
                 return
 
-            default_password = self.config.get('wallet.default_password')
-            common_password = None
-            if default_password:
-                common_password = Prompt.ask(
-                    f"Enter password for all wallets (press Enter to use default: {default_password})", 
-                    password=True,
-                    show_default=False
-                )
-                common_password = common_password if common_password else default_password
-            else:
-                common_password = Prompt.ask("Enter password for all wallets", password=True)
-                
-            invalid_wallets = []
-            for wallet in selected_wallets:
-                if not self.registration_manager.verify_wallet_password(wallet, common_password):
-                    invalid_wallets.append(wallet)
-            
-            if invalid_wallets:
-                console.print(f"[red]Password is invalid for wallets: {', '.join(invalid_wallets)}[/red]")
-                return
+            common_password = self._get_common_password()
+            self._start_password_checks({wallet: common_password for wallet in selected_wallets})
             
             console.print(f"\nHotkeys found for wallet {sample_wallet}:")
-            for i, hotkey in enumerate(hotkeys, 1):
-                console.print(f"{i}. {hotkey}")
+            print_indexed(hotkeys)
 
             console.print("\nSelect hotkeys to use for ALL wallets (comma-separated numbers, e.g. 1,3,5)")
             hotkey_selection = Prompt.ask("Selection").strip()
 
-            try:
-                hotkey_indices = [int(i.strip()) - 1 for i in hotkey_selection.split(',')]
-                
-                if not hotkey_indices:
-                    console.print("[red]No valid hotkey selection![/red]")
-                    return
-                    
-            except:
+            hotkey_indices = self.wallet_utils.parse_index_selection(hotkey_selection, len(hotkeys))
+            if not hotkey_indices:
                 console.print(f"[red]Invalid hotkey selection![/red]")
                 return
+            
+            invalid_wallets = [wallet for wallet, is_valid in self._finish_password_checks().items() if not is_valid]
+            
+            if invalid_wallets:
+                console.print(f"[red]Password is invalid for wallets: {', '.join(invalid_wallets)}[/red]")
+                return
                 
             for wallet in selected_wallets:
                 wallet_passwords[wallet] = common_password
                 
-                wallet_hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet)
+                wallet_hotkeys = self._get_hotkeys(wallet)
                 if not wallet_hotkeys:
                     console.print(f"[yellow]No hotkeys found for wallet {wallet}, skipping...[/yellow]")
                     continue
@@ -556,156 +673,14 @@ class RegistrationMenu:
                 
             console.print(f"\n[cyan]Successfully processed {len(all_wallet_info)} wallets with a total of {sum(len(hotkeys) for hotkeys in all_wallet_info.values())} hotkeys[/cyan]")
                 
-            console.print("\n[bold]Timing Distribution Range[/bold]")
-            console.print("Enter the range of timing values to distribute across coldkeys")
-            min_timing = IntPrompt.ask("Minimum timing value (e.g. -20)", default=-20)
-            max_timing = IntPrompt.ask("Maximum timing value (e.g. 0)", default=0)
-            
-            console.print("\n[bold]Transaction Validity Configuration[/bold]")
-            console.print("Select options for transaction validity:")
-            console.print("1. Use period only (recommended, new parameter)")
-            console.print("2. Use era only (legacy parameter)")
-            console.print("3. Use both period and era")
-            console.print("4. Don't use any")
-            tx_param_choice = IntPrompt.ask("Select option", default=1)
-            
-            use_period = False
-            use_era = False
-            min_period = None
-            max_period = None
-            min_era = None
-            max_era = None
-            
-            if tx_param_choice == 1 or tx_param_choice == 3:
-                use_period = True
-                console.print("\n[bold]Period Distribution Range[/bold]")
-                console.print("Enter the range of period values to distribute across coldkeys (number of blocks transaction is valid for)")
-                min_period = IntPrompt.ask("Minimum period value (e.g. 1)", default=1)
-                max_period = IntPrompt.ask("Maximum period value (e.g. 3)", default=3)
-            
-            if tx_param_choice == 2 or tx_param_choice == 3:
-                use_era = True
-                console.print("\n[bold]ERA Distribution Range[/bold]")
-                console.print("Enter the range of era values to distribute across coldkeys (number of blocks transaction is valid for)")
-                min_era = IntPrompt.ask("Minimum era value (e.g. 1)", default=1)
-                max_era = IntPrompt.ask("Maximum era value (e.g. 3)", default=3)
-            
-            use_coldkey_delay = Confirm.ask("Add delay between transactions from the same coldkey?", default=True)
-            coldkey_delay = 6
-            if use_coldkey_delay:
-                coldkey_delay = IntPrompt.ask("Delay between transactions from the same coldkey (seconds)", default=6)
-            else:
-                coldkey_delay = 0
-            
-            coldkeys_count = len(all_wallet_info)
-            hotkeys_per_coldkey = [len(hotkeys) for coldkey, hotkeys in all_wallet_info.items()]
-            
-            console.print(f"\n[cyan]Distributing timing values across {coldkeys_count} coldkeys with {sum(hotkeys_per_coldkey)} total hotkeys...[/cyan]")
-            
-            timing_values, period_values, era_values = self.registration_manager.spread_timing_across_hotkeys(
-                coldkeys_count,
-                hotkeys_per_coldkey,
-                min_timing,
-                max_timing,
-                coldkey_delay,
-                min_period if use_period else None,
-                max_period if use_period else None,
-                min_era if use_era else None,
-                max_era if use_era else None
-            )
+            params = self._prompt_distribution_params()
+            wallet_configs, _, _, _ = self._distribute_timing(all_wallet_info, wallet_passwords, params)
             
-            wallet_configs = []
-            
-            title_parts = ["Timing"]
-            if use_period:
-                title_parts.append("Period")
-            if use_era:
-                title_parts.append("ERA")
-            table_title = " and ".join(title_parts) + " Distribution"
-            
-            table = Table(title=table_title)
-            table.add_column("Wallet")
-            table.add_column("Hotkey")
-            table.add_column("Timing")
-            if use_period:
-                table.add_column("Period")
-            if use_era:
-                table.add_column("ERA")
-            table.add_column("Transaction Order")
-            
-            all_transaction_timings = []
-            
-            for idx, (wallet, hotkeys) in enumerate(all_wallet_info.items()):
-                coldkey_timings = timing_values[idx]
-                
-                wallet_transactions = []
-                for hotkey_idx, hotkey in enumerate(hotkeys):
-                    timing = coldkey_timings[hotkey_idx]
-                    
-                    cfg = {
-                        'coldkey': wallet,
-                        'hotkey': hotkey,
-                        'password': wallet_passwords[wallet],
-                        'prep_time': timing
-                    }
-                    
-                    transaction_data = [wallet, hotkey, timing]
-                    
-                    if use_period:
-                        period_val = period_values[idx][hotkey_idx]
-                        cfg['period'] = period_val
-                        transaction_data.append(period_val)
-                    
-                    if use_era:
-                        era_val = era_values[idx][hotkey_idx]
-                        cfg['era'] = era_val
-                        transaction_data.append(era_val)
-                    
-                    wallet_transactions.append(cfg)
-                    all_transaction_timings.append(tuple(transaction_data))
-                
-                wallet_transactions.sort(key=lambda x: x['prep_time'])
-                wallet_configs.extend(wallet_transactions)
-            
-            all_transaction_timings.sort(key=lambda x: x[2])
-            
-            for order, transaction_data in enumerate(all_transaction_timings, 1):
-                row_data = list(transaction_data)
-                row_data.append(str(order))
-                table.add_row(*[str(item) if not isinstance(item, float) and not isinstance(item, int) else 
-                            (f"{item}s" if i == 2 else str(item)) for i, item in enumerate(row_data)])
-            
-            console.print(table)
-            
-            retry_on_failure = Confirm.ask(
-                "Automatically retry failed registrations with adjusted timing?",
-                default=True
-            )
-            
-            max_retry_attempts = 0
-            if retry_on_failure:
-                max_retry_attempts = IntPrompt.ask(
-                    "Maximum retry attempts per registration",
-                    default=3
-                )
-                
-            console.print("\n[bold]Block Selection Method[/bold]")
-            console.print("1. Automatic (use next adjustment block)")
-            console.print("2. Manual (specify a block number)")
-            block_selection_method = IntPrompt.ask("Select option", default=1)
-            
-            target_block = None
-            if block_selection_method == 2:
-                target_block = IntPrompt.ask("Enter the target block number", default=0)
-                
-                console.print(f"\n[yellow]You have chosen to register at block {target_block}.[/yellow]")
-                if not Confirm.ask("Are you sure you want to use this block?", default=True):
-                    target_block = None
-                    block_selection_method = 1
+            retry_on_failure, max_retry_attempts, block_selection_method, target_block = self._prompt_retry_and_block_selection()
             
             try:
                 if block_selection_method == 1:
-                    reg_info = self.registration_manager.get_registration_info(subnet_id)
+                    reg_info = self._get_registration_info(subnet_id)
                     if reg_info:
                         self.registration_manager._display_registration_info(reg_info)
                         self.registration_manager._display_registration_config(wallet_configs, subnet_id, reg_info)
@@ -731,23 +706,23 @@ class RegistrationMenu:
                     manual_config_table.add_column("Hotkeys Count")
                     manual_config_table.add_column("Timing Range")
                     
-                    if use_period:
+                    if params['use_period']:
                         manual_config_table.add_column("Period Range")
-                    if use_era:
+                    if params['use_era']:
                         manual_config_table.add_column("ERA Range")
                     
                     row_values = [
                         str(subnet_id),
                         str(target_block),
                         str(len(all_wallet_info)),
-                        str(sum(hotkeys_per_coldkey)),
-                        f"{min_timing}s to {max_timing}s"
+                        str(len(wallet_configs)),
+                        f"{params['min_timing']}s to {params['max_timing']}s"
                     ]
                     
-                    if use_period:
-                        row_values.append(f"{min_period} to {max_period}")
-                    if use_era:
-                        row_values.append(f"{min_era} to {max_era}")
+                    if params['use_period']:
+                        row_values.append(f"{params['min_period']} to {params['max_period']}")
+                    if params['use_era']:
+                        row_values.append(f"{params['min_era']} to {params['max_era']}")
                     
                     manual_config_table.add_row(*row_values)
                     
@@ -755,8 +730,8 @@ class RegistrationMenu:
                     start_block = target_block
                 
                 if Confirm.ask("Proceed with registration?"):
-                    max_prep_time = max(abs(cfg['prep_time']) for cfg in wallet_configs)
-                    results = asyncio.run(
+                    max_prep_time = max(abs(wallet_configs[0]['prep_time']), abs(wallet_configs[-1]['prep_time']))
+                    results = self._loop.run_until_complete(
                         self.registration_manager.start_registration(
                             wallet_configs=wallet_configs,
                             subnet_id=subnet_id,
@@ -801,58 +776,21 @@ class RegistrationMenu:
             max_cost = IntPrompt.ask("Maximum registration cost in TAO (0 for no limit)", default=0)
             
             wallet_configs = []
-            for wallet in selected_wallets:
-                password = self._get_wallet_password(wallet)
-                if not self.registration_manager.verify_wallet_password(wallet, password):
-                    console.print(f"[red]Invalid password for {wallet}[/red]")
-                    continue
-
-                hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet)
-                if not hotkeys:
-                    console.print(f"[red]No hotkeys found for wallet {wallet}![/red]")
-                    continue
-
-                console.print(f"\nHotkeys for wallet {wallet}:")
-                for hotkey in hotkeys:
-                    console.print(f"  • {hotkey}")
-
-                console.print("\nSelect hotkeys (comma-separated names or 'all')")
-                hotkey_selection = Prompt.ask("Selection").strip()
-
-                if hotkey_selection.lower() == 'all':
-                    selected_hotkeys = hotkeys
-                else:
-                    selected_hotkeys = [h.strip() for h in hotkey_selection.split(',') if h.strip() in hotkeys]
-
-                if not selected_hotkeys:
-                    console.print(f"[red]No valid hotkeys selected for {wallet}![/red]")
+            wallet_passwords = self._collect_wallet_passwords(selected_wallets)
+            for wallet, password in wallet_passwords.items():
+                selected_hotkeys = self._select_hotkeys(wallet)
+                if not selected_hotkeys or not self._password_valid(wallet):
                     continue
 
-                console.print("\n[bold]Transaction Validity Parameters[/bold]")
-                use_period = Confirm.ask("Use period parameter?", default=True)
-                period_value = None
-                if use_period:
-                    period_value = IntPrompt.ask("Enter period value (blocks transaction remains valid)", default=16)
-                
-                use_era = Confirm.ask("Use era parameter?", default=False)
-                era_value = None
-                if use_era:
-                    era_value = IntPrompt.ask("Enter era value (legacy parameter)", default=1)
-
+                tx_params = self._prompt_tx_validity()
                 for hotkey in selected_hotkeys:
-                    config = {
+                    wallet_configs.append({
                         'coldkey': wallet,
                         'hotkey': hotkey,
                         'password': password,
-                        'prep_time': -4
-                    }
-                    
-                    if period_value is not None:
-                        config['period'] = period_value
-                    if era_value is not None:
-                        config['era'] = era_value
-                        
-                    wallet_configs.append(config)
+                        'prep_time': -4,
+                        **tx_params
+                    })
             
             if not wallet_configs:
                 console.print("[red]No valid wallet/hotkey configurations![/red]")
@@ -863,7 +801,7 @@ class RegistrationMenu:
                 console.print(f"[cyan]Checking every {check_interval} seconds for open registration...[/cyan]")
                 console.print("[yellow]Press Ctrl+C to stop monitoring at any time[/yellow]")
                 
-                asyncio.run(self.registration_manager.start_registration_monitor(
+                self._loop.run_until_complete(self.registration_manager.start_registration_monitor(
                     wallet_configs=wallet_configs,
                     subnet_id=subnet_id,
                     check_interval=check_interval,
@@ -883,8 +821,7 @@ class RegistrationMenu:
         
         if len(selected_wallets) > 1:
             console.print("\nAvailable Wallets:")
-            for wallet in selected_wallets:
-                console.print(f"  • {wallet}")
+            _print_items(selected_wallets)
             
             wallet_selection = Prompt.ask("Select one wallet (enter wallet name)").strip()
             
@@ -897,62 +834,41 @@ class RegistrationMenu:
             selected_wallet = selected_wallets[0]
             console.print(f"\nUsing wallet: {selected_wallet}")
         
-        password = self._get_wallet_password(selected_wallet)
-        if not self.registration_manager.verify_wallet_password(selected_wallet, password):
-            console.print(f"[red]Invalid password for {selected_wallet}[/red]")
-            return
+        password = self._collect_wallet_passwords([selected_wallet])[selected_wallet]
         
         if subnet_id is None:
             subnet_id = IntPrompt.ask("Enter subnet ID for registration", default=1)
         
-        hotkeys = self.wallet_utils.get_wallet_hotkeys(selected_wallet)
+        hotkeys = self._get_hotkeys(selected_wallet)
         if not hotkeys:
             console.print(f"[red]No hotkeys found for wallet {selected_wallet}![/red]")
             return
         
         console.print(f"\nHotkeys for wallet {selected_wallet}:")
-        for i, hotkey in enumerate(hotkeys, 1):
-            console.print(f"{i}. {hotkey}")
+        print_indexed(hotkeys)
         
         console.print("\nSelect hotkeys (comma-separated numbers, e.g. 1,2,3,4)")
         hotkey_selection = Prompt.ask("Selection").strip()
         
-        try:
-            hotkey_indices = [int(i.strip()) - 1 for i in hotkey_selection.split(',')]
-            selected_hotkeys = [hotkeys[i] for i in hotkey_indices if 0 <= i < len(hotkeys)]
-        except:
-            console.print(f"[red]Invalid hotkey selection![/red]")
-            return
+        selected_hotkeys = [hotkeys[i] for i in self.wallet_utils.parse_index_selection(hotkey_selection, len(hotkeys))]
                 
         if not selected_hotkeys:
             console.print("[red]No valid hotkeys selected![/red]")
             return
         
-        console.print("\n[bold]Transaction Validity Parameters[/bold]")
-        use_period = Confirm.ask("Use period parameter?", default=True)
-        period_value = None
-        if use_period:
-            period_value = IntPrompt.ask("Enter period value (blocks transaction remains valid)", default=16)
-        
-        use_era = Confirm.ask("Use era parameter?", default=False)
-        era_value = None
-        if use_era:
-            era_value = IntPrompt.ask("Enter era value (legacy parameter)", default=1)
+        if not self._password_valid(selected_wallet):
+            return
         
-        wallet_configs = []
-        for hotkey in selected_hotkeys:
-            config = {
+        tx_params = self._prompt_tx_validity()
+        wallet_configs = [
+            {
                 'coldkey': selected_wallet,
                 'hotkey': hotkey,
-                'password': password
+                'password': password,
+                **tx_params
             }
-            
-            if period_value is not None:
-                config['period'] = period_value
-            if era_value is not None:
-                config['era'] = era_value
-                
-            wallet_configs.append(config)
+            for hotkey in selected_hotkeys
+        ]
         
         target_price = float(Prompt.ask("Enter target price threshold in TAO (e.g. 0.04)", default="0.04"))
         check_interval = IntPrompt.ask("Enter check interval in seconds", default=5)
@@ -1054,8 +970,7 @@ class WalletCreationMenu:
             return
 
         console.print("\n[bold]Available Wallets:[/bold]")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
 
         console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3 or 'all')")
         selection = Prompt.ask("Selection").strip()
@@ -1129,29 +1044,70 @@ class StatsMenu:
         self.stats_manager = stats_manager
         self.wallet_utils = wallet_utils
 
-    def _display_wallet_stats(self, stats: Dict):
-        if not stats:
-            return
-
-        total_alpha_usd = 0.0
-        for subnet in stats['subnets']:
-            subnet_rate_usd = subnet['rate_usd']
+    def _build_subnet_table(self, title: str, columns: tuple) -> Table:
+        table = Table(title=title)
+        for name, options in columns:
+            table.add_column(name, **options)
+        return table
+
+    def _aggregate_stats(self, stats: Dict) -> Dict:
+        subnets = stats['subnets']
+        daily_rewards_usd = 0.0
+        active_neurons = 0
+        unregistered_neurons = 0
+        stake_sums = np.zeros(len(subnets))
+
+        for idx, subnet in enumerate(subnets):
+            subnet_stake = 0.0
             for neuron in subnet['neurons']:
-                total_alpha_usd += neuron['stake'] * subnet_rate_usd
+                stake = neuron['stake']
+                subnet_stake += stake
+                daily_rewards_usd += neuron.get('daily_rewards_usd', 0)
+                if stake > 0:
+                    if neuron.get('is_registered', True):
+                        active_neurons += 1
+                    else:
+                        unregistered_neurons += 1
+            stake_sums[idx] = subnet_stake
+
+        rates = np.fromiter((subnet['rate_usd'] for subnet in subnets), dtype=np.float64, count=len(subnets))
 
-        console.print(f"\n[bold]{stats['coldkey']} ({stats['wallet_address']})[/bold]")
-        console.print(f"Balance: {stats['balance']:.9f} τ")
-        daily_rewards = sum(sum(n.get('daily_rewards_usd', 0) for n in subnet['neurons']) for subnet in stats['subnets'])
-        console.print(f"Total daily reward: ${daily_rewards:.2f}")
-        console.print(f"Total Alpha in $: ${total_alpha_usd:.2f}")
+        return {
+            'daily_rewards_usd': daily_rewards_usd,
+            'alpha_usd': float(np.dot(rates, stake_sums)),
+            'active_neurons': active_neurons,
+            'unregistered_neurons': unregistered_neurons,
+            'subnet_ids': [subnet['netuid'] for subnet in stats['subnets']]
+        }
+
+    def _display_wallet_stats(self, stats: Dict, totals: Optional[Dict] = None, hide_zeros: bool = False):
+        if not stats:
+            return
 
-        subnet_netuids = [subnet['netuid'] for subnet in stats['subnets']]
-        console.print(f"[dim]Displaying {len(stats['subnets'])} subnets: {subnet_netuids}[/dim]")
+        if totals is None:
+            totals = self._aggregate_stats(stats)
+        total_alpha_usd = totals['alpha_usd']
+        daily_rewards = totals['daily_rewards_usd']
+        subnet_netuids = totals['subnet_ids']
+        output = [
+            console.render_str(f"\n[bold]{stats['coldkey']} ({stats['wallet_address']})[/bold]"),
+            console.render_str(f"Balance: {stats['balance']:.9f} τ"),
+            console.render_str(f"Total daily reward: ${daily_rewards:.2f}"),
+            console.render_str(f"Total Alpha in $: ${total_alpha_usd:.2f}"),
+            console.render_str(f"[dim]Displaying {len(stats['subnets'])} subnets: {subnet_netuids}[/dim]")
+        ]
 
         for subnet in stats['subnets']:
-            subnet['neurons'].sort(key=lambda x: x['stake'], reverse=True)
+            if not subnet['neurons']:
+                continue
+            if hide_zeros and not any(n['stake'] for n in subnet['neurons']):
+                continue
             
-            has_unregistered = any(not n.get('is_registered', True) for n in subnet['neurons'])
+            neurons = sorted(subnet['neurons'], key=itemgetter('stake'), reverse=True)
+            
+            flags = [n.get('is_registered', True) for n in neurons]
+            has_unregistered = not all(flags)
+            all_unregistered = not any(flags)
             
             subnet_name = ""
             if 'name' in subnet and subnet['name']:
@@ -1159,114 +1115,43 @@ class StatsMenu:
                 if subnet['name'].startswith("Subnet ") and str(subnet['netuid']) in subnet['name']:
                     subnet_name = ""
             
+            title = f"Subnet {subnet['netuid']}{subnet_name} (Rate: ${subnet['rate_usd']:.4f})"
+            
             if has_unregistered:
-                table = Table(title=f"Subnet {subnet['netuid']}{subnet_name} (Rate: ${subnet['rate_usd']:.4f})")
-                table.add_column("Hotkey")
-                table.add_column("Status")
-                table.add_column("UID")
-                table.add_column("Alpha Stake", justify="right")
-                table.add_column("Rank", justify="right")
-                table.add_column("Trust", justify="right")
-                table.add_column("Consensus", justify="right")
-                table.add_column("Incentive", justify="right")
-                if not all(not n.get('is_registered', True) for n in subnet['neurons']):
-                    table.add_column("Emission(ρ)", justify="right") 
-                    table.add_column("Daily Alpha τ", justify="right")
-                    table.add_column("Daily USD", justify="right")
+                if all_unregistered:
+                    table = self._build_subnet_table(title, _MIXED_SUBNET_COLUMNS)
+                    row_cols = _NEURON_BASE_COLS
+                else:
+                    table = self._build_subnet_table(title, _MIXED_SUBNET_COLUMNS + _REWARD_COLUMNS)
+                    row_cols = _NEURON_BASE_COLS + _NEURON_REWARD_COLS
                 
-                for neuron in subnet['neurons']:
-                    is_registered = neuron.get('is_registered', True)
-                    status = "[green]Registered[/green]" if is_registered else "[yellow]Unregistered[/yellow]"
-                    
-                    if is_registered:
-                        table.add_row(
-                            neuron['hotkey'],
-                            status,
-                            str(neuron['uid']),
-                            f"{neuron['stake']:.9f}",
-                            f"{neuron['rank']:.4f}",
-                            f"{neuron['trust']:.4f}",
-                            f"{neuron['consensus']:.4f}",
-                            f"{neuron['incentive']:.4f}",
-                            f"{neuron['emission']}",
-                            f"{neuron['daily_rewards_alpha']:.9f}",
-                            f"${neuron['daily_rewards_usd']:.2f}"
-                        )
-                    else:
-                        if all(not n.get('is_registered', True) for n in subnet['neurons']):
-                            table.add_row(
-                                neuron['hotkey'],
-                                status,
-                                str(neuron.get('uid', 'N/A')),
-                                f"{neuron['stake']:.9f}",
-                                f"{neuron.get('rank', 0):.4f}",
-                                f"{neuron.get('trust', 0):.4f}",
-                                f"{neuron.get('consensus', 0):.4f}",
-                                f"{neuron.get('incentive', 0):.4f}"
-                            )
-                        else:
-                            table.add_row(
-                                neuron['hotkey'],
-                                status,
-                                str(neuron.get('uid', 'N/A')),
-                                f"{neuron['stake']:.9f}",
-                                f"{neuron.get('rank', 0):.4f}",
-                                f"{neuron.get('trust', 0):.4f}",
-                                f"{neuron.get('consensus', 0):.4f}",
-                                f"{neuron.get('incentive', 0):.4f}",
-                                "0",
-                                "0.000000000",
-                                "$0.00"
-                            )
+                for neuron, is_registered in zip(neurons, flags):
+                    table.add_row(
+                        neuron['hotkey'],
+                        _STATUS_REGISTERED if is_registered else _STATUS_UNREGISTERED,
+                        str(neuron.get('uid', 'N/A')),
+                        *_format_neuron_row(neuron, row_cols)
+                    )
             else:
-                table = Table(title=f"Subnet {subnet['netuid']}{subnet_name} (Rate: ${subnet['rate_usd']:.4f})")
-                table.add_column("Hotkey")
-                table.add_column("UID")
-                table.add_column("Alpha Stake", justify="right")
-                table.add_column("Rank", justify="right")
-                table.add_column("Trust", justify="right")
-                table.add_column("Consensus", justify="right")
-                table.add_column("Incentive", justify="right")
-                table.add_column("Dividends", justify="right")
-                table.add_column("Emission(ρ)", justify="right")
-                table.add_column("Daily Alpha τ", justify="right")
-                table.add_column("Daily USD", justify="right")
-
-                for neuron in subnet['neurons']:
+                table = self._build_subnet_table(title, _REGISTERED_SUBNET_COLUMNS)
+                for neuron in neurons:
                     table.add_row(
                         neuron['hotkey'],
                         str(neuron['uid']),
-                        f"{neuron['stake']:.9f}",
-                        f"{neuron['rank']:.4f}",
-                        f"{neuron['trust']:.4f}",
-                        f"{neuron['consensus']:.4f}",
-                        f"{neuron['incentive']:.4f}",
-                        f"{neuron['dividends']:.4f}",
-                        f"{neuron['emission']}",
-                        f"{neuron['daily_rewards_alpha']:.9f}",
-                        f"${neuron['daily_rewards_usd']:.2f}"
+                        *_format_neuron_row(neuron, _NEURON_FULL_COLS)
                     )
 
-            console.print(table)
+            output.append(table)
             
         if 'timestamp' in stats:
             try:
                 timestamp = datetime.fromisoformat(stats['timestamp'])
                 formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                console.print(f"\n[dim]Last updated: {formatted_time}[/dim]")
+                output.append(console.render_str(f"\n[dim]Last updated: {formatted_time}[/dim]"))
             except Exception:
                 pass
 
-    def _parse_wallet_selection(self, selection: str, wallets: List[str]) -> List[str]:
-        if selection.strip().lower() == 'all':
-            return wallets
-            
-        try:
-            indices = [int(i.strip()) - 1 for i in selection.split(',')]
-            return [wallets[i] for i in indices if 0 <= i < len(wallets)]
-        except:
-            console.print("[red]Invalid selection![/red]")
-            return []
+        console.print(Group(*output))
 
     async def show(self):
         while True:
@@ -1292,8 +1177,7 @@ class StatsMenu:
                 return
 
             console.print("\nAvailable Wallets:")
-            for wallet in wallets:
-                console.print(f"  • {wallet}")
+            _print_items(wallets)
 
             console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3 or 'all')")
             selection = Prompt.ask("Selection").strip()
@@ -1315,9 +1199,8 @@ class StatsMenu:
 
             if subnet_choice == 2:
                 subnet_input = Prompt.ask("\nEnter subnet numbers (comma-separated)")
-                try:
-                    subnet_list = [int(s.strip()) for s in subnet_input.split(',')]
-                except:
+                subnet_list = self.wallet_utils.parse_number_list(subnet_input)
+                if subnet_list is None:
                     console.print("[red]Invalid subnet input![/red]")
                     continue
             elif subnet_choice == 3:
@@ -1326,7 +1209,7 @@ class StatsMenu:
             total_balance = 0.0
             total_daily_reward_usd = 0.0
             total_alpha_usd_value = 0.0
-            active_wallets = set()
+            active_wallets = 0
             active_subnets = set()
             active_neurons = 0
             unregistered_neurons = 0
@@ -1337,83 +1220,99 @@ class StatsMenu:
                 TextColumn("[progress.description]{task.description}"),
                 console=console,
                 transient=True
-            ) as progress:
-                task = progress.add_task("[cyan]Processing wallets...", total=len(selected_wallets))
-                
-                for wallet_index, wallet in enumerate(selected_wallets):
-                    progress.update(task, description=f"[cyan]Processing wallet {wallet} ({wallet_index+1}/{len(selected_wallets)})...[/cyan]")
-                    
-                    try:
-                        progress.update(task, description=f"[cyan]Finding active subnets for {wallet}...[/cyan]")
-                        
-                        if subnet_list is None:
-                            active_subnets_list = self.stats_manager.get_active_subnets_direct(wallet)
-                        else:
-                            active_subnets_list = subnet_list
-                        
-                        progress.update(task, description=f"[cyan]Getting data for {wallet} ({len(active_subnets_list)} subnets)...[/cyan]")
-                        
-                        if include_unregistered and (not active_subnets_list or subnet_choice == 1):
-                            unregistered_subnets = self.stats_manager.get_all_unregistered_stake_subnets(wallet)
-                            if unregistered_subnets:
-                                unregistered_subnets_int = [int(netuid) if isinstance(netuid, str) else netuid for netuid in unregistered_subnets]
-                                new_subnets = [s for s in unregistered_subnets_int if s not in active_subnets_list]
-                                if new_subnets:
-                                    active_subnets_list.extend(new_subnets)
-                                    console.print(f"[cyan]Found {len(new_subnets)} additional subnets with unregistered stake for {wallet}: {new_subnets}[/cyan]")
-                                else:
-                                    console.print(f"[cyan]All unregistered stakes are in already detected subnets[/cyan]")
-                        
-                        stats = await self.stats_manager.get_wallet_stats(wallet, active_subnets_list, hide_zeros, include_unregistered)
-                        
-                        if stats:
-                            console.print(f"[green]Completed data collection for {wallet}[/green]")
-                            self._display_wallet_stats(stats)
-                            
-                            total_balance += stats['balance']
-                            
-                            wallet_daily_reward = sum(sum(n.get('daily_rewards_usd', 0) for n in subnet['neurons']) 
-                                                for subnet in stats['subnets'])
-                            total_daily_reward_usd += wallet_daily_reward
-                            
-                            wallet_alpha_usd = 0.0
-                            
-                            if stats['subnets']:
-                                active_wallets.add(wallet)
-                                
-                                for subnet in stats['subnets']:
-                                    subnet_rate_usd = subnet['rate_usd']
-                                    active_subnets.add(subnet['netuid'])
-                                    
-                                    for neuron in subnet['neurons']:
-                                        wallet_alpha_usd += neuron['stake'] * subnet_rate_usd
-                                        if neuron['stake'] > 0:
-                                            if neuron.get('is_registered', True):
-                                                active_neurons += 1
-                                            else:
-                                                unregistered_neurons += 1
-                            
-                            total_alpha_usd_value += wallet_alpha_usd
-                            all_wallet_stats.append(stats)
-                        else:
-                            console.print(f"[yellow]No stats found for wallet {wallet}[/yellow]")
-                    except Exception as e:
-                        console.print(f"[red]Error getting stats for {wallet}: {str(e)}[/red]")
-                    
-                    progress.update(task, advance=1)
+            ) as progress:
+                task = progress.add_task(f"[cyan]Processing {len(selected_wallets)} wallets...", total=len(selected_wallets))
+                results = await self._collect_all_wallet_stats(
+                    selected_wallets, subnet_list, subnet_choice, hide_zeros, include_unregistered, progress, task
+                )
+
+            for wallet, stats in zip(selected_wallets, results):
+                if isinstance(stats, Exception):
+                    console.print(f"[red]Error getting stats for {wallet}: {str(stats)}[/red]")
+                    continue
+                if not stats:
+                    console.print(f"[yellow]No stats found for wallet {wallet}[/yellow]")
+                    continue
+
+                console.print(f"[green]Completed data collection for {wallet}[/green]")
+                totals = self._aggregate_stats(stats)
+                self._display_wallet_stats(stats, totals, hide_zeros)
+                
+                total_balance += stats['balance']
+                total_daily_reward_usd += totals['daily_rewards_usd']
+                total_alpha_usd_value += totals['alpha_usd']
+                active_neurons += totals['active_neurons']
+                unregistered_neurons += totals['unregistered_neurons']
+                
+                if totals['subnet_ids']:
+                    active_wallets += 1
+                    active_subnets.update(totals['subnet_ids'])
+                
+                all_wallet_stats.append(stats)
             
             if all_wallet_stats:
                 self.display_wallets_summary(
                     total_balance, 
                     total_daily_reward_usd, 
                     total_alpha_usd_value,
-                    len(active_wallets),
+                    active_wallets,
                     len(selected_wallets),
                     len(active_subnets),
                     active_neurons,
                     unregistered_neurons
                 )
 
+    def _collect_wallet_stats(self, wallet: str, subnet_list: Optional[List[int]], subnet_choice: int,
+                              hide_zeros: bool, include_unregistered: bool) -> Optional[Dict]:
+        with self.stats_manager.wallet_overview_scope(wallet):
+            if subnet_list is None:
+                active_subnets_list = self.stats_manager.get_active_subnets_direct(wallet)
+            else:
+                active_subnets_list = list(subnet_list)
+        
+            if include_unregistered and (not active_subnets_list or subnet_choice == 1):
+                unregistered_subnets = self.stats_manager.get_all_unregistered_stake_subnets(wallet)
+                if unregistered_subnets:
+                    unregistered_subnets_int = [int(netuid) if isinstance(netuid, str) else netuid for netuid in unregistered_subnets]
+                    new_subnets = [s for s in unregistered_subnets_int if s not in active_subnets_list]
+                    if new_subnets:
+                        active_subnets_list.extend(new_subnets)
+                        console.print(f"[cyan]Found {len(new_subnets)} additional subnets with unregistered stake for {wallet}: {new_subnets}[/cyan]")
+                    else:
+                        console.print(f"[cyan]All unregistered stakes are in already detected subnets[/cyan]")
+        
+            return asyncio.run(self.stats_manager.get_wallet_stats(wallet, active_subnets_list, hide_zeros, include_unregistered))
+
+    async def _collect_all_wallet_stats(self, wallets: List[str], subnet_list: Optional[List[int]], subnet_choice: int,
+                                        hide_zeros: bool, include_unregistered: bool, progress, task) -> List:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.stats_manager.config.get('stats.max_concurrent_wallets', 8))
+
+        async def resolve(wallet: str):
+            async with semaphore:
+                return await loop.run_in_executor(None, _coldkey_address, wallet)
+
+        resolved = await asyncio.gather(*[resolve(wallet) for wallet in wallets], return_exceptions=True)
+        addresses = {
+            wallet: address for wallet, address in zip(wallets, resolved)
+            if not isinstance(address, Exception)
+        }
+        await asyncio.gather(
+            loop.run_in_executor(None, self.stats_manager.prefetch_balances, addresses),
+            loop.run_in_executor(None, self.stats_manager.prefetch_tao_price)
+        )
+
+        async def collect(wallet: str):
+            async with semaphore:
+                try:
+                    return await loop.run_in_executor(
+                        None, self._collect_wallet_stats, wallet, subnet_list, subnet_choice, hide_zeros, include_unregistered
+                    )
+                finally:
+                    progress.update(task, advance=1)
+
+        return await asyncio.gather(*[collect(wallet) for wallet in wallets], return_exceptions=True)
+
     def display_wallets_summary(self, total_balance: float, total_daily_reward_usd: float, 
                              total_alpha_usd_value: float, active_wallets_count: int = 0, 
                              total_wallets_count: int = 0, active_subnets_count: int = 0,
@@ -1426,24 +1325,20 @@ class StatsMenu:
         table.add_column("Metric", style="cyan")
         table.add_column("Value", justify="right")
         
-        table.add_row("Total TAO Balance", f"{total_balance:.9f} τ")
-        table.add_row("Total Daily Rewards", f"${total_daily_reward_usd:.2f}")
-        table.add_row("Total Alpha TAO Value", f"${total_alpha_usd_value:.2f}")
-        
-        if total_wallets_count > 0:
-            table.add_row("Active Wallets", f"{active_wallets_count}/{total_wallets_count}")
-        
-        if active_subnets_count > 0:
-            table.add_row("Active Subnets", str(active_subnets_count))
-            
-        if active_neurons_count > 0:
-            table.add_row("Active Neurons (Hotkeys)", str(active_neurons_count))
-            
-        if unregistered_neurons_count > 0:
-            table.add_row("Unregistered Neurons with Stake", str(unregistered_neurons_count))
+        values = (
+            total_balance,
+            total_daily_reward_usd,
+            total_alpha_usd_value,
+            (active_wallets_count, total_wallets_count) if total_wallets_count > 0 else None,
+            active_subnets_count or None,
+            active_neurons_count or None,
+            unregistered_neurons_count or None,
+            total_daily_reward_usd * 7
+        )
         
-        weekly_rewards = total_daily_reward_usd * 7
-        table.add_row("Weekly Rewards Projection", f"${weekly_rewards:.2f}")
+        for (label, fmt), value in zip(_SUMMARY_ROWS, values):
+            if value is not None:
+                table.add_row(label, fmt(value))
         
         console.print(table)
         console.print("="*80)
@@ -1462,43 +1357,46 @@ class StatsMenu:
             
             if export_option == 1:
                 filename = f"export_{coldkey}_{timestamp}.json"
-                with open(filename, 'w') as f:
-                    json.dump(stats, f, indent=2)
+                if orjson:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(stats, f, indent=2)
                 console.print(f"[green]Data exported to {filename}[/green]")
                 
             elif export_option == 2:
                 filename = f"export_{coldkey}_{timestamp}.csv"
                 
-                with open(filename, 'w', newline='') as f:
-                    import csv
+                rows = [
+                    (
+                        stats['coldkey'],
+                        subnet['netuid'],
+                        neuron['hotkey'],
+                        neuron['uid'],
+                        neuron['stake'],
+                        neuron['rank'],
+                        neuron['trust'],
+                        neuron['consensus'],
+                        neuron['incentive'],
+                        neuron['dividends'],
+                        neuron['emission'],
+                        neuron['daily_rewards_alpha'],
+                        neuron['daily_rewards_usd'],
+                        subnet['rate_usd']
+                    )
+                    for subnet in stats['subnets']
+                    for neuron in subnet['neurons']
+                ]
+                
+                with open(filename, 'w', newline='', buffering=1024 * 1024) as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         'Coldkey', 'Subnet', 'Hotkey', 'UID', 'Stake', 'Rank',
                         'Trust', 'Consensus', 'Incentive', 'Dividends', 'Emission',
                         'Daily Alpha', 'Daily USD', 'Rate USD'
                     ])
-                    
-                    for subnet in stats['subnets']:
-                        subnet_id = subnet['netuid']
-                        rate_usd = subnet['rate_usd']
-                        
-                        for neuron in subnet['neurons']:
-                            writer.writerow([
-                                stats['coldkey'],
-                                subnet_id,
-                                neuron['hotkey'],
-                                neuron['uid'],
-                                neuron['stake'],
-                                neuron['rank'],
-                                neuron['trust'],
-                                neuron['consensus'],
-                                neuron['incentive'],
-                                neuron['dividends'],
-                                neuron['emission'],
-                                neuron['daily_rewards_alpha'],
-                                neuron['daily_rewards_usd'],
-                                rate_usd
-                            ])
+                    writer.writerows(rows)
                 
                 console.print(f"[green]Data exported to {filename}[/green]")
 
@@ -1506,16 +1404,6 @@ class BalanceMenu:
     def __init__(self, stats_manager, wallet_utils):
         self.stats_manager = stats_manager
         self.wallet_utils = wallet_utils
-        import subprocess
-        import re
-        import os
-        import time
-        import json
-        self.subprocess = subprocess
-        self.re = re
-        self.os = os
-        self.time = time
-        self.json = json
 
     def show(self):
         while True:
@@ -1540,8 +1428,7 @@ class BalanceMenu:
                 return
 
             console.print("\nAvailable Wallets:")
-            for wallet in wallets:
-                console.print(f"  • {wallet}")
+            _print_items(wallets)
 
             console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3 or 'all')")
             selection = Prompt.ask("Selection").strip()
@@ -1561,68 +1448,45 @@ class BalanceMenu:
             total_free_balance = 0.0
             total_staked_balance = 0.0
             total_balance = 0.0
+            stake_unavailable = []
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True
-            ) as progress:
-                task = progress.add_task("[cyan]Checking balances...", total=len(selected_wallets))
+            with Status("[bold cyan]Checking balances...", spinner="dots"):
+                balances = self._get_wallet_balances(selected_wallets)
 
-                for wallet_index, wallet_name in enumerate(selected_wallets):
-                    try:
-                        progress.update(task, description=f"[cyan]Checking {wallet_name} ({wallet_index+1}/{len(selected_wallets)})...[/cyan]")
-                        
-                        detailed_balance = self._get_wallet_balance(wallet_name)
-                        
-                        if detailed_balance:
-                            free_balance = detailed_balance.get('free_balance', 0.0)
-                            staked_value = detailed_balance.get('staked_value', 0.0)
-                            total_wallet_balance = detailed_balance.get('total_balance', 0.0)
-                            address = detailed_balance.get('address', 'N/A')
-                            
-                            total_free_balance += free_balance
-                            total_staked_balance += staked_value
-                            total_balance += total_wallet_balance
-                            
-                            table.add_row(
-                                wallet_name,
-                                address,
-                                f"{free_balance:.6f}",
-                                f"{staked_value:.6f}",
-                                f"{total_wallet_balance:.6f}"
-                            )
-                        else:
-                            wallet = bt.wallet(name=wallet_name)
-                            free_balance = float(self.stats_manager.subtensor.get_balance(
-                                wallet.coldkeypub.ss58_address
-                            ))
-                            
-                            total_free_balance += free_balance
-                            total_balance += free_balance
-                            
-                            table.add_row(
-                                wallet_name,
-                                wallet.coldkeypub.ss58_address,
-                                f"{free_balance:.6f}",
-                                "0.000000",
-                                f"{free_balance:.6f}"
-                            )
-                        
-                        if wallet_index < len(selected_wallets) - 1:
-                            self.time.sleep(0.1)
-                            
-                    except Exception as e:
-                        console.print(f"[yellow]Error processing {wallet_name}: {str(e)}[/yellow]")
-                        table.add_row(
-                            wallet_name,
-                            "[red]Error getting address[/red]",
-                            "[red]Error[/red]",
-                            "[red]Error[/red]",
-                            f"[red]Error: {str(e)}[/red]"
-                        )
-                    progress.update(task, advance=1)
+            for wallet_name in selected_wallets:
+                balance = balances[wallet_name]
+                if 'error' in balance:
+                    table.add_row(
+                        wallet_name,
+                        Text("Error getting address", style="red"),
+                        _ERROR_CELL,
+                        _ERROR_CELL,
+                        Text(f"Error: {balance['error']}", style="red")
+                    )
+                    continue
+
+                total_free_balance += balance['free_balance']
+                total_balance += balance['total_balance']
+
+                if balance['staked_value'] is None:
+                    stake_unavailable.append(wallet_name)
+                    table.add_row(
+                        wallet_name,
+                        balance['address'],
+                        f"{balance['free_balance']:.6f}",
+                        Text("Unavailable", style="yellow"),
+                        Text(f"{balance['total_balance']:.6f} (free only)", style="yellow")
+                    )
+                    continue
+
+                total_staked_balance += balance['staked_value']
+                table.add_row(
+                    wallet_name,
+                    balance['address'],
+                    f"{balance['free_balance']:.6f}",
+                    f"{balance['staked_value']:.6f}",
+                    f"{balance['total_balance']:.6f}"
+                )
 
             table.add_row(
                 "[bold]Total[/bold]",
@@ -1635,82 +1499,65 @@ class BalanceMenu:
 
             console.print("\n")
             console.print(table)
+            if stake_unavailable:
+                console.print(f"[yellow]Staked value unavailable for: {', '.join(stake_unavailable)}. Totals exclude their stake.[/yellow]")
 
             if not Confirm.ask("Check another balance?"):
                 return
     
-    def _get_wallet_balance(self, wallet_name: str) -> dict:
-        try:
-            cmd = f'btcli wallet balance --wallet.name {wallet_name} --json-output'
-            process = self.subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if process.returncode == 0 and process.stdout.strip():
+    def _get_wallet_balances(self, wallet_names: List[str]) -> Dict[str, dict]:
+        balances = {}
+        addresses = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(_coldkey_address, wallet_name): wallet_name for wallet_name in wallet_names}
+            for future in as_completed(futures):
+                wallet_name = futures[future]
                 try:
-                    data = self.json.loads(process.stdout)
-                    if 'balances' in data and wallet_name in data['balances']:
-                        wallet_data = data['balances'][wallet_name]
-                        return {
-                            'address': wallet_data.get('coldkey', 'N/A'),
-                            'free_balance': float(wallet_data.get('free', 0.0)),
-                            'staked_value': float(wallet_data.get('staked', 0.0)),
-                            'total_balance': float(wallet_data.get('total', 0.0))
-                        }
-                except self.json.JSONDecodeError:
-                    console.print(f"[yellow]Failed to parse JSON output for {wallet_name}[/yellow]")
-            
-            wallet = bt.wallet(name=wallet_name)
-            address = wallet.coldkeypub.ss58_address
-            
-            free_balance = float(self.stats_manager.subtensor.get_balance(address))
-            
-            try:
-                staked_value = 0.0
-                cmd = f'btcli stake list --wallet.name {wallet_name} --json-output'
-                process = self.subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                
-                if process.returncode == 0 and process.stdout:
-                    try:
-                        data = self.json.loads(process.stdout)
-                        if 'total_tao_value' in data:
-                            staked_value = float(data['total_tao_value'])
-                    except self.json.JSONDecodeError:
-                        console.print(f"[yellow]Failed to parse staking JSON output for {wallet_name}[/yellow]")
-                
-                total_balance = free_balance + staked_value
-                
-                return {
-                    'address': address,
-                    'free_balance': free_balance,
-                    'staked_value': staked_value,
-                    'total_balance': total_balance
-                }
-            except Exception as e:
-                console.print(f"[yellow]Error getting staked value: {str(e)}[/yellow]")
-                return {
-                    'address': address,
-                    'free_balance': free_balance,
-                    'staked_value': 0.0,
-                    'total_balance': free_balance
-                }
-            
+                    addresses[wallet_name] = future.result()
+                except Exception as e:
+                    console.print(f"[yellow]Error processing {wallet_name}: {str(e)}[/yellow]")
+                    balances[wallet_name] = {'error': str(e)}
+
+        if not addresses:
+            return balances
+
+        subtensor = self.stats_manager.subtensor
+        try:
+            free_balances = subtensor.get_balances(*addresses.values())
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not get detailed balance for {wallet_name}: {str(e)}[/yellow]")
-            
-            try:
-                wallet = bt.wallet(name=wallet_name)
-                address = wallet.coldkeypub.ss58_address
-                
-                free_balance = float(self.stats_manager.subtensor.get_balance(address))
-                
-                return {
-                    'address': address,
-                    'free_balance': free_balance,
-                    'staked_value': 0.0,
-                    'total_balance': free_balance
-                }
-            except Exception as inner_e:
-                console.print(f"[yellow]Error getting basic balance: {str(inner_e)}[/yellow]")
-                return None
+            console.print(f"[yellow]Error getting balances: {str(e)}[/yellow]")
+            for wallet_name in addresses:
+                balances[wallet_name] = {'error': str(e)}
+            return balances
+
+        try:
+            subnets = {subnet.netuid: subnet for subnet in subtensor.all_subnets() or []}
+        except Exception as e:
+            console.print(f"[yellow]Error getting subnet prices: {str(e)}[/yellow]")
+            subnets = None
+
+        for wallet_name, address in addresses.items():
+            free_balance = float(free_balances[address])
+            staked_value = None
+            if subnets is not None:
+                try:
+                    staked_value = 0.0
+                    for stake in subtensor.get_stake_for_coldkey(address):
+                        subnet = subnets.get(stake.netuid)
+                        if subnet:
+                            staked_value += float(subnet.alpha_to_tao(stake.stake))
+                except Exception as e:
+                    console.print(f"[yellow]Error getting staked value for {wallet_name}: {str(e)}[/yellow]")
+                    staked_value = None
+
+            balances[wallet_name] = {
+                'address': address,
+                'free_balance': free_balance,
+                'staked_value': staked_value,
+                'total_balance': free_balance + (staked_value or 0.0)
+            }
+
+        return balances
 
 class TransferMenu:
     def __init__(self, transfer_manager, wallet_utils, config):
@@ -1718,6 +1565,14 @@ class TransferMenu:
         self.wallet_utils = wallet_utils
         self.config = config
 
+    def _find_invalid_passwords(self, wallet_names: List[str], password: str) -> List[str]:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(
+                lambda wallet_name: self.transfer_manager.try_unlock_coldkey(wallet_name, password),
+                wallet_names
+            )
+            return [wallet_name for wallet_name, valid in zip(wallet_names, results) if not valid]
+
     def show(self):
         console.print("\n[bold]TAO Transfer and Unstake Alpha TAO Menu[/bold]")
         console.print(Panel.fit(
@@ -1734,16 +1589,19 @@ class TransferMenu:
         if choice == 6:
             return
 
-        if choice == 1:
-            self._handle_transfer()
-        elif choice == 2:
-            self._handle_batch_transfer()
-        elif choice == 3:
-            self._handle_collect_tao()
-        elif choice == 4:
-            self._handle_unstake_alpha_simple()
-        elif choice == 5:
-            self._handle_unstake_alpha()
+        try:
+            if choice == 1:
+                self._handle_transfer()
+            elif choice == 2:
+                self._handle_batch_transfer()
+            elif choice == 3:
+                self._handle_collect_tao()
+            elif choice == 4:
+                self._handle_unstake_alpha_simple()
+            elif choice == 5:
+                self._handle_unstake_alpha()
+        finally:
+            self.transfer_manager.lock_coldkeys()
 
     def _handle_transfer(self):
         wallets = self.wallet_utils.get_available_wallets()
@@ -1752,22 +1610,14 @@ class TransferMenu:
             return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        print_indexed(wallets)
 
-        selection = Prompt.ask("Select source wallet (number)").strip()
-        try:
-            index = int(selection) - 1
-            if not (0 <= index < len(wallets)):
-                console.print("[red]Invalid wallet selection![/red]")
-                return
-            source_wallet = wallets[index]
-        except ValueError:
-            console.print("[red]Invalid input![/red]")
+        source_wallet = _select_by_number("Select source wallet (number)", wallets)
+        if source_wallet is None:
             return
 
         dest_address = Prompt.ask("Enter destination wallet address (SS58 format)")
-        if not dest_address.startswith('5'):
+        if not self.wallet_utils.is_valid_ss58_address(dest_address):
             console.print("[red]Invalid destination address format![/red]")
             return
 
@@ -1785,7 +1635,7 @@ class TransferMenu:
 
             with Status("[bold green]Processing transfer...", spinner="dots"):
                 try:
-                    if not self.transfer_manager.verify_wallet_password(source_wallet, password):
+                    if not self.transfer_manager.try_unlock_coldkey(source_wallet, password):
                         console.print("[red]Invalid password![/red]")
                         return
 
@@ -1796,10 +1646,22 @@ class TransferMenu:
                 except Exception as e:
                     console.print(f"[red]Error: {str(e)}[/red]")
 
+    def _record_unstake_outcome(self, after: Dict, result: dict, hotkey: str, safe_amount: float):
+        if result.get('success', False):
+            after[hotkey] = {
+                'success': True,
+                'unstaked_amount': result.get('unstaked_amount', safe_amount),
+                'method': result.get('method', 'standard')
+            }
+        else:
+            error_msg = result.get('error', 'Unknown error')
+            console.print(f"[red]Failed to unstake from {hotkey}: {error_msg}[/red]")
+            after[hotkey] = {
+                'success': False,
+                'error': error_msg
+            }
+
     def _handle_unstake_alpha(self):
-        import subprocess
-        import time
-        
         wallets = self.wallet_utils.get_available_wallets()
         if not wallets:
             console.print("[red]No wallets found![/red]")
@@ -1814,13 +1676,12 @@ class TransferMenu:
             subnet_input = Prompt.ask("\nEnter subnet number")
             try:
                 subnet_list = [int(subnet_input.strip())]
-            except:
+            except ValueError:
                 console.print("[red]Invalid subnet input![/red]")
                 return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
 
         console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3 or 'all')")
         selection = Prompt.ask("Selection").strip()
@@ -1837,9 +1698,9 @@ class TransferMenu:
 
         shared_password = None
         auto_unstake = False
+        default_password = self.config.get('wallet.default_password')
 
         if process_choice == 1:
-            default_password = self.config.get('wallet.default_password')
             if default_password:
                 shared_password = Prompt.ask(
                     f"Enter password for all wallets (press Enter to use default)",
@@ -1850,10 +1711,7 @@ class TransferMenu:
             else:
                 shared_password = Prompt.ask("Enter password for all wallets", password=True)
 
-            invalid_wallets = []
-            for wallet in selected_wallets:
-                if not self.transfer_manager.verify_wallet_password(wallet, shared_password):
-                    invalid_wallets.append(wallet)
+            invalid_wallets = self._find_invalid_passwords(selected_wallets, shared_password)
 
             if invalid_wallets:
                 console.print(f"[red]Password is invalid for wallets: {', '.join(invalid_wallets)}[/red]")
@@ -1874,11 +1732,27 @@ class TransferMenu:
                 max_retries = IntPrompt.ask("Maximum number of retries per hotkey", default=3)
 
         stake_summary = {}
+        stake_infos = {}
+
+        with console.status("[bold]Getting stake information...[/bold]"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(self.transfer_manager.get_alpha_stake_info, wallet, subnet_list): wallet
+                    for wallet in selected_wallets
+                }
+                for future in as_completed(futures):
+                    wallet = futures[future]
+                    try:
+                        stake_infos[wallet] = future.result()
+                    except Exception as e:
+                        console.print(f"[red]Error processing wallet {wallet}: {str(e)}[/red]")
 
         for wallet in selected_wallets:
+            if wallet not in stake_infos:
+                continue
+
             try:
-                console.print(f"\n[bold]Getting stake information for {wallet}...[/bold]")
-                stake_info = self.transfer_manager.get_alpha_stake_info(wallet, subnet_list)
+                stake_info = stake_infos[wallet]
 
                 if not stake_info:
                     console.print(f"[yellow]No active Alpha stakes found for wallet {wallet}![/yellow]")
@@ -1886,28 +1760,25 @@ class TransferMenu:
 
                 self.transfer_manager.display_alpha_stake_summary(stake_info)
 
-                wallet_summary = {}
-                for subnet_info in stake_info:
-                    netuid = subnet_info['netuid']
-                    wallet_summary[netuid] = {
-                        'before': {},
-                        'after': {}
-                    }
-                    
-                    for hotkey_info in subnet_info['hotkeys']:
-                        if hotkey_info['stake'] > 0:
-                            wallet_summary[netuid]['before'][hotkey_info['name']] = {
+                stake_summary[wallet] = {
+                    subnet_info['netuid']: {
+                        'before': {
+                            hotkey_info['name']: {
                                 'stake': hotkey_info['stake'],
                                 'address': hotkey_info['address'],
                                 'uid': hotkey_info['uid'],
                                 'is_registered': hotkey_info.get('is_registered', True)
                             }
-
-                stake_summary[wallet] = wallet_summary
+                            for hotkey_info in subnet_info['hotkeys']
+                            if hotkey_info['stake'] > 0
+                        },
+                        'after': {}
+                    }
+                    for subnet_info in stake_info
+                }
 
                 password = shared_password
                 if not password:
-                    default_password = self.config.get('wallet.default_password')
                     if default_password:
                         password = Prompt.ask(
                             f"Enter password for {wallet} (press Enter to use default)",
@@ -1918,7 +1789,7 @@ class TransferMenu:
                     else:
                         password = Prompt.ask(f"Enter wallet password", password=True)
 
-                    if not self.transfer_manager.verify_wallet_password(wallet, password):
+                    if not self.transfer_manager.try_unlock_coldkey(wallet, password):
                         console.print(f"[red]Invalid password for {wallet}![/red]")
                         continue
 
@@ -1972,19 +1843,7 @@ class TransferMenu:
                                     if not success and retry_count <= max_retries:
                                         time.sleep(0.5)
                                 
-                                if success:
-                                    stake_summary[wallet][netuid]['after'][hotkey] = {
-                                        'success': True,
-                                        'unstaked_amount': result.get('unstaked_amount', safe_amount),
-                                        'method': result.get('method', 'standard')
-                                    }
-                                else:
-                                    error_msg = result.get('error', 'Unknown error')
-                                    console.print(f"[red]Failed to unstake from {hotkey}: {error_msg}[/red]")
-                                    stake_summary[wallet][netuid]['after'][hotkey] = {
-                                        'success': False,
-                                        'error': error_msg
-                                    }
+                                self._record_unstake_outcome(stake_summary[wallet][netuid]['after'], result, hotkey, safe_amount)
                             else:
                                 if Confirm.ask(
                                     f"Unstake {safe_amount:.6f} Alpha TAO from hotkey {hotkey} in subnet {netuid} ({status_type})?"
@@ -2002,20 +1861,7 @@ class TransferMenu:
                                             password,
                                             tolerance=current_tolerance
                                         )
-                                        
-                                        if result.get('success', False):
-                                            stake_summary[wallet][netuid]['after'][hotkey] = {
-                                                'success': True,
-                                                'unstaked_amount': result.get('unstaked_amount', safe_amount),
-                                                'method': result.get('method', 'standard')
-                                            }
-                                        else:
-                                            error_msg = result.get('error', 'Unknown error')
-                                            console.print(f"[red]Failed to unstake from {hotkey}: {error_msg}[/red]")
-                                            stake_summary[wallet][netuid]['after'][hotkey] = {
-                                                'success': False,
-                                                'error': error_msg
-                                            }
+                                        self._record_unstake_outcome(stake_summary[wallet][netuid]['after'], result, hotkey, safe_amount)
                                     except Exception as e:
                                         console.print(f"[red]Error unstaking from {hotkey}: {str(e)}[/red]")
                                         stake_summary[wallet][netuid]['after'][hotkey] = {
@@ -2036,14 +1882,16 @@ class TransferMenu:
         problem_hotkeys = []
         for wallet_name, wallet_data in stake_summary.items():
             for netuid, subnet_data in wallet_data.items():
+                before = subnet_data.get('before', {})
                 for hotkey, hotkey_data in subnet_data.get('after', {}).items():
                     if not hotkey_data.get('success', False) and not hotkey_data.get('skipped', False):
+                        stake = before.get(hotkey, {}).get('stake', 0)
                         problem_hotkeys.append({
                             'wallet': wallet_name,
                             'hotkey': hotkey,
                             'netuid': netuid,
-                            'stake': subnet_data.get('before', {}).get(hotkey, {}).get('stake', 0),
-                            'orig_stake': subnet_data.get('before', {}).get(hotkey, {}).get('stake', 0)
+                            'stake': stake,
+                            'orig_stake': stake
                         })
         
         if problem_hotkeys:
@@ -2141,9 +1989,6 @@ class TransferMenu:
                     console.print(f"[red]Error in super emergency unstake: {str(e)}[/red]")
 
     def _handle_unstake_alpha_simple(self):
-        import subprocess
-        import time
-        
         wallets = self.wallet_utils.get_available_wallets()
         if not wallets:
             console.print("[red]No wallets found![/red]")
@@ -2162,13 +2007,12 @@ class TransferMenu:
             try:
                 subnet_id = int(subnet_input.strip())
                 netuid_param = ["--netuid", str(subnet_id)]
-            except:
+            except ValueError:
                 console.print("[red]Invalid subnet input![/red]")
                 return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
 
         console.print("\nSelect wallets (comma-separated names, e.g. bot_1,bot_2,bot_3 or 'all')")
         selection = Prompt.ask("Selection").strip()
@@ -2196,10 +2040,7 @@ class TransferMenu:
             else:
                 shared_password = Prompt.ask("Enter password for all wallets", password=True)
 
-            invalid_wallets = []
-            for wallet in selected_wallets:
-                if not self.transfer_manager.verify_wallet_password(wallet, shared_password):
-                    invalid_wallets.append(wallet)
+            invalid_wallets = self._find_invalid_passwords(selected_wallets, shared_password)
 
             if invalid_wallets:
                 console.print(f"[red]Invalid password for: {', '.join(invalid_wallets)}[/red]")
@@ -2219,17 +2060,16 @@ class TransferMenu:
         ) as progress:
             task = progress.add_task("[cyan]Processing...", total=len(selected_wallets))
 
-            for wallet_name in selected_wallets:
-                progress.update(task, description=f"[cyan]Processing {wallet_name}...[/cyan]")
+            for i, wallet_name in enumerate(selected_wallets):
+                progress.update(task, completed=i, description=f"[cyan]Processing {wallet_name}...[/cyan]")
                 
                 try:
                     password = shared_password
                     if not shared_password:
                         password = Prompt.ask(f"Password for {wallet_name}", password=True)
-                        if not self.transfer_manager.verify_wallet_password(wallet_name, password):
+                        if not self.transfer_manager.try_unlock_coldkey(wallet_name, password):
                             console.print(f"[red]Invalid password for {wallet_name}[/red]")
                             failed += 1
-                            progress.update(task, advance=1)
                             continue
 
                     cmd = ["btcli", "stake", "remove", "--wallet-name", wallet_name, "--all-hotkeys", "--unstake-all", "--no-prompt"]
@@ -2258,9 +2098,10 @@ class TransferMenu:
                     failed += 1
                     console.print(f"[red]Error with {wallet_name}: {str(e)}[/red]")
 
-                progress.update(task, advance=1)
                 time.sleep(0.5)
 
+            progress.update(task, completed=len(selected_wallets))
+
         console.print(f"\n[bold]Results:[/bold]")
         console.print(f"[green]Successful: {successful}[/green]")
         console.print(f"[red]Failed: {failed}[/red]")
@@ -2280,10 +2121,11 @@ class TransferMenu:
             wallet_successful_ops = 0
             
             for netuid, subnet_data in wallet_data.items():
+                after = subnet_data.get('after', {})
                 for hotkey, before_data in subnet_data.get('before', {}).items():
                     original_stake = before_data.get('stake', 0.0)
                     
-                    after_data = subnet_data.get('after', {}).get(hotkey, {})
+                    after_data = after.get(hotkey, {})
                     success = after_data.get('success')
                     
                     if success == True:
@@ -2325,7 +2167,7 @@ class TransferMenu:
             if hasattr(self.transfer_manager, 'stats_manager') and hasattr(self.transfer_manager.stats_manager, '_get_tao_price'):
                 return self.transfer_manager.stats_manager._get_tao_price()
             return None
-        except:
+        except Exception:
             return None
                 
     def _handle_batch_transfer(self):
@@ -2335,27 +2177,19 @@ class TransferMenu:
             return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        print_indexed(wallets)
 
-        selection = Prompt.ask("Select source wallet (number)").strip()
-        try:
-            index = int(selection) - 1
-            if not (0 <= index < len(wallets)):
-                console.print("[red]Invalid wallet selection![/red]")
-                return
-            source_wallet = wallets[index]
-        except ValueError:
-            console.print("[red]Invalid input![/red]")
+        source_wallet = _select_by_number("Select source wallet (number)", wallets)
+        if source_wallet is None:
             return
 
         addresses_input = Prompt.ask("Enter destination wallet addresses (comma-separated SS58 format(5DygFNT..,5FUQnL..))").strip()
-        addresses = [addr.strip() for addr in addresses_input.split(',') if addr.strip()]
+        raw_addresses = [addr.strip() for addr in addresses_input.split(',') if addr.strip()]
+        addresses = list(dict.fromkeys(raw_addresses))
+        if len(addresses) < len(raw_addresses):
+            console.print(f"[yellow]Removed {len(raw_addresses) - len(addresses)} duplicate destination address(es)[/yellow]")
         
-        invalid_addresses = []
-        for addr in addresses:
-            if not addr.startswith('5'):
-                invalid_addresses.append(addr)
+        invalid_addresses = [addr for addr in addresses if not self.wallet_utils.is_valid_ss58_address(addr)]
         
         if invalid_addresses:
             console.print(f"[red]Invalid destination address format for: {', '.join(invalid_addresses)}[/red]")
@@ -2379,8 +2213,8 @@ class TransferMenu:
         console.print(f"Total amount to transfer: {total_amount} TAO")
         
         try:
-            wallet = bt.wallet(name=source_wallet)
-            balance = self.transfer_manager.subtensor.get_balance(wallet.coldkeypub.ss58_address)
+            source_address = _coldkey_address(source_wallet)
+            balance = self.transfer_manager.subtensor.get_balance(source_address)
             console.print(f"Current wallet balance: {float(balance)} TAO")
             
             if float(balance) < total_amount:
@@ -2393,11 +2227,11 @@ class TransferMenu:
         if Confirm.ask(f"Transfer {amount_per_address} TAO to each of {len(addresses)} addresses for a total of {total_amount} TAO?"):
             password = Prompt.ask("Enter wallet password", password=True)
 
-            if not self.transfer_manager.verify_wallet_password(source_wallet, password):
+            if not self.transfer_manager.try_unlock_coldkey(source_wallet, password):
                 console.print("[red]Invalid password![/red]")
                 return
             
-            successful_transfers = 0
+            submitted_transfers = 0
             failed_transfers = 0
             
             with Progress(
@@ -2405,40 +2239,65 @@ class TransferMenu:
                 TextColumn("[progress.description]{task.description}"),
                 console=console
             ) as progress:
-                task = progress.add_task(f"[cyan]Processing batch transfer...", total=len(addresses))
+                task = progress.add_task(f"[cyan]Submitting batch transfer...", total=len(addresses))
                 
                 for i, dest_address in enumerate(addresses, 1):
-                    progress.update(task, description=f"[cyan]Processing transfer {i}/{len(addresses)} to {dest_address[:10]}...[/cyan]")
+                    progress.update(task, completed=i - 1, description=f"[cyan]Submitting transfer {i}/{len(addresses)} to {dest_address[:10]}...[/cyan]")
                     
                     try:
-                        success = self.transfer_manager.transfer_tao(source_wallet, dest_address, amount_per_address, password)
+                        success = self.transfer_manager.transfer_tao(
+                            source_wallet,
+                            dest_address,
+                            amount_per_address,
+                            password,
+                            wait_for_inclusion=False,
+                            wait_for_finalization=False
+                        )
                         if success:
-                            successful_transfers += 1
+                            submitted_transfers += 1
                         else:
                             failed_transfers += 1
                             console.print(f"[red]Transfer to {dest_address} failed![/red]")
                     except Exception as e:
                         failed_transfers += 1
                         console.print(f"[red]Error transferring to {dest_address}: {str(e)}[/red]")
-                    
-                    progress.update(task, advance=1)
+
+                progress.update(task, completed=len(addresses))
+
+            confirmed_transfers = 0
+            if submitted_transfers > 0:
+                expected_balance = float(balance) - submitted_transfers * amount_per_address
+                deadline = time.time() + self.config.get('transfer.batch_confirm_timeout', 60)
+                confirmed = False
+                with console.status("[cyan]Waiting for transfers to be included...[/cyan]"):
+                    while not confirmed and time.time() < deadline:
+                        time.sleep(3)
+                        try:
+                            confirmed = float(self.transfer_manager.subtensor.get_balance(source_address)) <= expected_balance
+                        except Exception as e:
+                            console.print(f"[yellow]Error checking wallet balance: {str(e)}[/yellow]")
+                if confirmed:
+                    confirmed_transfers = submitted_transfers
+                else:
+                    console.print("[yellow]Transfers were submitted but are not reflected in the balance yet. Check the wallet before retrying.[/yellow]")
             
             console.print("\n[bold]Batch Transfer Results:[/bold]")
-            console.print(f"[green]Successful transfers: {successful_transfers}[/green]")
+            console.print(f"Submitted transfers: {submitted_transfers}")
+            console.print(f"[green]Confirmed transfers: {confirmed_transfers}[/green]")
+            if submitted_transfers > confirmed_transfers:
+                console.print(f"[yellow]Unconfirmed transfers: {submitted_transfers - confirmed_transfers}[/yellow]")
             if failed_transfers > 0:
                 console.print(f"[red]Failed transfers: {failed_transfers}[/red]")
-            console.print(f"Total TAO transferred: {successful_transfers * amount_per_address}")
+            console.print(f"Total TAO transferred: {confirmed_transfers * amount_per_address}")
 
     def _handle_collect_tao(self):
-
         wallets = self.wallet_utils.get_available_wallets()
         if not wallets:
             console.print("[red]No wallets found![/red]")
             return
 
         console.print("\nAvailable Wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        print_indexed(wallets)
 
         console.print("\nSelect wallets to collect from (comma-separated numbers, e.g., 1,3,4 or 'all')")
         selection = Prompt.ask("Selection").strip().lower()
@@ -2446,34 +2305,35 @@ class TransferMenu:
         if selection == 'all':
             selected_wallets = wallets
         else:
-            try:
-                indices = [int(i.strip()) - 1 for i in selection.split(',')]
-                selected_wallets = [wallets[i] for i in indices if 0 <= i < len(wallets)]
-            except:
-                console.print("[red]Invalid selection![/red]")
-                return
+            selected_wallets = [wallets[i] for i in self.wallet_utils.parse_index_selection(selection, len(wallets))]
 
         if not selected_wallets:
             console.print("[red]No wallets selected![/red]")
             return
 
         dest_address = Prompt.ask("Enter destination wallet address (SS58 format)")
-        if not dest_address.startswith('5'):
+        if not self.wallet_utils.is_valid_ss58_address(dest_address):
             console.print("[red]Invalid destination address format![/red]")
             return
 
-        dest_is_selected = False
-        for wallet_name in selected_wallets:
-            try:
-                wallet = bt.wallet(name=wallet_name)
-                if wallet.coldkeypub.ss58_address == dest_address:
-                    dest_is_selected = True
-                    console.print(f"[yellow]Note: Destination address belongs to wallet '{wallet_name}'[/yellow]")
-                    break
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not check if {wallet_name} matches destination: {str(e)}[/yellow]")
+        addresses = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(_coldkey_address, wallet_name): wallet_name
+                for wallet_name in selected_wallets
+            }
+            for future in as_completed(futures):
+                wallet_name = futures[future]
+                try:
+                    addresses[wallet_name] = future.result()
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not check if {wallet_name} matches destination: {str(e)}[/yellow]")
 
-        reserve_amount = 0.0005
+        dest_wallet = next((name for name, address in addresses.items() if address == dest_address), None)
+        if dest_wallet:
+            console.print(f"[yellow]Note: Destination address belongs to wallet '{dest_wallet}'[/yellow]")
+
+        reserve_rao = 500_000
         reserve_amount_display = 0.0005
 
         use_same_password = Confirm.ask("Use the same password for all wallets?", default=True)
@@ -2483,10 +2343,7 @@ class TransferMenu:
             common_password = Prompt.ask("Enter common wallet password", password=True)
             console.print("Decrypting...")
             
-            invalid_wallets = []
-            for wallet_name in selected_wallets:
-                if not self.transfer_manager.verify_wallet_password(wallet_name, common_password):
-                    invalid_wallets.append(wallet_name)
+            invalid_wallets = self._find_invalid_passwords(selected_wallets, common_password)
             
             if invalid_wallets:
                 console.print(f"[red]Password is invalid for wallets: {', '.join(invalid_wallets)}[/red]")
@@ -2494,43 +2351,32 @@ class TransferMenu:
             console.print("Decrypting...")
 
         wallet_balances = {}
-        total_to_transfer = 0
+        total_to_transfer_rao = 0
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("[cyan]Checking wallet balances...", total=len(selected_wallets))
-            
-            for wallet_name in selected_wallets:
-                try:
-                    progress.update(task, description=f"[cyan]Checking {wallet_name} balance...[/cyan]")
-                    
-                    wallet = bt.wallet(name=wallet_name)
-                    balance = float(self.transfer_manager.subtensor.get_balance(wallet.coldkeypub.ss58_address))
-                    
-                    if wallet.coldkeypub.ss58_address == dest_address:
-                        progress.update(task, advance=1)
-                        continue
-                    
-                    transferable = balance - reserve_amount
-                    
-                    if transferable <= 0:
-                        progress.update(task, advance=1)
-                        continue
-                    
-                    wallet_balances[wallet_name] = {
-                        'balance': balance,
-                        'to_transfer': transferable,
-                        'address': wallet.coldkeypub.ss58_address
-                    }
-                    
-                    total_to_transfer += transferable
-                except Exception as e:
-                    console.print(f"[red]Error checking {wallet_name} balance: {str(e)}[/red]")
-                
-                progress.update(task, advance=1)
+        with console.status("[cyan]Checking wallet balances...[/cyan]"):
+            try:
+                balances = self.transfer_manager.subtensor.get_balances(*addresses.values()) if addresses else {}
+            except Exception as e:
+                console.print(f"[red]Error checking wallet balances: {str(e)}[/red]")
+                balances = {}
+
+        for wallet_name in selected_wallets:
+            address = addresses.get(wallet_name)
+            if address is None or address == dest_address or address not in balances:
+                continue
+
+            balance_rao = int(balances[address].rao)
+            transferable_rao = balance_rao - reserve_rao
+            if transferable_rao <= 0:
+                continue
+
+            wallet_balances[wallet_name] = {
+                'balance_rao': balance_rao,
+                'to_transfer_rao': transferable_rao,
+                'to_transfer': transferable_rao / RAO_PER_TAO,
+                'address': address
+            }
+            total_to_transfer_rao += transferable_rao
         
         if not wallet_balances:
             console.print("[yellow]No wallets with transferable balance found![/yellow]")
@@ -2543,24 +2389,22 @@ class TransferMenu:
         table.add_column("To Transfer (τ)")
         table.add_column("Reserve (τ)")
         
+        reserve_display = _format_rao(reserve_rao)
         for wallet_name, data in wallet_balances.items():
-            balance = data['balance']
-            to_transfer = data['to_transfer']
-            reserve = balance - to_transfer
-            
             table.add_row(
                 wallet_name,
                 data['address'][:15] + "..." + data['address'][-10:],
-                f"{balance:.9f}",
-                f"{to_transfer:.9f}",
-                f"{reserve:.9f}"
+                _format_rao(data['balance_rao']),
+                _format_rao(data['to_transfer_rao']),
+                reserve_display
             )
         
+        total_to_transfer_display = _format_rao(total_to_transfer_rao)
         table.add_row(
             "[bold]Total[/bold]",
             "",
             "",
-            f"[bold]{total_to_transfer:.9f}[/bold]",
+            f"[bold]{total_to_transfer_display}[/bold]",
             "",
             style="bold green"
         )
@@ -2569,58 +2413,97 @@ class TransferMenu:
         console.print(f"\nDestination address: {dest_address}")
         console.print(f"Reserve for fees: {reserve_amount_display} TAO per wallet")
         
-        if not Confirm.ask(f"Collect a total of {total_to_transfer:.9f} TAO into the destination address?"):
+        if not Confirm.ask(f"Collect a total of {total_to_transfer_display} TAO into the destination address?"):
             return
         
-        successful_transfers = 0
-        failed_transfers = 0
-        total_transferred = 0
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("[cyan]Processing transfers...", total=len(wallet_balances))
-            
-            for wallet_name, data in wallet_balances.items():
-                progress.update(task, description=f"[cyan]Transferring from {wallet_name}...[/cyan]")
-                
-                try:
-                    password = common_password
-                    if not use_same_password:
-                        password = Prompt.ask(f"Enter password for {wallet_name}", password=True)
-                        if not self.transfer_manager.verify_wallet_password(wallet_name, password):
-                            console.print(f"[red]Invalid password for {wallet_name}![/red]")
-                            failed_transfers += 1
-                            progress.update(task, advance=1)
-                            continue
-                    
-                    success = self.transfer_manager.transfer_tao(
-                        wallet_name, 
-                        dest_address, 
-                        data['to_transfer'], 
-                        password
-                    )
-                    
-                    if success:
-                        successful_transfers += 1
-                        total_transferred += data['to_transfer']
-                        console.print(f"[green]Successfully transferred {data['to_transfer']:.9f} TAO from {wallet_name}[/green]")
+        passwords = {}
+        for wallet_name in wallet_balances:
+            passwords[wallet_name] = common_password if use_same_password else Prompt.ask(f"Enter password for {wallet_name}", password=True)
+
+        def submit(wallet_name):
+            data = wallet_balances[wallet_name]
+            if not use_same_password and not self.transfer_manager.try_unlock_coldkey(wallet_name, passwords[wallet_name]):
+                return "Invalid password"
+            success = self.transfer_manager.transfer_tao(
+                wallet_name,
+                dest_address,
+                data['to_transfer'],
+                passwords[wallet_name],
+                wait_for_inclusion=False,
+                wait_for_finalization=False
+            )
+            return "Submitted" if success else "Failed"
+
+        outcomes = {}
+        pending = {}
+        confirm_timeout = self.config.get('transfer.batch_confirm_timeout', 60)
+        deadline = None
+        with console.status("[cyan]Submitting transfers...[/cyan]") as status:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(submit, wallet_name): wallet_name for wallet_name in wallet_balances}
+                while futures or pending:
+                    if futures:
+                        done, _ = wait(futures, timeout=3)
                     else:
-                        failed_transfers += 1
-                        console.print(f"[red]Failed to transfer from {wallet_name}[/red]")
-                except Exception as e:
-                    failed_transfers += 1
-                    console.print(f"[red]Error transferring from {wallet_name}: {str(e)}[/red]")
-                
-                progress.update(task, advance=1)
-        
-        console.print("\n[bold]Collection Results:[/bold]")
+                        time.sleep(3)
+                        done = ()
+                    for future in done:
+                        wallet_name = futures.pop(future)
+                        try:
+                            outcomes[wallet_name] = future.result()
+                        except Exception as e:
+                            outcomes[wallet_name] = f"Error: {str(e)}"
+                        if outcomes[wallet_name] == "Submitted":
+                            pending[wallet_name] = wallet_balances[wallet_name]
+
+                    if pending:
+                        try:
+                            with self.transfer_manager.subtensor_lock:
+                                balances = self.transfer_manager.subtensor.get_balances(*(data['address'] for data in pending.values()))
+                        except Exception as e:
+                            console.print(f"[yellow]Error checking wallet balances: {str(e)}[/yellow]")
+                            balances = {}
+                        for wallet_name, data in list(pending.items()):
+                            if data['address'] in balances and int(balances[data['address']].rao) <= data['balance_rao'] - data['to_transfer_rao']:
+                                outcomes[wallet_name] = "Confirmed"
+                                del pending[wallet_name]
+
+                    if not futures:
+                        if deadline is None:
+                            deadline = time.time() + confirm_timeout
+                        if time.time() >= deadline:
+                            break
+                    submitted_count = sum(1 for outcome in outcomes.values() if outcome in ("Submitted", "Confirmed"))
+                    status.update(f"[cyan]Submitted {submitted_count}/{len(wallet_balances)} transfers, waiting for {len(pending)} to be included...[/cyan]")
+        for wallet_name in pending:
+            outcomes[wallet_name] = "Pending"
+
+        status_styles = {"Confirmed": "green", "Pending": "yellow"}
+        results_table = Table(title="Collection Results")
+        results_table.add_column("Wallet")
+        results_table.add_column("Amount (τ)")
+        results_table.add_column("Status")
+        successful_transfers = 0
+        total_transferred_rao = 0
+        for wallet_name, data in wallet_balances.items():
+            outcome = outcomes.get(wallet_name, "Failed")
+            if outcome == "Confirmed":
+                successful_transfers += 1
+                total_transferred_rao += data['to_transfer_rao']
+            results_table.add_row(
+                wallet_name,
+                _format_rao(data['to_transfer_rao']),
+                f"[{status_styles.get(outcome, 'red')}]{outcome}[/{status_styles.get(outcome, 'red')}]"
+            )
+        console.print(results_table)
+
+        if pending:
+            console.print(f"[yellow]Transfers from {', '.join(pending)} were submitted but are not reflected in the balance yet. Check these wallets before retrying.[/yellow]")
         console.print(f"[green]Successful transfers: {successful_transfers}[/green]")
+        failed_transfers = len(wallet_balances) - successful_transfers - len(pending)
         if failed_transfers > 0:
             console.print(f"[red]Failed transfers: {failed_transfers}[/red]")
-        console.print(f"Total TAO collected: {total_transferred:.9f}")
+        console.print(f"Total TAO collected: {_format_rao(total_transferred_rao)}")
         
 class AutoBuyerMenu:
     def __init__(self, transfer_manager, wallet_utils, config):
@@ -2628,9 +2511,40 @@ class AutoBuyerMenu:
         self.wallet_utils = wallet_utils
         self.config = config
         from ..core.auto_buyer import AutoBuyerManager
-        self.buyer_manager = AutoBuyerManager(config)
+        self.buyer_manager = AutoBuyerManager(config, transfer_manager.subtensor)
+        self.last_params_path = config.get('auto_buyer.last_params_path', 'data/auto_buyer_last.json')
+        self._last_params = None
         
+    def _load_last_params(self, mode: str) -> Dict:
+        if self._last_params is None:
+            try:
+                with open(self.last_params_path, 'r') as f:
+                    self._last_params = json.load(f)
+            except (OSError, ValueError):
+                self._last_params = {}
+        return self._last_params.get(mode, {})
+
+    def _save_last_params(self, mode: str, params: Dict):
+        self._load_last_params(mode)
+        self._last_params[mode] = params
+        try:
+            os.makedirs(os.path.dirname(self.last_params_path) or '.', exist_ok=True)
+            with open(self.last_params_path, 'w') as f:
+                json.dump(self._last_params, f, indent=2)
+        except OSError as e:
+            console.print(f"[yellow]Could not save last used parameters: {str(e)}[/yellow]")
+
+    def _param_defaults(self, mode: str) -> Dict:
+        return {
+            **NEW_SUBNET_MONITOR_DEFAULTS,
+            **(self.config.get('auto_buyer.defaults') or {}),
+            **self._load_last_params(mode)
+        }
+
     def _get_wallet_password(self, wallet: str) -> str:
+        verified_password = self.buyer_manager.get_verified_password(wallet)
+        if verified_password is not None:
+            return verified_password
         default_password = self.config.get('wallet.default_password')
         if default_password:
             password = Prompt.ask(
@@ -2653,8 +2567,44 @@ class AutoBuyerMenu:
             rpc_endpoint = None
             
         return rpc_endpoint
+
+    async def _verify_password(self, wallet: str, password: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.buyer_manager.verify_wallet_password, wallet, password
+        )
+
+    def _ask_new_subnet_params(self) -> Dict:
+        params = self._param_defaults('new_subnet_monitoring')
+        if self.config.get('auto_buyer.non_interactive', False):
+            return params
+        console.print(Panel.fit(
+            f"Amount per hotkey: {params['amount']} TAO\n"
+            f"Tolerance: {params['tolerance']}\n"
+            f"Check interval: {params['check_interval']}s\n"
+            f"Max attempts per hotkey: {params['max_attempts']}\n"
+            f"Auto-increase tolerance: {'Yes' if params['auto_increase'] else 'No'}\n"
+            f"Buy immediately: {'Yes' if params['buy_immediately'] else 'No'}",
+            title="Monitoring Parameters"
+        ))
+        if Confirm.ask("Use these parameters?", default=True):
+            return params
+
+        params['amount'] = FloatPrompt.ask("Enter amount of TAO to buy per hotkey", default=params['amount'])
+        params['tolerance'] = FloatPrompt.ask("Enter tolerance (acceptable slippage)", default=params['tolerance'])
+        params['check_interval'] = IntPrompt.ask("Check interval (seconds)", default=params['check_interval'])
+        params['max_attempts'] = IntPrompt.ask("Maximum purchase attempts per hotkey", default=params['max_attempts'])
+        params['auto_increase'] = Confirm.ask("Automatically increase tolerance on failures?", default=params['auto_increase'])
+        params['buy_immediately'] = Confirm.ask("Buy tokens immediately when subnet appears (even if registration is open)?", default=params['buy_immediately'])
+        self._save_last_params('new_subnet_monitoring', params)
+        return params
             
     async def show(self):
+        try:
+            await self._show()
+        finally:
+            self.buyer_manager.forget_passwords()
+
+    async def _show(self):
         while True:
             console.print("\n[bold]Auto Token Buyer Menu[/bold]")
             console.print(Panel.fit(
@@ -2685,16 +2635,14 @@ class AutoBuyerMenu:
     
     async def _handle_single_purchase(self, wallets):
         console.print("\nAvailable wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
-
-        selection = Prompt.ask("Select wallet (enter wallet name)").strip()
+        _print_items(wallets)
 
-        if selection not in wallets:
+        selected = self.wallet_utils.parse_wallet_selection_by_names(Prompt.ask("Select wallet (enter wallet name)"), wallets)
+        if len(selected) != 1:
             console.print("[red]Invalid wallet name![/red]")
             return
 
-        wallet_name = selection
+        wallet_name = selected[0]
             
         hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet_name)
         if not hotkeys:
@@ -2702,24 +2650,30 @@ class AutoBuyerMenu:
             return
             
         console.print(f"\nHotkeys for wallet {wallet_name}:")
-        for hotkey in hotkeys:
-            console.print(f"  • {hotkey}")
+        _print_items(hotkeys)
         
-        hotkey_selection = Prompt.ask("Select hotkey (enter hotkey name)").strip()
-        
-        if hotkey_selection not in hotkeys:
+        selected = self.wallet_utils.parse_hotkey_selection_by_names(Prompt.ask("Select hotkey (enter hotkey name)"), hotkeys)
+        if len(selected) != 1:
             console.print("[red]Invalid hotkey name![/red]")
             return
         
-        hotkey_name = hotkey_selection
+        hotkey_name = selected[0]
             
+        params = self._param_defaults('single_purchase')
         subnet_id = IntPrompt.ask("Enter subnet ID to buy tokens for")
-        amount = Prompt.ask("Enter amount of TAO to buy", default="0.05")
-        tolerance = Prompt.ask("Enter tolerance (acceptable slippage)", default="0.45")
+        if self.config.get('auto_buyer.non_interactive', False):
+            amount, tolerance = params['amount'], params['tolerance']
+        else:
+            amount = Prompt.ask("Enter amount of TAO to buy", default=str(params['amount']))
+            tolerance = Prompt.ask("Enter tolerance (acceptable slippage)", default=str(params['tolerance']))
+        self._save_last_params('single_purchase', {
+            'amount': amount,
+            'tolerance': tolerance
+        })
         
         password = self._get_wallet_password(wallet_name)
         
-        if not self.transfer_manager.verify_wallet_password(wallet_name, password):
+        if not await self._verify_password(wallet_name, password):
             console.print("[red]Invalid password![/red]")
             return
             
@@ -2734,16 +2688,14 @@ class AutoBuyerMenu:
         
     async def _handle_subnet_monitoring(self, wallets):
         console.print("\nAvailable wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
 
-        selection = Prompt.ask("Select wallet (enter wallet name)").strip()
-        
-        if selection not in wallets:
+        selected = self.wallet_utils.parse_wallet_selection_by_names(Prompt.ask("Select wallet (enter wallet name)"), wallets)
+        if len(selected) != 1:
             console.print("[red]Invalid wallet name![/red]")
             return
-        
-        wallet_name = selection
+
+        wallet_name = selected[0]
             
         hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet_name)
         if not hotkeys:
@@ -2751,26 +2703,35 @@ class AutoBuyerMenu:
             return
             
         console.print(f"\nHotkeys for wallet {wallet_name}:")
-        for hotkey in hotkeys:
-            console.print(f"  • {hotkey}")
+        _print_items(hotkeys)
             
-        hotkey_selection = Prompt.ask("Select hotkey (enter hotkey name)").strip()
-        
-        if hotkey_selection not in hotkeys:
+        selected = self.wallet_utils.parse_hotkey_selection_by_names(Prompt.ask("Select hotkey (enter hotkey name)"), hotkeys)
+        if len(selected) != 1:
             console.print("[red]Invalid hotkey name![/red]")
             return
         
-        hotkey_name = hotkey_selection
+        hotkey_name = selected[0]
             
+        params = self._param_defaults('subnet_monitoring')
         subnet_id = IntPrompt.ask("Enter subnet ID to monitor")
-        amount = Prompt.ask("Enter amount of TAO to buy", default="0.05")
-        tolerance = Prompt.ask("Enter tolerance (acceptable slippage)", default="0.45")
-        check_interval = IntPrompt.ask("Check interval (seconds)", default=60)
-        max_attempts = IntPrompt.ask("Maximum purchase attempts per check", default=3)
+        if self.config.get('auto_buyer.non_interactive', False):
+            amount, tolerance = params['amount'], params['tolerance']
+            check_interval, max_attempts = params['check_interval'], params['max_attempts']
+        else:
+            amount = Prompt.ask("Enter amount of TAO to buy", default=str(params['amount']))
+            tolerance = Prompt.ask("Enter tolerance (acceptable slippage)", default=str(params['tolerance']))
+            check_interval = IntPrompt.ask("Check interval (seconds)", default=params['check_interval'])
+            max_attempts = IntPrompt.ask("Maximum purchase attempts per check", default=params['max_attempts'])
+        self._save_last_params('subnet_monitoring', {
+            'amount': amount,
+            'tolerance': tolerance,
+            'check_interval': check_interval,
+            'max_attempts': max_attempts
+        })
         
         password = self._get_wallet_password(wallet_name)
         
-        if not self.transfer_manager.verify_wallet_password(wallet_name, password):
+        if not await self._verify_password(wallet_name, password):
             console.print("[red]Invalid password![/red]")
             return
         
@@ -2792,8 +2753,7 @@ class AutoBuyerMenu:
         console.print("\nThis mode will monitor for a new subnet and buy tokens when it appears and registration closes")
         
         console.print("\nAvailable wallets:")
-        for wallet in wallets:
-            console.print(f"  • {wallet}")
+        _print_items(wallets)
         
         wallet_configs = []
         
@@ -2805,35 +2765,57 @@ class AutoBuyerMenu:
             console.print("[red]No valid wallets selected![/red]")
             return
         
-        for wallet_name in selected_wallets:
-            hotkeys = self.wallet_utils.get_wallet_hotkeys(wallet_name)
-            if not hotkeys:
+        loop = asyncio.get_running_loop()
+        hotkey_lists = await asyncio.gather(*[
+            loop.run_in_executor(None, self.wallet_utils.get_wallet_hotkeys, wallet_name)
+            for wallet_name in selected_wallets
+        ])
+        
+        hotkeys_by_wallet = {}
+        for wallet_name, hotkeys in zip(selected_wallets, hotkey_lists):
+            if hotkeys:
+                hotkeys_by_wallet[wallet_name] = hotkeys
+            else:
                 console.print(f"[red]No hotkeys found for wallet {wallet_name}![/red]")
-                continue
-                
+        
+        common_password = None
+        if len(hotkeys_by_wallet) > 1 and Confirm.ask("Use the same password for all wallets?", default=True):
+            common_password = self._get_wallet_password("all wallets")
+
+        collected = []
+        for wallet_name, hotkeys in hotkeys_by_wallet.items():
             console.print(f"\nHotkeys for wallet {wallet_name}:")
-            for hotkey in hotkeys:
-                console.print(f"  • {hotkey}")
+            _print_items(hotkeys)
                 
             console.print("Select hotkeys (comma-separated names or 'all')")
             hotkey_selection = Prompt.ask("Selection").strip()
-            
-            if hotkey_selection.lower() == 'all':
-                selected_hotkeys = hotkeys
-            else:
-                selected_hotkeys = [h.strip() for h in hotkey_selection.split(',') if h.strip() in hotkeys]
+            selected_hotkeys = self.wallet_utils.parse_hotkey_selection_by_names(hotkey_selection, hotkeys)
             
             if not selected_hotkeys:
                 console.print(f"[red]No hotkeys selected for wallet {wallet_name}![/red]")
                 continue
                 
-            password = self._get_wallet_password(wallet_name)
-            
-            if not self.transfer_manager.verify_wallet_password(wallet_name, password):
+            password = common_password or self._get_wallet_password(wallet_name)
+            collected.append((wallet_name, selected_hotkeys, password))
+        
+        verified = await asyncio.gather(*[
+            self._verify_password(wallet_name, password)
+            for wallet_name, _, password in collected
+        ])
+        
+        seen = set()
+        distinct_coldkeys = set()
+        for (wallet_name, selected_hotkeys, password), is_valid in zip(collected, verified):
+            if not is_valid:
                 console.print(f"[red]Invalid password for wallet {wallet_name}![/red]")
                 continue
                 
             for hotkey_name in selected_hotkeys:
+                key = (wallet_name, hotkey_name)
+                if key in seen:
+                    continue
+                seen.add(key)
+                distinct_coldkeys.add(wallet_name)
                 wallet_configs.append({
                     'coldkey': wallet_name,
                     'hotkey': hotkey_name,
@@ -2849,15 +2831,16 @@ class AutoBuyerMenu:
         rpc_endpoint = self._get_rpc_endpoint()
         
         target_subnet_id = IntPrompt.ask("Enter target subnet ID to monitor")
-        amount = Prompt.ask("Enter amount of TAO to buy per hotkey", default="0.05")
-        tolerance = Prompt.ask("Enter tolerance (acceptable slippage)", default="0.45")
-        check_interval = IntPrompt.ask("Check interval (seconds)", default=60)
-        max_attempts = IntPrompt.ask("Maximum purchase attempts per hotkey", default=3)
-        auto_increase = Confirm.ask("Automatically increase tolerance on failures?", default=True)
-        buy_immediately = Confirm.ask("Buy tokens immediately when subnet appears (even if registration is open)?", default=False)
+        params = self._ask_new_subnet_params()
+        amount = params['amount']
+        tolerance = params['tolerance']
+        check_interval = params['check_interval']
+        max_attempts = params['max_attempts']
+        auto_increase = params['auto_increase']
+        buy_immediately = params['buy_immediately']
         
         console.print(f"\n[cyan]Starting monitoring for new subnet {target_subnet_id}...[/cyan]")
-        console.print(f"[cyan]Total wallets: {len(set(cfg['coldkey'] for cfg in wallet_configs))}, Total hotkeys: {len(wallet_configs)}[/cyan]")
+        console.print(f"[cyan]Total wallets: {len(distinct_coldkeys)}, Total hotkeys: {len(wallet_configs)}[/cyan]")
         if rpc_endpoint:
             console.print(f"[cyan]Using custom RPC endpoint: {rpc_endpoint}[/cyan]")
         console.print(f"[yellow]Press Ctrl+C to stop monitoring at any time[/yellow]")
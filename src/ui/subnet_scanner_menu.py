@@ -1,27 +1,61 @@
-from rich.console import Console
+from ..utils.console import console
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.panel import Panel
 from rich.status import Status
 import asyncio
+import threading
+import numpy as np
 from ..core.subnet_scanner import SubnetScanner
+from ..core.stats_manager import DataCache
 
-console = Console()
+_MENU_PANEL = Panel.fit(
+    "1. Scan All Subnets\n"
+    "2. Scan Specific Subnet\n"
+    "3. Show Subnets with Disabled Weights\n"
+    "4. Show Subnets with High Difficulty\n"
+    "5. Back to Main Menu"
+)
+
+def _filter_interesting(subnets, min_keys=10):
+    return [s for s in subnets if s.get('registration_allowed', False) and s.get('active_keys', 0) >= min_keys]
+
+def _activity_key(subnet):
+    return (subnet.get('active_keys', 0), subnet.get('active_miners', 0))
+
+def _difficulty_key(subnet):
+    return (subnet.get('normalized_difficulty', 0), subnet.get('difficulty', 0))
 
 class SubnetScannerMenu:
     def __init__(self, subnet_scanner, config):
         self.subnet_scanner = subnet_scanner
         self.config = config
+        self.analysis_cache = DataCache(ttl_seconds=self.config.get('cache.scan_ttl_seconds', 30))
+
+    async def _analyze_subnets(self, use_api: bool, refresh: bool = False):
+        results = None if refresh else self.analysis_cache.get(use_api)
+        if results is None:
+            results = await self.subnet_scanner.analyze_subnets(use_api=use_api, refresh=refresh)
+            if results:
+                self.analysis_cache.set(use_api, results)
+        return results
+
+    async def _check_registration_activity(self, subnets):
+        subnets_to_check = self.subnet_scanner.select_registration_check_subnets(subnets)
+        if not subnets_to_check:
+            return {}
+        cancel_event = threading.Event()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.subnet_scanner.check_registration_activity, subnets_to_check, cancel_event
+            )
+        except BaseException:
+            cancel_event.set()
+            raise
 
     async def show(self):
         while True:
             console.print("\n[bold]Subnet Scanner Menu[/bold]")
-            console.print(Panel.fit(
-                "1. Scan All Subnets\n"
-                "2. Scan Specific Subnet\n"
-                "3. Show Subnets with Disabled Weights\n"
-                "4. Show Subnets with High Difficulty\n"
-                "5. Back to Main Menu"
-            ))
+            console.print(_MENU_PANEL)
 
             choice = IntPrompt.ask("Select option", default=5)
 
@@ -31,7 +65,7 @@ class SubnetScannerMenu:
             if choice == 1:
                 console.print("[cyan]Scanning all subnets...[/cyan]")
                 try:
-                    results = await self.subnet_scanner.analyze_subnets(use_api=True)
+                    results = await self._analyze_subnets(use_api=True, refresh=True)
                     if results:
                         self.subnet_scanner.display_results(results)
                     else:
@@ -65,8 +99,7 @@ class SubnetScannerMenu:
             
             with Status(f"[bold cyan]Scanning subnet {subnet_id}...", spinner="dots") as status:
                 if use_api:
-                    all_subnet_info = self.subnet_scanner.get_all_subnet_info_api()
-                    subnet_info = all_subnet_info.get(subnet_id)
+                    subnet_info = self.subnet_scanner.get_subnet_info_api(subnet_id)
                     if not subnet_info:
                         console.print(f"[yellow]Subnet {subnet_id} not found in API data, trying direct query...[/yellow]")
                         subnet_info = self.subnet_scanner.get_subnet_info_direct(subnet_id, verbose=True)
@@ -74,8 +107,7 @@ class SubnetScannerMenu:
                     subnet_info = self.subnet_scanner.get_subnet_info_direct(subnet_id, verbose=True)
                 
                 if subnet_info:
-                    if not self.subnet_scanner.tao_price:
-                        self.subnet_scanner.get_tao_price()
+                    self.subnet_scanner.get_tao_price()
                     
                     self.subnet_scanner.display_subnet_summary(subnet_info)
                 else:
@@ -99,13 +131,13 @@ class SubnetScannerMenu:
         console.print("[cyan]Fetching subnet data...[/cyan]")
         
         try:
-            results = await self.subnet_scanner.analyze_subnets(use_api=use_api)
+            results = await self._analyze_subnets(use_api=use_api)
             if results and 'weights_disabled' in results and results['weights_disabled']:
                 console.print(f"\n[bold]Found {len(results['weights_disabled'])} subnets with disabled weights mechanism[/bold]")
                 
                 sorted_results = sorted(
                     results['weights_disabled'], 
-                    key=lambda x: (x.get('active_keys', 0), x.get('active_miners', 0)), 
+                    key=_activity_key, 
                     reverse=True
                 )
                 
@@ -116,8 +148,10 @@ class SubnetScannerMenu:
                 
                 self.subnet_scanner.display_results(subset_results)
                 
-                active_subnets = sum(1 for subnet in sorted_results if subnet.get('active_miners', 0) > 0)
-                subnets_with_high_emission = sum(1 for subnet in sorted_results if subnet.get('emission', 0) > 1000000)
+                active_miners = np.fromiter((subnet.get('active_miners', 0) for subnet in sorted_results), dtype=np.float64, count=len(sorted_results))
+                emissions = np.fromiter((subnet.get('emission', 0) for subnet in sorted_results), dtype=np.float64, count=len(sorted_results))
+                active_subnets = int(np.count_nonzero(active_miners > 0))
+                subnets_with_high_emission = int(np.count_nonzero(emissions > 1000000))
                 console.print(f"\n[bold]Analysis of Subnets with Disabled Weights:[/bold]")
                 console.print(f"- Active subnets (with miners): {active_subnets}")
                 console.print(f"- Subnets with high emission (>1M): {subnets_with_high_emission}")
@@ -130,7 +164,7 @@ class SubnetScannerMenu:
                 if Confirm.ask("\nCheck registration activity for popular disabled-weights subnets?", default=True):
                     console.print("[bold cyan]Starting registration activity check...[/bold cyan]")
                     
-                    interesting_subnets = [s for s in sorted_results if s.get('registration_allowed', False) and s.get('active_keys', 0) >= 10]
+                    interesting_subnets = _filter_interesting(sorted_results)
                     subnets_to_check = interesting_subnets[:5]
                     
                     if not subnets_to_check:
@@ -142,7 +176,7 @@ class SubnetScannerMenu:
                         console.print(f"[yellow]Press Ctrl+C to abort if it takes too long...[/yellow]")
                         
                         try:
-                            activity_results = self.subnet_scanner.check_registration_activity(sorted_results)
+                            activity_results = await self._check_registration_activity(sorted_results)
                             
                             if activity_results:
                                 self.subnet_scanner.display_registration_activity(activity_results)
@@ -152,18 +186,18 @@ class SubnetScannerMenu:
                                 console.print("[bold green]" + "=" * 80 + "[/bold green]")
                                 
                                 if Confirm.ask("\nWould you like to see all remaining subnets in the network?", default=True):
-                                    console.print("[cyan]Fetching information about all subnets...[/cyan]")
-                                    
-                                    all_subnets_results = await self.subnet_scanner.analyze_subnets(use_api=use_api)
+                                    all_subnets_results = results
                                     
                                     if all_subnets_results and 'all_subnets' in all_subnets_results:
-                                        disabled_weights_netuid = [s['netuid'] for s in sorted_results]
+                                        disabled_weights_netuid = {s['netuid'] for s in sorted_results}
                                         
 
-                                        remaining_subnets = [
-                                            subnet for subnet in all_subnets_results['all_subnets'] 
-                                            if subnet['netuid'] not in disabled_weights_netuid
-                                        ]
+                                        remaining_subnets = sorted(
+                                            (subnet for subnet in all_subnets_results['all_subnets'] 
+                                             if subnet['netuid'] not in disabled_weights_netuid),
+                                            key=_activity_key,
+                                            reverse=True
+                                        )
                                         
                                         if remaining_subnets:
                                             console.print(f"\n[bold]Found {len(remaining_subnets)} other subnets in the network[/bold]")
@@ -189,20 +223,12 @@ class SubnetScannerMenu:
                                                 selected_to_check = []
                                                 
                                                 if method == 1:
-                                                    interesting_remaining = [
-                                                        s for s in remaining_subnets 
-                                                        if s.get('registration_allowed', False) and s.get('active_keys', 0) >= 10
-                                                    ]
+                                                    interesting_remaining = _filter_interesting(remaining_subnets)
                                                     
                                                     if not interesting_remaining:
                                                         console.print("[yellow]No suitable subnets found for registration activity check.[/yellow]")
                                                         return
                                                     
-                                                    interesting_remaining.sort(
-                                                        key=lambda x: (x.get('active_keys', 0), x.get('active_miners', 0)), 
-                                                        reverse=True
-                                                    )
-                                                    
                                                     max_subnets = min(20, len(interesting_remaining))
                                                     num_to_check = IntPrompt.ask(
                                                         f"How many subnets to check (max {max_subnets})?", 
@@ -226,19 +252,16 @@ class SubnetScannerMenu:
                                                     subnet_ids_input = Prompt.ask("Enter subnet IDs to check (comma-separated, e.g. 1,5,43)")
                                                     try:
                                                         subnet_ids_to_check = [int(x.strip()) for x in subnet_ids_input.split(',') if x.strip()]
-                                                        
-                                                        for subnet_id in subnet_ids_to_check:
-                                                            for subnet in remaining_subnets:
-                                                                if subnet['netuid'] == subnet_id:
-                                                                    selected_to_check.append(subnet)
-                                                                    break
-                                                        
-                                                        if not selected_to_check:
-                                                            console.print("[yellow]No valid subnet IDs provided.[/yellow]")
-                                                            return
-                                                    except:
+                                                    except ValueError:
                                                         console.print("[red]Invalid subnet IDs format.[/red]")
                                                         return
+                                                    
+                                                    by_id = {subnet['netuid']: subnet for subnet in remaining_subnets}
+                                                    selected_to_check = [by_id[subnet_id] for subnet_id in subnet_ids_to_check if subnet_id in by_id]
+                                                    
+                                                    if not selected_to_check:
+                                                        console.print("[yellow]No valid subnet IDs provided.[/yellow]")
+                                                        return
                                                 
                                                 elif method == 3:
                                                     if not Confirm.ask(f"This will check ALL {len(remaining_subnets)} remaining subnets and may take a long time. Proceed?", default=False):
@@ -256,7 +279,7 @@ class SubnetScannerMenu:
                                                     console.print(f"[yellow]Press Ctrl+C to abort if it takes too long...[/yellow]")
                                                     
                                                     try:
-                                                        remaining_activity_results = self.subnet_scanner.check_registration_activity(selected_to_check)
+                                                        remaining_activity_results = await self._check_registration_activity(selected_to_check)
                                                         
                                                         if remaining_activity_results:
                                                             self.subnet_scanner.display_registration_activity(remaining_activity_results)
@@ -317,25 +340,35 @@ class SubnetScannerMenu:
         
         with Status("[bold cyan]Scanning subnets...", spinner="dots") as status:
             try:
-                results = await self.subnet_scanner.analyze_subnets(use_api=use_api)
+                results = await self._analyze_subnets(use_api=use_api)
+                
+                def is_normalized_high(subnet):
+                    normalized = subnet.get('normalized_difficulty')
+                    return normalized is not None and normalized >= difficulty_threshold
+
+                def is_high_difficulty(subnet):
+                    if is_normalized_high(subnet):
+                        return True
+                    difficulty = subnet.get('difficulty')
+                    if difficulty is None:
+                        return False
+                    return difficulty == 1.0 or (difficulty > 0.1 and subnet.get('max_difficulty', 0) > 0)
+
+                predicate = is_normalized_high if difficulty_mode != 2 else is_high_difficulty
                 
                 high_difficulty_subnets = []
+                max_difficulty = 0
+                open_reg = 0
                 for subnet in results['all_subnets']:
-                    is_high_difficulty = False
-                    if 'normalized_difficulty' in subnet and subnet['normalized_difficulty'] >= difficulty_threshold:
-                        is_high_difficulty = True
-                    elif difficulty_mode == 2 and 'difficulty' in subnet:
-                        if subnet['difficulty'] == 1.0:
-                            is_high_difficulty = True
-                        elif subnet['difficulty'] > 0.1 and 'max_difficulty' in subnet and subnet['max_difficulty'] > 0:
-                            is_high_difficulty = True
-                    
-                    if is_high_difficulty:
+                    if predicate(subnet):
                         high_difficulty_subnets.append(subnet)
+                        max_difficulty = max(max_difficulty, subnet.get('normalized_difficulty', 0))
+                        if subnet.get('registration_allowed', False):
+                            open_reg += 1
                 
                 sorted_results = sorted(
                     high_difficulty_subnets, 
-                    key=lambda x: (x.get('normalized_difficulty', 0), x.get('difficulty', 0)), 
+                    key=_difficulty_key, 
                     reverse=True
                 )
                 
@@ -349,8 +382,6 @@ class SubnetScannerMenu:
                     
                     self.subnet_scanner.display_results(subset_results)
                     
-                    max_difficulty = max((subnet.get('normalized_difficulty', 0) for subnet in sorted_results), default=0)
-                    open_reg = sum(1 for subnet in sorted_results if subnet.get('registration_allowed', False))
                     closed_reg = len(sorted_results) - open_reg
                     
                     console.print(f"\n[bold]Analysis of High Difficulty Subnets:[/bold]")
@@ -1,44 +1,83 @@
+import copy
 import yaml
 import os
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+_MISSING = object()
+
+def _flatten(data: Dict[str, Any], prefix: str = ''):
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, path + '.')
+        elif value is not None:
+            yield path, value
+
 class Config:
     def __init__(self, config_path: str = "config/config.yaml"):
         self.config_path = config_path
-        self.config_data = self._load_config()
+        self.config_data = self._load_config() or {}
+        self._cache: Dict[str, Any] = dict(_flatten(self.config_data))
         
     def _load_config(self) -> Dict[str, Any]:
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
             
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_Loader)
             
     def get(self, key: str, default: Any = None) -> Any:
-        keys = key.split('.')
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._lookup(key)
+            self._cache[key] = value
+        return default if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
         data = self.config_data
         
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(data, dict):
                 data = data.get(k)
             else:
-                return default
+                return _MISSING
                 
             if data is None:
-                return default
+                return _MISSING
                 
         return data
         
     def set(self, key: str, value: Any):
+        if self._lookup(key) == value:
+            return
+
+        data = copy.deepcopy(self.config_data)
+        self._assign(data, key, value)
+        text = yaml.dump(data, Dumper=_Dumper)
+
+        tmp_path = self.config_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.config_data = data
+        self._cache = dict(_flatten(data))
+
+    @staticmethod
+    def _assign(data: Dict[str, Any], key: str, value: Any):
         keys = key.split('.')
-        data = self.config_data
-        
         for k in keys[:-1]:
             if k not in data:
                 data[k] = {}
             data = data[k]
-            
         data[keys[-1]] = value
-        
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config_data, f)
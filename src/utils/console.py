@@ -0,0 +1,7 @@
+from typing import List
+from rich.console import Console
+
+console = Console()
+
+def print_indexed(items: List[str]):
+    console.print("\n".join(f"{i}. {item}" for i, item in enumerate(items, 1)))
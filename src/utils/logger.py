@@ -1,32 +1,53 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_MAIN_LOG_FILE = 'logs/bittensor_manager.log'
+_CONSOLE_ONLY_LOGGERS = {'registration_manager'}
+_log_queue = queue.SimpleQueue()
+_queue_handler = None
+_queue_handler_lock = threading.Lock()
+
+def _get_queue_handler() -> QueueHandler:
+    global _queue_handler
+    with _queue_handler_lock:
+        if _queue_handler is None:
+            os.makedirs(os.path.dirname(_MAIN_LOG_FILE), exist_ok=True)
+            main_handler = RotatingFileHandler(
+                _MAIN_LOG_FILE,
+                maxBytes=10*1024*1024,
+                backupCount=5,
+                delay=True
+            )
+            main_handler.setFormatter(_FORMATTER)
+            main_handler.addFilter(lambda record: record.name not in _CONSOLE_ONLY_LOGGERS)
+
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_FORMATTER)
+            console_handler.setLevel(logging.WARNING)
+
+            listener = QueueListener(_log_queue, main_handler, console_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+
+            _queue_handler = QueueHandler(_log_queue)
+        return _queue_handler
 
 def setup_logger(name: str, log_file: str, level=logging.INFO):
 
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    if logger.handlers:
+        return logger
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
-    if name != 'registration_manager':
-        main_handler = RotatingFileHandler(
-            'logs/bittensor_manager.log',
-            maxBytes=10*1024*1024,
-            backupCount=5
-        )
-        main_handler.setFormatter(formatter)
-        logger = logging.getLogger(name)
-        logger.setLevel(level)
-        logger.addHandler(main_handler)
-    else:
-        logger = logging.getLogger(name)
-        logger.setLevel(level)
-        
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(logging.WARNING)
-    logger.addHandler(console_handler)
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    logger.addHandler(_get_queue_handler())
 
     return logger